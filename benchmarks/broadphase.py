@@ -0,0 +1,208 @@
+"""
+Compare broadphase backends on synthetic and recorded distributions.
+
+    uv run python -m benchmarks.broadphase --asteroids 2000 --shots 300
+
+Recorded distributions are JSON files of the form
+``{"asteroids": [[x, y, r], ...], "shots": [[x, y, r], ...]}``; write one
+from live sprite groups with ``save_distribution``.
+"""
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Iterable
+
+from core import constants as const
+from entities.asteroid import Asteroid
+from entities.circleshape import CircleShape
+from entities.shot import Shot
+from systems.broadphase import create_broadphase
+from systems.collision import first_hits, gather_circles
+from systems.entity_store import HAS_NUMPY
+
+BACKENDS = ('grid', 'sweep', 'brute')
+
+Circle = tuple[float, float, float]
+
+
+def random_radius(rng: random.Random) -> float:
+    return const.ASTEROID_MIN_RADIUS * rng.randint(1, const.ASTEROID_KINDS)
+
+
+def uniform_distribution(
+    count: int, shots: int, rng: random.Random
+) -> dict[str, list[Circle]]:
+    """Rocks and shots spread evenly over the screen."""
+    return {
+        'asteroids': [
+            (
+                rng.uniform(0, const.SCREEN_WIDTH),
+                rng.uniform(0, const.SCREEN_HEIGHT),
+                random_radius(rng),
+            )
+            for _ in range(count)
+        ],
+        'shots': [
+            (
+                rng.uniform(0, const.SCREEN_WIDTH),
+                rng.uniform(0, const.SCREEN_HEIGHT),
+                const.SHOT_RADIUS,
+            )
+            for _ in range(shots)
+        ],
+    }
+
+
+def clustered_distribution(
+    count: int,
+    shots: int,
+    rng: random.Random,
+    clusters: int = 4,
+    spread: float = 60.0,
+) -> dict[str, list[Circle]]:
+    """A few dense clusters, with shots aimed at them."""
+    centers = [
+        (
+            rng.uniform(0, const.SCREEN_WIDTH),
+            rng.uniform(0, const.SCREEN_HEIGHT),
+        )
+        for _ in range(clusters)
+    ]
+
+    def around(radius: float) -> Circle:
+        cx, cy = rng.choice(centers)
+        return (
+            rng.gauss(cx, spread) % const.SCREEN_WIDTH,
+            rng.gauss(cy, spread) % const.SCREEN_HEIGHT,
+            radius,
+        )
+
+    return {
+        'asteroids': [around(random_radius(rng)) for _ in range(count)],
+        'shots': [around(const.SHOT_RADIUS) for _ in range(shots)],
+    }
+
+
+def load_distribution(path: str) -> dict[str, list[Circle]]:
+    with open(path) as file:
+        data = json.load(file)
+    return {
+        'asteroids': [tuple(item) for item in data['asteroids']],
+        'shots': [tuple(item) for item in data.get('shots', [])],
+    }
+
+
+def save_distribution(
+    asteroids: Iterable[CircleShape],
+    shots: Iterable[CircleShape],
+    path: str,
+) -> None:
+    """Record live sprite groups for later runs of this benchmark."""
+
+    def circles(objects: Iterable[CircleShape]) -> list[Circle]:
+        return [(o.position.x, o.position.y, o.radius) for o in objects]
+
+    with open(path, 'w') as file:
+        json.dump(
+            {'asteroids': circles(asteroids), 'shots': circles(shots)}, file
+        )
+
+
+def run_backend(
+    name: str,
+    asteroids: list[Asteroid],
+    shots: list[Shot],
+    repeats: int,
+) -> dict[str, float]:
+    broadphase = create_broadphase(name)
+    broadphase.retune((a.radius for a in asteroids), tolerance=0)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        broadphase.rebuild(asteroids)
+    rebuild_ms = (time.perf_counter() - start) / repeats * 1000
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        broadphase.queries = broadphase.candidates = 0
+        hits = 0
+        for shot in shots:
+            for asteroid in broadphase.get_nearby(shot.position, shot.radius):
+                if shot.collides_with(asteroid):
+                    hits += 1
+                    break
+    query_ms = (time.perf_counter() - start) / repeats * 1000
+    result = {
+        'rebuild_ms': rebuild_ms,
+        'query_ms': query_ms,
+        'candidates': broadphase.candidates,
+        'hits': hits,
+    }
+
+    if HAS_NUMPY and shots and asteroids:
+        shot_positions, shot_radii = gather_circles(shots)
+        positions, radii = gather_circles(asteroids)
+        first_hits(shot_positions, shot_radii, positions, radii, broadphase)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            first_hits(
+                shot_positions, shot_radii, positions, radii, broadphase
+            )
+        result['batch_ms'] = (time.perf_counter() - start) / repeats * 1000
+
+    return result
+
+
+def run(distributions: dict[str, dict[str, list[Circle]]], repeats: int):
+    header = (
+        f'{"distribution":<14}{"backend":<8}{"rocks":>7}{"shots":>7}'
+        f'{"rebuild ms":>12}{"query ms":>10}{"batch ms":>10}'
+        f'{"candidates":>12}{"hits":>6}'
+    )
+    print(header)
+    print('-' * len(header))
+
+    for label, distribution in distributions.items():
+        asteroids = [Asteroid(*c) for c in distribution['asteroids']]
+        shots = [Shot(*c) for c in distribution['shots']]
+        for backend in BACKENDS:
+            result = run_backend(backend, asteroids, shots, repeats)
+            batch = result.get('batch_ms')
+            batch_text = f'{batch:>10.3f}' if batch is not None else ' ' * 10
+            print(
+                f'{label:<14}{backend:<8}{len(asteroids):>7}{len(shots):>7}'
+                f'{result["rebuild_ms"]:>12.3f}{result["query_ms"]:>10.3f}'
+                f'{batch_text}{result["candidates"]:>12}{result["hits"]:>6}'
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--asteroids', type=int, default=1000)
+    parser.add_argument('--shots', type=int, default=300)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument(
+        '--recorded',
+        action='append',
+        default=[],
+        metavar='PATH',
+        help='JSON distribution to include (repeatable)',
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    distributions = {
+        'uniform': uniform_distribution(args.asteroids, args.shots, rng),
+        'clustered': clustered_distribution(args.asteroids, args.shots, rng),
+    }
+    for path in args.recorded:
+        distributions[path] = load_distribution(path)
+
+    run(distributions, args.repeats)
+
+
+if __name__ == '__main__':
+    main()
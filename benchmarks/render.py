@@ -0,0 +1,116 @@
+"""
+Compare frame time of vector-drawn and cached asteroid outlines.
+
+    uv run python -m benchmarks.render --asteroids 500 --asteroids 2000
+
+Each scenario renders full frames with ``main.render`` of a world with a
+fixed number of asteroids of mixed sizes, in three modes:
+
+    vector  outline cache disabled, every asteroid drawn as a polygon
+    cold    cache emptied before each frame (the per-frame build budget,
+            then vector drawing for the rest)
+    cached  warm cache, every asteroid is one blit
+
+Frames are drawn to a display surface (the dummy video driver unless
+another is set), so cached outlines are converted to the display format as
+in the game. Frame times are the fastest of ``--repeats``.
+"""
+
+import argparse
+import os
+import time
+
+import pygame
+
+from benchmarks.snapshot import populate
+from core import constants as const
+from entities.shapes import get_outline_cache, reset_outline_cache
+from main import render
+from utils.logger import disable_logging
+
+SCENARIOS = (500, 1_000, 2_000)
+MODES = ('vector', 'cold', 'cached')
+
+
+def frame_ms(draw, setup, repeats: int) -> float:
+    times = []
+    for _ in range(repeats + 1):
+        setup()
+        start = time.perf_counter()
+        draw()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times[1:])
+
+
+def run(
+    asteroids: int,
+    repeats: int,
+    seed: int,
+    screen: pygame.Surface,
+    font: pygame.font.Font,
+) -> dict[str, float]:
+    world = populate(asteroids, 0, 0, seed)
+
+    def draw() -> None:
+        render(
+            screen,
+            None,
+            world.drawable,
+            world.particles,
+            world.powerups,
+            world.player,
+            font,
+            world.game_state,
+        )
+
+    results = {}
+    for mode in MODES:
+        cache = reset_outline_cache(
+            capacity=0 if mode == 'vector' else const.ASTEROID_SURFACE_CACHE
+        )
+        if mode == 'cached':
+            # Aquece sem limite de construções por frame
+            cache.builds_per_frame = cache.capacity
+            draw()
+            cache.builds_per_frame = const.ASTEROID_SURFACE_BUILDS_PER_FRAME
+        setup = cache.clear if mode == 'cold' else lambda: None
+        results[mode] = frame_ms(draw, setup, repeats)
+    results['cached_outlines'] = len(get_outline_cache())
+    reset_outline_cache()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--asteroids',
+        type=int,
+        action='append',
+        help=f'asteroids per scenario (repeatable, default {SCENARIOS})',
+    )
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    disable_logging()
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 36)
+
+    print(
+        f'{"asteroids":<11}{"vector ms":>11}{"cold ms":>10}{"cached ms":>11}'
+        f'{"speedup":>9}{"outlines":>10}'
+    )
+    for asteroids in args.asteroids or SCENARIOS:
+        row = run(asteroids, args.repeats, args.seed, screen, font)
+        print(
+            f'{asteroids:<11}{row["vector"]:>11.3f}{row["cold"]:>10.3f}'
+            f'{row["cached"]:>11.3f}{row["vector"] / row["cached"]:>8.2f}x'
+            f'{row["cached_outlines"]:>10}'
+        )
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Measure world snapshot size and cost at a given entity count.
+
+    uv run python -m benchmarks.snapshot --asteroids 200 --shots 100
+"""
+
+import argparse
+import random
+import time
+
+import pygame
+
+from core import constants as const
+from core.rewind import RewindBuffer
+from core.snapshot import HEADER, restore_world, snapshot_world
+from core.world import World, create_world
+from entities.asteroid import Asteroid
+from entities.powerups import PowerUp
+from entities.shot import Shot
+from utils.logger import disable_logging
+
+
+def populate(asteroids: int, shots: int, powerups: int, seed: int) -> World:
+    """World filled with moving entities spread over the screen."""
+    world = create_world(seed=seed)
+    rng = random.Random(seed)
+
+    def place(entity):
+        entity.velocity = pygame.Vector2(
+            rng.uniform(-100, 100), rng.uniform(-100, 100)
+        )
+
+    for _ in range(asteroids):
+        place(
+            Asteroid(
+                rng.uniform(0, const.SCREEN_WIDTH),
+                rng.uniform(0, const.SCREEN_HEIGHT),
+                const.ASTEROID_MIN_RADIUS
+                * rng.randint(1, const.ASTEROID_KINDS),
+            )
+        )
+    for _ in range(shots):
+        place(
+            Shot(
+                rng.uniform(0, const.SCREEN_WIDTH),
+                rng.uniform(0, const.SCREEN_HEIGHT),
+                const.SHOT_RADIUS,
+            )
+        )
+    for _ in range(powerups):
+        place(
+            PowerUp(
+                rng.uniform(0, const.SCREEN_WIDTH),
+                rng.uniform(0, const.SCREEN_HEIGHT),
+                rng.choice(['shield', 'speed']),
+            )
+        )
+    return world
+
+
+def timed(function, repeats: int) -> float:
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def run(
+    asteroids: int,
+    shots: int,
+    powerups: int,
+    repeats: int,
+    seed: int,
+    rewind_seconds: float = 5.0,
+) -> dict[str, float]:
+    entities = asteroids + shots + powerups
+    empty = len(snapshot_world(create_world(seed=seed)))
+    world = populate(asteroids, shots, powerups, seed)
+    data = snapshot_world(world)
+
+    light = snapshot_world(world, rng_state=False)
+
+    buffer = RewindBuffer(rewind_seconds)
+    result = {
+        'entities': entities,
+        'bytes': len(data),
+        'light_bytes': len(light),
+        'fixed_bytes': empty,
+        'header_bytes': HEADER.size,
+        'bytes_per_entity': (len(data) - empty) / max(entities, 1),
+        'snapshot_us': timed(lambda: snapshot_world(world), repeats),
+        'light_us': timed(
+            lambda: snapshot_world(world, rng_state=False), repeats
+        ),
+        'push_us': timed(lambda: buffer.push(world), repeats),
+        'restore_us': timed(lambda: restore_world(world, data), repeats),
+        'rewind_frames': buffer.capacity,
+    }
+    while len(buffer) < buffer.capacity:
+        buffer.push(world)
+    result['rewind_bytes'] = buffer.bytes_used
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--asteroids', type=int, default=200)
+    parser.add_argument('--shots', type=int, default=100)
+    parser.add_argument('--powerups', type=int, default=5)
+    parser.add_argument('--repeats', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--rewind-seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    disable_logging()
+    result = run(
+        args.asteroids,
+        args.shots,
+        args.powerups,
+        args.repeats,
+        args.seed,
+        args.rewind_seconds,
+    )
+    print(
+        f'{result["entities"]} entities: {result["bytes"]} bytes '
+        f'({result["fixed_bytes"]} fixed incl. RNG state, '
+        f'{result["bytes_per_entity"]:.1f} per entity), '
+        f'{result["light_bytes"]} without RNG state'
+    )
+    print(f'snapshot  {result["snapshot_us"]:>9.1f} us')
+    print(f'no RNG    {result["light_us"]:>9.1f} us')
+    print(f'push      {result["push_us"]:>9.1f} us')
+    print(f'restore   {result["restore_us"]:>9.1f} us')
+    print(
+        f'rewind buffer: {result["rewind_frames"]} frames, '
+        f'{result["rewind_bytes"] / 1e6:.1f} MB when full'
+    )
+
+
+if __name__ == '__main__':
+    main()
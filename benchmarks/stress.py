@@ -0,0 +1,291 @@
+"""
+Time and measure allocations of the game's hot paths in synthetic worlds.
+
+    uv run python -m benchmarks.stress --save baseline.json
+    uv run python -m benchmarks.stress --compare baseline.json
+
+Each scenario is a world with a fixed number of asteroids of mixed sizes,
+``--shots`` shots and a full particle pool, built from a fixed seed with
+the game's own classes. Every phase is timed ``--repeats`` times after one
+warm-up call, keeping the fastest as ``timeit`` does, and then run once
+more under ``tracemalloc`` for its peak and retained allocations. Phases
+that change the world get their starting state back, untimed, before every
+call.
+
+``--save`` writes the results as JSON; ``--compare`` checks them against
+such a file and exits with status 1 when a phase got slower than
+``--threshold`` or allocates more than ``--alloc-threshold`` (relative),
+ignoring differences below the ``--min-ms`` and ``--min-kb`` noise floors.
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import pygame
+
+from benchmarks.snapshot import populate
+from core import constants as const
+from core.snapshot import restore_world, snapshot_world
+from core.world import World
+from entities.shapes import get_outline_cache
+from main import handle_collisions_optimized, render
+from systems.entity_store import HAS_NUMPY
+from systems.spatial_grid import SpatialGrid
+from utils.logger import disable_logging
+from utils.particles import get_particle_pool, spawn_explosion
+
+FORMAT_VERSION = 1
+SCENARIOS = (100, 1_000, 10_000)
+DT = 1 / const.TICK_RATE
+
+Phase = tuple[Callable[[], None] | None, Callable[[], None]]
+
+
+def clear_particles(world: World) -> None:
+    """Kill every particle and hand the pooled ones back."""
+    for particle in world.particles.sprites():
+        particle.kill()
+    get_particle_pool().clear()
+
+
+def fill_particles(world: World) -> None:
+    """Spawn explosions until every pooled particle is alive."""
+    clear_particles(world)
+    spawn_explosion(
+        const.SCREEN_WIDTH / 2,
+        const.SCREEN_HEIGHT / 2,
+        count=get_particle_pool().available,
+        groups=[world.particles],
+    )
+
+
+def build_phases(
+    world: World, screen: pygame.Surface, font: pygame.font.Font
+) -> dict[str, Phase]:
+    """(setup, run) per phase; only ``run`` is measured."""
+    grid = SpatialGrid()
+    grid.retune((a.radius for a in world.asteroids), tolerance=0)
+    start = snapshot_world(world)
+
+    def asteroid_update() -> None:
+        for asteroid in world.asteroids:
+            asteroid.update(DT)
+
+    def asteroid_draw() -> None:
+        get_outline_cache().begin_frame()
+        for asteroid in world.asteroids:
+            asteroid.draw(screen)
+
+    def grid_rebuild() -> None:
+        grid.rebuild(world.asteroids)
+
+    def grid_query() -> None:
+        for shot in world.shots:
+            grid.get_nearby(shot.position, shot.radius)
+
+    def explosion() -> None:
+        spawn_explosion(100, 100, count=20, groups=[world.particles])
+
+    def draw_frame() -> None:
+        render(
+            screen,
+            None,
+            world.drawable,
+            world.particles,
+            world.powerups,
+            world.player,
+            font,
+            world.game_state,
+        )
+
+    def restore() -> None:
+        restore_world(world, start)
+        fill_particles(world)
+
+    def collisions() -> None:
+        handle_collisions_optimized(
+            world.player,
+            world.asteroids,
+            world.shots,
+            world.particles,
+            world.powerups,
+            world.game_state,
+            world.broadphase,
+        )
+
+    # Os que alteram o mundo por último, restaurando antes de cada chamada
+    return {
+        'asteroid_update': (None, asteroid_update),
+        'asteroid_draw': (None, asteroid_draw),
+        'grid_rebuild': (None, grid_rebuild),
+        'grid_query': (lambda: grid.rebuild(world.asteroids), grid_query),
+        'render': (lambda: fill_particles(world), draw_frame),
+        'spawn_explosion': (lambda: clear_particles(world), explosion),
+        'collisions': (restore, collisions),
+    }
+
+
+def measure(setup: Callable | None, run: Callable, repeats: int) -> dict:
+    times = []
+    for _ in range(repeats + 1):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - start) * 1000)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    run()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'ms': min(times[1:]),
+        'peak_kb': (peak - before) / 1024,
+        'retained_kb': (current - before) / 1024,
+    }
+
+
+def run_scenario(
+    asteroids: int,
+    shots: int,
+    repeats: int,
+    seed: int,
+    only: list[str] | None = None,
+) -> dict[str, dict[str, float]]:
+    world = populate(asteroids, shots, 0, seed)
+    fill_particles(world)
+    screen = pygame.Surface((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 36)
+
+    results = {}
+    for name, (setup, run) in build_phases(world, screen, font).items():
+        if only and name not in only:
+            continue
+        results[name] = measure(setup, run, repeats)
+    return results
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float,
+    alloc_threshold: float,
+    min_ms: float,
+    min_kb: float,
+) -> list[str]:
+    """Print both runs side by side and return the regressions found."""
+    regressions = []
+    print(
+        f'{"scenario":<10}{"phase":<17}{"old ms":>10}{"new ms":>10}'
+        f'{"change":>9}{"old kb":>10}{"new kb":>10}'
+    )
+    for scenario, phases in current['results'].items():
+        old_phases = baseline['results'].get(scenario, {})
+        for name, new in phases.items():
+            old = old_phases.get(name)
+            if old is None:
+                continue
+            change = new['ms'] / old['ms'] - 1 if old['ms'] else 0.0
+            flags = []
+            if (
+                new['ms'] > old['ms'] * (1 + threshold)
+                and new['ms'] - old['ms'] > min_ms
+            ):
+                flags.append('time')
+            if (
+                new['peak_kb'] > old['peak_kb'] * (1 + alloc_threshold)
+                and new['peak_kb'] - old['peak_kb'] > min_kb
+            ):
+                flags.append('alloc')
+            if flags:
+                regressions.append(f'{scenario}/{name}: {", ".join(flags)}')
+            print(
+                f'{scenario:<10}{name:<17}{old["ms"]:>10.3f}'
+                f'{new["ms"]:>10.3f}{change:>+9.1%}{old["peak_kb"]:>10.1f}'
+                f'{new["peak_kb"]:>10.1f}  {" ".join(flags)}'
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--asteroids',
+        type=int,
+        action='append',
+        help=f'asteroids per scenario (repeatable, default {SCENARIOS})',
+    )
+    parser.add_argument('--shots', type=int, default=500)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument(
+        '--phase',
+        action='append',
+        help='only run this phase (repeatable)',
+    )
+    parser.add_argument('--save', metavar='PATH', help='write results here')
+    parser.add_argument(
+        '--compare', metavar='PATH', help='baseline to compare against'
+    )
+    parser.add_argument('--threshold', type=float, default=0.15)
+    parser.add_argument('--alloc-threshold', type=float, default=0.25)
+    parser.add_argument('--min-ms', type=float, default=0.05)
+    parser.add_argument('--min-kb', type=float, default=16.0)
+    args = parser.parse_args()
+
+    disable_logging()
+    pygame.font.init()
+    result = {
+        'version': FORMAT_VERSION,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': HAS_NUMPY,
+        'shots': args.shots,
+        'repeats': args.repeats,
+        'seed': args.seed,
+        'results': {},
+    }
+    print(f'{"scenario":<10}{"phase":<17}{"ms":>10}{"peak kb":>10}')
+    for asteroids in args.asteroids or SCENARIOS:
+        phases = run_scenario(
+            asteroids, args.shots, args.repeats, args.seed, args.phase
+        )
+        result['results'][str(asteroids)] = phases
+        for name, row in phases.items():
+            print(
+                f'{asteroids:<10}{name:<17}{row["ms"]:>10.3f}'
+                f'{row["peak_kb"]:>10.1f}'
+            )
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(result, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print()
+        regressions = compare(
+            baseline,
+            result,
+            args.threshold,
+            args.alloc_threshold,
+            args.min_ms,
+            args.min_kb,
+        )
+        if regressions:
+            print(f'{len(regressions)} regression(s):')
+            for line in regressions:
+                print(f'  {line}')
+            raise SystemExit(1)
+        print('No regressions')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure world-steps per second of the batched simulator.
+
+    uv run python -m benchmarks.vector_env --worlds 256 --steps 600
+"""
+
+import argparse
+import time
+
+from core import controls
+from systems.entity_store import HAS_NUMPY, np
+from systems.vector_env import VectorAsteroids
+
+
+def run(worlds: int, steps: int, seed: int) -> dict[str, float]:
+    """Step a batch with random actions, resetting finished worlds."""
+    env = VectorAsteroids(worlds, seed=seed)
+    rng = np.random.default_rng(seed)
+    env.reset()
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        actions = rng.integers(0, controls.ALL_CONTROLS + 1, worlds)
+        _, _, dones = env.step(actions)
+        if dones.any():
+            env.reset(dones)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'worlds': worlds,
+        'steps': steps,
+        'seconds': elapsed,
+        'world_steps_per_second': worlds * steps / elapsed,
+        **env.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--worlds', type=int, action='append', help='repeatable'
+    )
+    parser.add_argument('--steps', type=int, default=600)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    if not HAS_NUMPY:
+        parser.error('the vectorized simulator requires numpy')
+
+    print(f'{"worlds":>8} {"seconds":>9} {"world-steps/s":>15} {"live":>7}')
+    for worlds in args.worlds or [1, 16, 256]:
+        result = run(worlds, args.steps, args.seed)
+        print(
+            f'{result["worlds"]:>8} {result["seconds"]:>9.3f} '
+            f'{result["world_steps_per_second"]:>15,.0f} '
+            f'{result["asteroids"]:>7}'
+        )
+
+
+if __name__ == '__main__':
+    main()
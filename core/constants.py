@@ -1,7 +1,9 @@
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 
-FPS = 60
+FPS = 60  # Render frame cap
+TICK_RATE = 60  # Fixed simulation steps per second
+MAX_FRAME_TIME = 0.25  # Longest frame the simulation catches up on (s)
 MAX_SECONDS = 16
 SPRITE_SAMPLE_LIMIT = 10  # Maximum number of sprites to log per group
 
@@ -15,11 +17,25 @@ ASTEROID_MIN_RADIUS = 20
 ASTEROID_KINDS = 3
 ASTEROID_SPAWN_RATE_SECONDS = 0.8
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS
+ASTEROID_POOL_CAPACITY = 256  # Killed asteroids kept for reuse
+SHAPE_TEMPLATES = 32  # Asteroid outlines in the shape library
+SHAPE_SEED = 0  # Seed of the shape library (same outlines every session)
+ASTEROID_SURFACE_CACHE = 256  # Pre-rendered outlines kept (0: vector only)
+ASTEROID_SURFACE_BUILDS_PER_FRAME = 16  # Outlines rasterized per frame
+ASTEROID_SPLIT_MIN_ANGLE = 20  # Degrees between a fragment and its parent
+ASTEROID_SPLIT_MAX_ANGLE = 50
+ASTEROID_SPLIT_SPEED_FACTOR = 1.2
 
 SHOT_RADIUS = 5
+SHOT_LIFETIME_SECONDS = 1.2  # 0: shots fly until they hit something
+SHOT_RANGE = 0  # Pixels a shot may travel (0: no limit)
+SHOT_CAPACITY = 64  # Live shots; the oldest is recycled beyond this
 PLAYER_SHOOT_SPEED = 500
 
 PLAYER_SHOOT_COOLDOWN_SECONDS = 0.3
+SPREAD_SHOT_ANGLES = (-15, 0, 15)  # Degrees from the ship's heading
+RAPID_SHOT_SPEED_FACTOR = 1.2
+RAPID_SHOT_COOLDOWN_DIVISOR = 3
 
 PLAYER_ACCELERATION = 500
 PLAYER_FRICTION = 0.99
@@ -29,4 +45,36 @@ ASTEROID_MEDIUM_SCORE = 50
 ASTEROID_SMALL_SCORE = 100
 
 PLAYER_STARTING_LIVES = 3
-PLAYER_RESPAWN_INVULNERABILITY = 2.0
\ No newline at end of file
+PLAYER_RESPAWN_INVULNERABILITY = 2.0
+
+# Keep asteroid and shot kinematics in NumPy arrays (needs numpy)
+ENTITY_STORE_ENABLED = False
+
+# Resolve shot-asteroid hits with the vectorized kernel (needs numpy)
+BATCH_COLLISIONS_ENABLED = True
+# Above this many asteroids the field is so crowded that the per-shot loop,
+# which stops at the first hit, beats testing every pair
+BATCH_COLLISIONS_MAX_ASTEROIDS = 1000
+
+# Event dispatch: 'sync' runs handlers inside emit, 'queued' buffers the
+# events and runs them at the end of each tick
+EVENT_DISPATCH = 'sync'
+
+# Record every interactive session's inputs to REPLAY_DIRECTORY (files are
+# never pruned; --record saves a single session instead)
+RECORD_REPLAYS = False
+REPLAY_DIRECTORY = 'replays'
+REPLAY_KEYFRAME_INTERVAL = TICK_RATE * 10  # Frames between world snapshots
+
+# State and event telemetry files: 'jsonl', 'columnar' (.tlm) or 'both'
+TELEMETRY_FORMAT = 'jsonl'
+
+# Seconds of per-tick snapshots kept for rewinding (0 disables)
+REWIND_SECONDS = 0
+REWIND_KEYFRAME_INTERVAL = TICK_RATE  # Ticks between snapshots with RNG state
+
+# Collision broadphase: 'grid', 'sweep' or 'brute'
+BROADPHASE = 'grid'
+
+# Keep asteroids registered in the spatial grid across frames
+SPATIAL_GRID_PERSISTENT = False
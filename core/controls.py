@@ -0,0 +1,73 @@
+"""
+Player input as a bitmask, one bit per control, and the controllers that
+produce it.
+"""
+
+import random
+from abc import ABC, abstractmethod
+
+import pygame
+
+THRUST = 1 << 0
+ROTATE_LEFT = 1 << 1
+REVERSE = 1 << 2
+ROTATE_RIGHT = 1 << 3
+SHOOT = 1 << 4
+
+ALL_CONTROLS = THRUST | ROTATE_LEFT | REVERSE | ROTATE_RIGHT | SHOOT
+
+KEY_BINDINGS = {
+    pygame.K_w: THRUST,
+    pygame.K_a: ROTATE_LEFT,
+    pygame.K_s: REVERSE,
+    pygame.K_d: ROTATE_RIGHT,
+    pygame.K_SPACE: SHOOT,
+}
+
+
+class Controller(ABC):
+    """Source of the player's input, polled once per simulation step."""
+
+    @abstractmethod
+    def poll(self) -> int:
+        """Return the controls held during this step as a bitmask."""
+
+
+class KeyboardController(Controller):
+    """Reads the keyboard state from pygame."""
+
+    def poll(self) -> int:
+        keys = pygame.key.get_pressed()
+        mask = 0
+        for key, control in KEY_BINDINGS.items():
+            if keys[key]:
+                mask |= control
+        return mask
+
+
+class ScriptedController(Controller):
+    """Seeded bot that holds a random manoeuvre for a while, always firing."""
+
+    manoeuvres = (
+        0,
+        THRUST,
+        ROTATE_LEFT,
+        ROTATE_RIGHT,
+        THRUST | ROTATE_LEFT,
+        THRUST | ROTATE_RIGHT,
+        REVERSE,
+    )
+
+    def __init__(self, seed: int | None = None, min_hold=10, max_hold=60):
+        self.rng = random.Random(seed)
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self._mask = 0
+        self._hold = 0
+
+    def poll(self) -> int:
+        if self._hold <= 0:
+            self._mask = self.rng.choice(self.manoeuvres) | SHOOT
+            self._hold = self.rng.randint(self.min_hold, self.max_hold)
+        self._hold -= 1
+        return self._mask
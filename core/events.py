@@ -1,36 +1,143 @@
+import time
 from typing import Callable, Any
 
 
 class EventBus:
-    """Simple event bus for decoupled communication between components."""
+    """Simple event bus for decoupled communication between components.
+
+    Event types are interned to integer IDs (``intern``); ``emit`` takes
+    either the name or the ID. In the default synchronous mode handlers
+    run inside ``emit``. With ``queued = True`` events are appended to a
+    buffer per type and handlers only run in ``drain``, which the game
+    calls once at the end of every tick: types are dispatched in the order
+    they were first emitted since the last drain, each type's events in
+    emit order, and events emitted by handlers are dispatched in the same
+    drain.
+
+    Handler lists are replaced, never mutated, so handlers may subscribe
+    or unsubscribe while an event is being dispatched: a dispatch already
+    under way keeps the list it started with.
+    """
 
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._handlers = {}
+            cls._instance._init()
         return cls._instance
 
-    def on(self, event_type: str, handler: Callable[[Any], None]) -> None:
+    def _init(self) -> None:
+        self.queued = False
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._handlers: list[list[Callable[[Any], None]]] = []
+        self._queues: list[list[Any]] = []
+        self._dirty: list[int] = []
+        self._emitted: list[int] = []
+        self._seconds: list[float] = []
+
+    def intern(self, event_type: str) -> int:
+        """Integer ID of an event type, stable for the process."""
+        event_id = self._ids.get(event_type)
+        if event_id is None:
+            event_id = self._ids[event_type] = len(self._names)
+            self._names.append(event_type)
+            self._handlers.append([])
+            self._queues.append([])
+            self._emitted.append(0)
+            self._seconds.append(0.0)
+        return event_id
+
+    def on(
+        self, event_type: str | int, handler: Callable[[Any], None]
+    ) -> None:
         """Subscribe to an event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        event_id = self._id(event_type)
+        self._handlers[event_id] = self._handlers[event_id] + [handler]
+
+    def off(
+        self, event_type: str | int, handler: Callable[[Any], None]
+    ) -> None:
+        """Unsubscribe from an event type (no-op if it has no handlers)."""
+        if event_type.__class__ is int:
+            event_id = event_type if 0 <= event_type < len(self._names) else -1
+        else:
+            event_id = self._ids.get(event_type, -1)
+        if event_id < 0 or not self._handlers[event_id]:
+            return
+        handlers = list(self._handlers[event_id])
+        handlers.remove(handler)
+        self._handlers[event_id] = handlers
+
+    def emit(self, event_type: str | int, data: Any = None) -> None:
+        """Emit an event to all subscribers (now, or at the next drain)."""
+        event_id = self._id(event_type)
+        self._emitted[event_id] += 1
+        if self.queued:
+            queue = self._queues[event_id]
+            if not queue:
+                self._dirty.append(event_id)
+            queue.append(data)
+            return
+
+        handlers = self._handlers[event_id]
+        if handlers:
+            start = time.perf_counter()
+            for handler in handlers:
+                handler(data)
+            self._seconds[event_id] += time.perf_counter() - start
+
+    def drain(self) -> int:
+        """Dispatch every queued event; returns how many were dispatched."""
+        dispatched = 0
+        while self._dirty:
+            dirty, self._dirty = self._dirty, []
+            for event_id in dirty:
+                batch = self._queues[event_id]
+                self._queues[event_id] = []
+                dispatched += len(batch)
+                handlers = self._handlers[event_id]
+                if not handlers:
+                    continue
+                start = time.perf_counter()
+                for data in batch:
+                    for handler in handlers:
+                        handler(data)
+                self._seconds[event_id] += time.perf_counter() - start
+        return dispatched
+
+    @property
+    def emitted(self) -> dict[str, int]:
+        """Events emitted per type since the process started."""
+        return {
+            name: count
+            for name, count in zip(self._names, self._emitted)
+            if count
+        }
 
-    def off(self, event_type: str, handler: Callable[[Any], None]) -> None:
-        """Unsubscribe from an event type."""
-        if event_type in self._handlers:
-            self._handlers[event_type].remove(handler)
+    @property
+    def handler_seconds(self) -> dict[str, float]:
+        """Time spent in handlers per event type."""
+        return {
+            name: seconds
+            for name, seconds in zip(self._names, self._seconds)
+            if seconds
+        }
 
-    def emit(self, event_type: str, data: Any = None) -> None:
-        """Emit an event to all subscribers."""
-        for handler in self._handlers.get(event_type, []):
-            handler(data)
+    def _id(self, event_type: str | int) -> int:
+        if event_type.__class__ is int:
+            if not 0 <= event_type < len(self._names):
+                raise ValueError(f'Unknown event ID: {event_type}')
+            return event_type
+        return self.intern(event_type)
 
     def clear(self) -> None:
-        """Clear all handlers."""
-        self._handlers.clear()
+        """Clear all handlers and queued events."""
+        for event_id in range(len(self._names)):
+            self._handlers[event_id] = []
+            self._queues[event_id] = []
+        self._dirty.clear()
 
 
 # Global event bus instance
@@ -0,0 +1,99 @@
+"""
+In-memory rewind buffer of recent world snapshots.
+"""
+
+from typing import TYPE_CHECKING
+
+from core import constants as const
+from core.snapshot import restore_world, snapshot_world
+
+if TYPE_CHECKING:
+    from core.world import World
+
+
+class RewindBuffer:
+    """Ring buffer holding one snapshot per tick for the last few seconds.
+
+    ``step_world`` pushes the state at the end of every tick; the oldest
+    snapshot is overwritten once the buffer is full. One push in every
+    ``keyframe_interval`` keeps the RNG state; the others only refer to
+    the latest such keyframe, which they share.
+    """
+
+    def __init__(
+        self,
+        seconds: float = const.REWIND_SECONDS,
+        keyframe_interval: int = const.REWIND_KEYFRAME_INTERVAL,
+    ):
+        self.capacity = max(1, round(seconds * const.TICK_RATE))
+        self.keyframe_interval = keyframe_interval
+        self._snapshots: list[bytes | None] = [None] * self.capacity
+        # Keyframe de cada entrada (None quando ela mesma é um keyframe)
+        self._keyframes: list[bytes | None] = [None] * self.capacity
+        self._keyframe: bytes | None = None
+        self._since_keyframe = 0
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def bytes_used(self) -> int:
+        # Keyframes compartilhados contam uma vez só
+        held = {id(s): s for s in self._snapshots + self._keyframes if s}
+        return sum(len(s) for s in held.values())
+
+    def push(self, world: 'World') -> None:
+        """Snapshot the world as the newest entry."""
+        head = self._head
+        if self._keyframe is None or (
+            self._since_keyframe >= self.keyframe_interval
+        ):
+            self._keyframe = self._snapshots[head] = snapshot_world(world)
+            self._keyframes[head] = None
+            self._since_keyframe = 0
+        else:
+            self._snapshots[head] = snapshot_world(world, rng_state=False)
+            self._keyframes[head] = self._keyframe
+        self._since_keyframe += 1
+        self._head = (head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _index(self, frames_ago: int) -> int:
+        if not 0 <= frames_ago < self._count:
+            raise IndexError(
+                f'Only {self._count} frames of history, asked {frames_ago}'
+            )
+        return (self._head - 1 - frames_ago) % self.capacity
+
+    def snapshot(self, frames_ago: int = 0) -> bytes:
+        """Snapshot from ``frames_ago`` ticks back; 0 is the newest."""
+        return self._snapshots[self._index(frames_ago)]
+
+    def keyframe(self, frames_ago: int = 0) -> bytes | None:
+        """Keyframe ``restore_world`` needs for that snapshot, if any."""
+        return self._keyframes[self._index(frames_ago)]
+
+    def rewind(self, world: 'World', frames: int) -> None:
+        """Restore the world ``frames`` ticks back.
+
+        Clamped to the available history; snapshots newer than the restored
+        one are dropped.
+        """
+        frames = min(frames, self._count - 1)
+        index = self._index(frames)
+        keyframe = self._keyframes[index]
+        restore_world(world, self._snapshots[index], keyframe)
+        # As próximas entradas seguem do keyframe da restaurada
+        self._keyframe = keyframe or self._snapshots[index]
+        self._head = (self._head - frames) % self.capacity
+        self._count -= frames
+
+    def clear(self) -> None:
+        self._snapshots = [None] * self.capacity
+        self._keyframes = [None] * self.capacity
+        self._keyframe = None
+        self._since_keyframe = 0
+        self._head = 0
+        self._count = 0
@@ -0,0 +1,79 @@
+"""
+Seeded random streams, one per subsystem.
+
+Each stream is seeded from the session seed and its own name, so adding a
+call in one subsystem does not shift the numbers drawn by the others.
+Modules draw from the stream objects directly (``rng.field.randint``);
+``seed`` reseeds them in place.
+
+Streams count the 32-bit words they draw from the Mersenne Twister. The
+generator's state depends only on how many words were drawn, so a stream
+can be put back at any later point from an earlier state and the count
+difference (``Stream.skip``).
+"""
+
+import random
+
+
+class Stream(random.Random):
+    """``random.Random`` that counts the words drawn since it was seeded."""
+
+    words = 0
+
+    def seed(self, *args, **kwargs) -> None:
+        super().seed(*args, **kwargs)
+        self.words = 0
+
+    def random(self) -> float:
+        self.words += 2  # 53 bits saem de duas palavras
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.words += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def skip(self, words: int) -> None:
+        """Advance the stream as if ``words`` words had been drawn."""
+        if words > 0:
+            self.getrandbits(32 * words)
+
+
+field = Stream()  # AsteroidField spawns
+shapes = Stream()  # Asteroid outlines
+split = Stream()  # Asteroid.split angles
+powerups = Stream()  # Power-up drops
+particles = Stream()  # Explosion particles (cosmetic)
+
+STREAMS = {
+    'field': field,
+    'shapes': shapes,
+    'split': split,
+    'powerups': powerups,
+    'particles': particles,
+}
+
+SEED_BITS = 63
+
+
+def seed(value: int | None = None) -> int:
+    """Reseed every stream and return the seed used.
+
+    Without a value a fresh seed is drawn from the OS, so unseeded sessions
+    can still be recorded and replayed.
+    """
+    if value is None:
+        value = random.SystemRandom().getrandbits(SEED_BITS)
+    for name, stream in STREAMS.items():
+        stream.seed(f'{value}:{name}')
+    return value
+
+
+def get_state() -> dict[str, tuple]:
+    """Internal state of every stream."""
+    return {name: stream.getstate() for name, stream in STREAMS.items()}
+
+
+def set_state(state: dict[str, tuple]) -> None:
+    """Restore states returned by ``get_state``."""
+    for name, stream in STREAMS.items():
+        stream.setstate(state[name])
@@ -0,0 +1,335 @@
+"""
+Capture and restore the full simulation state of a world.
+
+A snapshot holds everything the next tick depends on: entities in group
+order (which decides collision order), player and weapon state,
+``GameState``, the asteroid field timer, the broadphase tuning and the RNG
+streams. Explosion particles are cosmetic and are not kept, so the
+particle stream may drift from the original run after a restore.
+
+The Mersenne Twister state of a stream is 2.5 KB, so only keyframes
+(``rng_state=True``) carry it. Every snapshot records how many words each
+stream has drawn; a snapshot without state is restored from an earlier
+keyframe of the same session by skipping the streams forward.
+
+Snapshots use a fixed little-endian layout built with ``struct`` and
+``array``, cheap enough to take every frame:
+
+    header     counts, frame, seed, GameState, timers, player, shot
+               ring cursor, keyframe flag
+    rng        per stream: words drawn, gauss flag and value, then
+               625 x u32 of state in keyframes
+    asteroids  7 x f64 per asteroid (position, previous position,
+               velocity, radius), then one u16 shape index each
+    shots      8 x f64 per shot (kinematics, lifetime left), then one
+               u16 ring slot each (0xFFFF outside the ring)
+    power-ups  8 x f64 per power-up (kinematics, lifetime), then one u8
+               type each
+"""
+
+import math
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+import pygame
+
+from core import rng
+from entities.asteroid import Asteroid
+from entities.powerups import PowerUp
+from entities.shot import Shot
+from systems.components import WEAPON_TYPES
+
+if TYPE_CHECKING:
+    from core.world import World
+
+MAGIC = b'SNAP'
+VERSION = 4
+
+POWERUP_TYPES = ('shield', 'speed')
+
+HEADER = struct.Struct('<4sHQqqi?dddB10dIIII?')
+STREAM = struct.Struct('<Q?d')  # Palavras sorteadas, gauss
+KINEMATICS = struct.Struct('<7d')
+POWERUP = struct.Struct('<8d')
+SHOT = POWERUP
+RNG_WORDS = 625
+NO_SLOT = 0xFFFF
+
+_SWAP = sys.byteorder == 'big'
+_U32 = 'I' if array('I').itemsize == 4 else 'L'
+
+
+def _pack(values: array) -> bytes:
+    if _SWAP:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(typecode: str, data, offset: int, count: int):
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if _SWAP:
+        values.byteswap()
+    return values, end
+
+
+def _kinematics(shapes) -> bytes:
+    pack = KINEMATICS.pack
+    return b''.join([pack(*shape.kinematics()) for shape in shapes])
+
+
+def _set_kinematics(shape, values, offset: int) -> None:
+    shape.previous_position = pygame.Vector2(
+        values[offset + 2], values[offset + 3]
+    )
+    shape.velocity = pygame.Vector2(values[offset + 4], values[offset + 5])
+
+
+def _read_streams(data, offset: int, rng_state: bool):
+    """Per stream ``(words, gauss, state or None)``, and the end offset."""
+    streams = {}
+    for name in rng.STREAMS:
+        words, has_gauss, gauss = STREAM.unpack_from(data, offset)
+        offset += STREAM.size
+        internal = None
+        if rng_state:
+            internal, offset = _unpack(_U32, data, offset, RNG_WORDS)
+        streams[name] = (words, gauss if has_gauss else None, internal)
+    return streams, offset
+
+
+def snapshot_world(world: 'World', rng_state: bool = True) -> bytes:
+    """Binary snapshot of the world between two ticks.
+
+    Without ``rng_state`` the snapshot is about 12 KB smaller, and
+    ``restore_world`` needs an earlier keyframe of the same session.
+    """
+    asteroids = world.asteroids.sprites()
+    shots = world.shots.sprites()
+    powerups = world.powerups.sprites()
+    ring = world.shot_ring
+    player = world.player
+    game_state = world.game_state
+
+    asteroid_shapes = array('H', [asteroid.shape for asteroid in asteroids])
+    shot_values = b''.join(
+        [
+            SHOT.pack(
+                *shot.kinematics(),
+                ring.remaining(shot.ring_slot)
+                if ring is not None and shot.ring_slot >= 0
+                else math.inf,
+            )
+            for shot in shots
+        ]
+    )
+    shot_slots = array(
+        'H',
+        [
+            shot.ring_slot
+            if ring is not None and shot.ring_slot >= 0
+            else NO_SLOT
+            for shot in shots
+        ],
+    )
+    powerup_values = b''.join(
+        [
+            POWERUP.pack(*powerup.kinematics(), powerup.lifetime)
+            for powerup in powerups
+        ]
+    )
+
+    position = player.position
+    previous = player.previous_position
+    velocity = player.velocity
+    cell_size = getattr(world.broadphase, 'cell_size', None)
+    parts = [
+        HEADER.pack(
+            MAGIC,
+            VERSION,
+            world.frame,
+            world.seed,
+            game_state.score,
+            game_state.lives,
+            game_state.game_over,
+            game_state.respawn_timer,
+            world.field.spawn_timer,
+            float('nan') if cell_size is None else cell_size,
+            WEAPON_TYPES.index(player.weapon_type),
+            position.x,
+            position.y,
+            previous.x,
+            previous.y,
+            velocity.x,
+            velocity.y,
+            player.rotation,
+            player.invulnerable,
+            player.speed_boost,
+            player.shot_cooldown,
+            len(asteroids),
+            len(shots),
+            len(powerups),
+            ring.cursor if ring is not None else 0,
+            rng_state,
+        )
+    ]
+    for stream in rng.STREAMS.values():
+        gauss = stream.gauss_next
+        parts.append(STREAM.pack(stream.words, gauss is not None, gauss or 0))
+        if rng_state:
+            parts.append(_pack(array(_U32, stream.getstate()[1])))
+
+    parts.append(_kinematics(asteroids))
+    parts.append(_pack(asteroid_shapes))
+    parts.append(shot_values)
+    parts.append(_pack(shot_slots))
+    parts.append(powerup_values)
+    parts.append(bytes(POWERUP_TYPES.index(p.power_type) for p in powerups))
+    return b''.join(parts)
+
+
+def restore_world(
+    world: 'World', data: bytes, keyframe: bytes | None = None
+) -> None:
+    """Put a world created by ``create_world`` back into a snapshot.
+
+    The world must be the most recently created one, since new sprites
+    join the groups wired to the entity classes. A snapshot taken without
+    RNG state needs ``keyframe``: an earlier snapshot of the same session
+    that has it.
+    """
+    data = memoryview(data)
+    (
+        magic,
+        version,
+        frame,
+        seed,
+        score,
+        lives,
+        game_over,
+        respawn_timer,
+        spawn_timer,
+        cell_size,
+        weapon,
+        *player_values,
+        asteroid_count,
+        shot_count,
+        powerup_count,
+        shot_cursor,
+        rng_state,
+    ) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Not a world snapshot')
+
+    streams, offset = _read_streams(data, HEADER.size, rng_state)
+    start = streams
+    if not rng_state:
+        if keyframe is None:
+            raise ValueError('Snapshot has no RNG state and no keyframe')
+        keyframe = memoryview(keyframe)
+        if not HEADER.unpack_from(keyframe)[-1]:
+            raise ValueError('Keyframe has no RNG state')
+        start, _ = _read_streams(keyframe, HEADER.size, True)
+
+    asteroid_values, offset = _unpack('d', data, offset, 7 * asteroid_count)
+    asteroid_shapes, offset = _unpack('H', data, offset, asteroid_count)
+    shot_values, offset = _unpack('d', data, offset, 8 * shot_count)
+    shot_slots, offset = _unpack('H', data, offset, shot_count)
+    powerup_values, offset = _unpack('d', data, offset, 8 * powerup_count)
+    powerup_types = data[offset : offset + powerup_count]
+
+    for group in (
+        world.asteroids,
+        world.shots,
+        world.powerups,
+        world.particles,
+    ):
+        for sprite in group.sprites():
+            sprite.kill()
+
+    pool = world.asteroid_pool
+    if pool is not None:
+        # Os asteroides mortos acima voltam como os restaurados
+        pool.collect()
+    for index in range(asteroid_count):
+        base = 7 * index
+        shape = asteroid_shapes[index]
+        x, y, radius = (
+            asteroid_values[base],
+            asteroid_values[base + 1],
+            asteroid_values[base + 6],
+        )
+        if pool is not None:
+            asteroid = pool.acquire(x, y, radius, shape)
+        else:
+            asteroid = Asteroid(x, y, radius)
+            asteroid.shape = shape
+        _set_kinematics(asteroid, asteroid_values, base)
+    ring = world.shot_ring
+    if ring is not None:
+        ring.reset(shot_cursor)
+    for index in range(shot_count):
+        base = 8 * index
+        x, y, radius = (
+            shot_values[base],
+            shot_values[base + 1],
+            shot_values[base + 6],
+        )
+        slot = shot_slots[index]
+        if ring is not None and slot != NO_SLOT:
+            shot = ring.place(slot, x, y, radius, shot_values[base + 7])
+        else:
+            shot = Shot(x, y, radius)
+        _set_kinematics(shot, shot_values, base)
+    for index in range(powerup_count):
+        base = 8 * index
+        powerup = PowerUp(
+            powerup_values[base],
+            powerup_values[base + 1],
+            POWERUP_TYPES[powerup_types[index]],
+        )
+        _set_kinematics(powerup, powerup_values, base)
+        powerup.lifetime = powerup_values[base + 7]
+
+    player = world.player
+    player.position = pygame.Vector2(player_values[0], player_values[1])
+    player.previous_position = pygame.Vector2(
+        player_values[2], player_values[3]
+    )
+    player.velocity = pygame.Vector2(player_values[4], player_values[5])
+    (
+        player.rotation,
+        player.invulnerable,
+        player.speed_boost,
+        player.shot_cooldown,
+    ) = player_values[6:]
+    player.weapon_type = WEAPON_TYPES[weapon]
+
+    game_state = world.game_state
+    game_state.score = score
+    game_state.lives = lives
+    game_state.respawn_timer = respawn_timer
+    game_state.game_over = game_over
+    world.field.spawn_timer = spawn_timer
+
+    # O tamanho da célula decide a ordem dos candidatos; a grade é
+    # reconstruída no próximo tick
+    if not math.isnan(cell_size):  # NaN: broadphase sem células
+        world.broadphase.cell_size = cell_size
+    world.broadphase.clear()
+
+    world.frame = frame
+    world.seed = seed
+    # Por último: criar os asteroides acima consome o stream de formas
+    for name, stream in rng.STREAMS.items():
+        words, gauss, _ = streams[name]
+        start_words, _, internal = start[name]
+        if words < start_words:
+            raise ValueError(f'Keyframe is ahead of the {name!r} stream')
+        stream.setstate((3, tuple(internal), None))
+        stream.skip(words - start_words)
+        stream.words = words
+        stream.gauss_next = gauss
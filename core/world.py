@@ -0,0 +1,165 @@
+import dataclasses
+from dataclasses import dataclass
+
+import pygame
+
+from core import constants as const
+from core import rng
+from core.controls import Controller
+from core.events import events
+from core.game_state import GameState
+from core.rewind import RewindBuffer
+from entities.asteroid import Asteroid
+from entities.player import Player
+from entities.powerups import PowerUp
+from entities.shot import Shot
+from systems.asteroid_pool import AsteroidPool
+from systems.asteroidfield import AsteroidField
+from systems.broadphase import Broadphase, create_broadphase
+from systems.destruction import DestructionQueue
+from systems.entity_store import HAS_NUMPY, EntityStore
+from systems.factory import EntityFactory
+from systems.shot_ring import ShotRing
+from utils.metrics import MetricsExporter
+from utils.profiler import NULL_PROFILER, FrameProfiler, NullProfiler
+from utils.replay import ReplayRecorder
+
+
+@dataclass
+class World:
+    """Everything one simulated game needs, independent of any window."""
+
+    player: Player
+    field: AsteroidField
+    updatable: pygame.sprite.Group
+    drawable: pygame.sprite.Group
+    asteroids: pygame.sprite.Group
+    shots: pygame.sprite.Group
+    particles: pygame.sprite.Group
+    powerups: pygame.sprite.Group
+    game_state: GameState
+    broadphase: Broadphase
+    stores: tuple[EntityStore, ...] = ()
+    destruction: DestructionQueue = dataclasses.field(
+        default_factory=DestructionQueue
+    )
+    shot_ring: ShotRing | None = None
+    asteroid_pool: AsteroidPool | None = None
+    frame: int = 0
+    seed: int = 0
+    recorder: ReplayRecorder | None = None
+    rewind: RewindBuffer | None = None
+    profiler: FrameProfiler | NullProfiler = NULL_PROFILER
+    metrics: MetricsExporter | None = None
+
+
+def world_stats(world: World) -> dict[str, float]:
+    """Score, entity counts and system counters, as logged each second."""
+    stats = {
+        'score': world.game_state.score,
+        'lives': world.game_state.lives,
+        'asteroids': len(world.asteroids),
+        'shots': len(world.shots),
+        'particles': len(world.particles),
+        'powerups': len(world.powerups),
+    }
+    for key, value in world.broadphase.stats().items():
+        stats[f'broadphase_{key}'] = value
+    for key, value in world.destruction.stats().items():
+        stats[f'destruction_{key}'] = value
+    if world.shot_ring is not None:
+        for key, value in world.shot_ring.stats().items():
+            stats[f'shot_ring_{key}'] = value
+    if world.asteroid_pool is not None:
+        for key, value in world.asteroid_pool.stats().items():
+            stats[f'asteroid_pool_{key}'] = value
+    return stats
+
+
+def create_broadphase_for_game() -> Broadphase:
+    """Broadphase from the constants, tuned for the asteroid radii."""
+    options = {}
+    if const.BROADPHASE == 'grid':
+        options['persistent'] = const.SPATIAL_GRID_PERSISTENT
+    broadphase = create_broadphase(const.BROADPHASE, **options)
+    # Ajuste inicial a partir dos raios possíveis; re-ajustado em jogo
+    broadphase.retune(
+        (
+            const.ASTEROID_MIN_RADIUS * kind
+            for kind in range(1, const.ASTEROID_KINDS + 1)
+        ),
+        tolerance=0,
+    )
+    return broadphase
+
+
+def create_world(
+    controller: Controller | None = None, seed: int | None = None
+) -> World:
+    """Build a fresh world and wire the entity classes to its groups.
+
+    Entity ``containers`` and ``store`` are class attributes, so only the
+    most recently created world receives new sprites. The player reads
+    the keyboard unless another ``controller`` is given. The RNG streams
+    are reseeded with ``seed`` (a fresh one if None) before anything
+    random is drawn, and the event bus is put in ``EVENT_DISPATCH`` mode.
+    """
+    seed = rng.seed(seed)
+    events.queued = const.EVENT_DISPATCH == 'queued'
+
+    updatable = pygame.sprite.Group()
+    drawable = pygame.sprite.Group()
+    asteroids = pygame.sprite.Group()
+    shots = pygame.sprite.Group()
+    particles = pygame.sprite.Group()
+    powerups = pygame.sprite.Group()
+
+    stores = ()
+    if const.ENTITY_STORE_ENABLED and HAS_NUMPY:
+        # Integrados em lote pelos stores, fora do grupo updatable
+        Shot.store = EntityStore()
+        Asteroid.store = EntityStore()
+        stores = (Shot.store, Asteroid.store)
+        Shot.containers = (shots, drawable)
+        Asteroid.containers = (asteroids, drawable)
+    else:
+        Shot.store = None
+        Asteroid.store = None
+        Shot.containers = (shots, updatable, drawable)
+        Asteroid.containers = (asteroids, updatable, drawable)
+
+    shot_ring = ShotRing()
+    EntityFactory.shot_ring = shot_ring
+    asteroid_pool = AsteroidPool()
+    EntityFactory.asteroid_pool = asteroid_pool
+
+    AsteroidField.containers = updatable
+    field = AsteroidField()
+
+    # Power-ups e o player são desenhados à parte, por cima das partículas
+    PowerUp.containers = (powerups, updatable)
+
+    Player.containers = (updatable,)
+    player = Player(
+        const.SCREEN_WIDTH / 2,
+        const.SCREEN_HEIGHT / 2,
+        controller,
+    )
+
+    return World(
+        player=player,
+        field=field,
+        updatable=updatable,
+        drawable=drawable,
+        asteroids=asteroids,
+        shots=shots,
+        particles=particles,
+        powerups=powerups,
+        game_state=GameState(),
+        broadphase=create_broadphase_for_game(),
+        stores=stores,
+        shot_ring=shot_ring,
+        asteroid_pool=asteroid_pool,
+        seed=seed,
+        rewind=RewindBuffer() if const.REWIND_SECONDS > 0 else None,
+    )
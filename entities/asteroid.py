@@ -1,71 +1,77 @@
-import math
-from random import randint, uniform
-
 import pygame
 from core import constants as const
-from entities.circleshape import CircleShape
+from core import rng
+from entities.circleshape import StoredShape
+from entities.shapes import get_outline_cache, get_shape_library
 from utils.logger import log_event
 
 
-def generate_asteroid_vertices(
-    num_sides: int = 8,
-    avg_radius: float = 50,
-    irregularity: float = 0.3,
-    spikiness: float = 0.4,
-) -> list[pygame.Vector2]:
-    vertices = []
-    angle_step = 2 * math.pi / num_sides
-    angles = []
-
-    for i in range(num_sides):
-        base_angle = i * angle_step
-        noise = uniform(-irregularity, irregularity) * angle_step * 0.5
-        angles.append(base_angle + noise)
-
-    angles.sort()
-
-    for angle in angles:
-        radius_variance = uniform(-spikiness, spikiness) * avg_radius
-        radius = avg_radius + radius_variance
-        if radius < avg_radius * 0.3:
-            radius = avg_radius * 0.3
-
-        x = math.cos(angle) * radius
-        y = math.sin(angle) * radius
-        vertices.append(pygame.Vector2(x, y))
-
-    return vertices
-
-
-class Asteroid(CircleShape):
-    __slots__ = ['vertices']
+class Asteroid(StoredShape):
+    __slots__ = ['shape']
+    pool = None  # AsteroidPool que recebe o asteroide de volta no kill
 
     def __init__(self, x: float, y: float, radius: float):
+        self._check_radius(radius)
+        super().__init__(x, y, radius)
+        self.shape = self._pick_shape()
+
+    @staticmethod
+    def _check_radius(radius: float) -> None:
         # Validação de raio
         if radius <= 0:
-            raise ValueError(f"Radius must be positive, got {radius}")
+            raise ValueError(f'Radius must be positive, got {radius}')
         if radius > const.ASTEROID_MAX_RADIUS * 2:
-            raise ValueError(f"Radius {radius} exceeds maximum allowed")
-        
-        super().__init__(x, y, radius)
-        num_sides = randint(8, 12)
-        self.vertices = generate_asteroid_vertices(
-            num_sides=num_sides,
-            avg_radius=radius,
-            irregularity=0.3,
-            spikiness=0.4,
-        )
+            raise ValueError(f'Radius {radius} exceeds maximum allowed')
+
+    @staticmethod
+    def _pick_shape() -> int:
+        return rng.shapes.randrange(len(get_shape_library()))
+
+    @property
+    def vertices(self) -> list[pygame.Vector2]:
+        """Outline offsets from the center, at the current radius."""
+        outline = get_shape_library().outline(self.shape, self.radius)
+        return [pygame.Vector2(point) for point in outline]
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        shape: int | None = None,
+    ) -> None:
+        """Reuse a killed asteroid as a new one at rest at (x, y)."""
+        self._check_radius(radius)
+        self.radius = radius
+        self.revive(x, y)
+        # Mesmo sorteio de um asteroide novo
+        self.shape = self._pick_shape() if shape is None else shape
+
+    def kill(self):
+        alive = self.alive()
+        super().kill()
+        if alive and self.pool is not None:
+            self.pool.release(self)
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
+        x, y = self.render_position(alpha)
+        cached = get_outline_cache().get(self.shape, self.radius)
+        if cached is not None:
+            surface, half = cached
+            screen.blit(surface, (x - half, y - half))
+            return
 
-    def draw(self, screen: pygame.Surface):
-        world_vertices = [self.position + v for v in self.vertices]
+        # Contorno ainda fora do cache: desenho vetorial
+        outline = get_shape_library().outline(self.shape, self.radius)
         pygame.draw.polygon(
             screen,
             'white',
-            world_vertices,
+            [(x + dx, y + dy) for dx, dy in outline],
             const.LINE_WIDTH,
         )
 
     def update(self, dt: float):
+        self.save_previous()
         self.position += self.velocity * dt
         self.wrap_position()
 
@@ -85,15 +91,25 @@ class Asteroid(CircleShape):
 
         log_event('asteroid_split')
 
-        random_angle = uniform(20, 50)
+        random_angle = rng.split.uniform(
+            const.ASTEROID_SPLIT_MIN_ANGLE, const.ASTEROID_SPLIT_MAX_ANGLE
+        )
         first_asteroid_movement = self.velocity.rotate(random_angle)
         second_asteroid_movement = self.velocity.rotate(-random_angle)
         new_radius = self.radius - const.ASTEROID_MIN_RADIUS
 
-        first_asteroid = Asteroid(self.position.x, self.position.y, new_radius)
-        second_asteroid = Asteroid(
-            self.position.x, self.position.y, new_radius
-        )
+        position = self.position
+        if self.pool is not None:
+            first_asteroid = self.pool.acquire(
+                position.x, position.y, new_radius
+            )
+            second_asteroid = self.pool.acquire(
+                position.x, position.y, new_radius
+            )
+        else:
+            first_asteroid = Asteroid(position.x, position.y, new_radius)
+            second_asteroid = Asteroid(position.x, position.y, new_radius)
 
-        first_asteroid.velocity = first_asteroid_movement * 1.2
-        second_asteroid.velocity = second_asteroid_movement * 1.2
+        speedup = const.ASTEROID_SPLIT_SPEED_FACTOR
+        first_asteroid.velocity = first_asteroid_movement * speedup
+        second_asteroid.velocity = second_asteroid_movement * speedup
@@ -10,7 +10,7 @@ class Bomb(CircleShape):
         self.timer = 1.5
         self.exploded = False
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
         if not self.exploded:
             pygame.draw.circle(
                 screen,
@@ -1,7 +1,12 @@
+import math
+
 import pygame
 
 from core import constants as const
 
+# Vetor de rascunho de StoredShape.set_polar_velocity
+_POLAR = pygame.Vector2()
+
 
 def point_in_triangle(
     point: pygame.Vector2, triangle: list[pygame.Vector2]
@@ -21,6 +26,19 @@ def point_in_triangle(
     return not (has_neg and has_pos)
 
 
+def wrapped_delta(
+    origin: pygame.Vector2, target: pygame.Vector2
+) -> pygame.Vector2:
+    """Shortest vector from origin to target on the wrapping playfield."""
+    half_width = const.SCREEN_WIDTH / 2
+    half_height = const.SCREEN_HEIGHT / 2
+    return pygame.Vector2(
+        (target.x - origin.x + half_width) % const.SCREEN_WIDTH - half_width,
+        (target.y - origin.y + half_height) % const.SCREEN_HEIGHT
+        - half_height,
+    )
+
+
 class CircleShape(pygame.sprite.Sprite):
     def __init__(self, x: float, y: float, radius: float):
         if hasattr(self, 'containers'):
@@ -29,20 +47,173 @@ class CircleShape(pygame.sprite.Sprite):
             super().__init__()
 
         self.position = pygame.Vector2(x, y)
+        self.previous_position = pygame.Vector2(x, y)
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
         raise NotImplementedError
 
     def update(self, dt: float):
         raise NotImplementedError
 
+    def save_previous(self) -> None:
+        """Remember the position at the start of a simulation tick."""
+        self.previous_position.update(self.position)
+
+    def kinematics(self) -> tuple[float, ...]:
+        """Position, previous position, velocity and radius, flattened."""
+        return (
+            *self.position,
+            *self.previous_position,
+            *self.velocity,
+            self.radius,
+        )
+
+    def render_position(self, alpha: float) -> pygame.Vector2:
+        """Position interpolated between the last two simulation ticks."""
+        if alpha >= 1.0:
+            return self.position
+        previous = self.previous_position
+        return previous + wrapped_delta(previous, self.position) * alpha
+
     def wrap_position(self):
         self.position.x %= const.SCREEN_WIDTH
         self.position.y %= const.SCREEN_HEIGHT
 
     def collides_with(self, other: 'CircleShape') -> bool:
-        distance = self.position.distance_to(other.position)
+        delta = wrapped_delta(self.position, other.position)
+        distance = math.sqrt(delta.x * delta.x + delta.y * delta.y)
         r1, r2 = self.radius, other.radius
         return distance < (r1 + r2)
+
+
+class StoredShape(CircleShape):
+    """CircleShape whose kinematics can live in a shared EntityStore.
+
+    When ``store`` is bound on the subclass, ``position``,
+    ``previous_position``, ``velocity`` and ``radius`` read and write a row
+    of the store, and integration is done in bulk by ``EntityStore.update``.
+    Reads return copies, so mutate them by assignment (``pos += v``) rather
+    than in place (``pos.x = 0``). Killing the sprite frees its row and
+    keeps the last values on the instance.
+    """
+
+    store = None
+
+    def __init__(self, x: float, y: float, radius: float):
+        self._slot = -1
+        if self.store is not None:
+            self._slot = self.store.allocate(self)
+        super().__init__(x, y, radius)
+
+    @property
+    def position(self) -> pygame.Vector2:
+        if self._slot < 0:
+            return self._position
+        return pygame.Vector2(self.store.positions[self._slot].tolist())
+
+    @position.setter
+    def position(self, value: pygame.Vector2) -> None:
+        if self._slot < 0:
+            self._position = value
+        else:
+            self.store.positions[self._slot] = value
+
+    @property
+    def previous_position(self) -> pygame.Vector2:
+        if self._slot < 0:
+            return self._previous_position
+        return pygame.Vector2(
+            self.store.previous_positions[self._slot].tolist()
+        )
+
+    @previous_position.setter
+    def previous_position(self, value: pygame.Vector2) -> None:
+        if self._slot < 0:
+            self._previous_position = value
+        else:
+            self.store.previous_positions[self._slot] = value
+
+    def save_previous(self) -> None:
+        if self._slot < 0:
+            self._previous_position.update(self._position)
+        else:
+            self.store.previous_positions[self._slot] = self.store.positions[
+                self._slot
+            ]
+
+    def kinematics(self) -> tuple[float, ...]:
+        if self._slot < 0:
+            return (
+                *self._position,
+                *self._previous_position,
+                *self._velocity,
+                self._radius,
+            )
+        slot = self._slot
+        store = self.store
+        return (
+            *store.positions[slot].tolist(),
+            *store.previous_positions[slot].tolist(),
+            *store.velocities[slot].tolist(),
+            float(store.radii[slot]),
+        )
+
+    @property
+    def velocity(self) -> pygame.Vector2:
+        if self._slot < 0:
+            return self._velocity
+        return pygame.Vector2(self.store.velocities[self._slot].tolist())
+
+    @velocity.setter
+    def velocity(self, value: pygame.Vector2) -> None:
+        if self._slot < 0:
+            self._velocity = value
+        else:
+            self.store.velocities[self._slot] = value
+
+    def set_polar_velocity(self, speed: float, angle: float) -> None:
+        """Set the velocity as ``Vector2.from_polar`` without a new vector."""
+        if self._slot < 0:
+            self._velocity.from_polar((speed, angle))
+            return
+        velocity = _POLAR
+        velocity.from_polar((speed, angle))
+        self.store.velocities[self._slot] = velocity
+
+    @property
+    def radius(self) -> float:
+        if self._slot < 0:
+            return self._radius
+        return float(self.store.radii[self._slot])
+
+    @radius.setter
+    def radius(self, value: float) -> None:
+        if self._slot < 0:
+            self._radius = value
+        else:
+            self.store.radii[self._slot] = value
+
+    def revive(self, x: float, y: float) -> None:
+        """Bring a killed sprite back at rest at (x, y), reusing objects."""
+        self._position.update(x, y)
+        self._previous_position.update(x, y)
+        self._velocity.update(0, 0)
+        if self.store is not None:
+            self._slot = self.store.allocate(self)
+            self.position = self._position
+            self.previous_position = self._previous_position
+            self.velocity = self._velocity
+            self.radius = self._radius
+        self.add(self.containers)
+
+    def kill(self):
+        super().kill()
+        if self._slot >= 0:
+            self._position = self.position
+            self._previous_position = self.previous_position
+            self._velocity = self.velocity
+            self._radius = self.radius
+            self.store.release(self._slot)
+            self._slot = -1
@@ -1,52 +1,82 @@
 import pygame
-from entities.circleshape import CircleShape, point_in_triangle
+from entities.circleshape import (
+    CircleShape,
+    point_in_triangle,
+    wrapped_delta,
+)
 from systems.components import WeaponComponent
 from core import constants as const
+from core import controls
 
+# Contorno da nave com raio 1, apontando para +y antes da rotação
+SHIP_OUTLINE = ((0.0, 1.0), (1 / 1.5, -1.0), (-1 / 1.5, -1.0))
 
-class Player(CircleShape):
-    __slots__ = ['rotation', 'invulnerable', 'speed_boost', '_weapon']
 
-    def __init__(self, x: float, y: float) -> None:
+class Player(CircleShape):
+    __slots__ = [
+        'rotation',
+        'invulnerable',
+        'speed_boost',
+        'controller',
+        'actions',
+        '_weapon',
+    ]
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        controller: controls.Controller | None = None,
+    ) -> None:
         super().__init__(x, y, const.PLAYER_RADIUS)
         self.rotation = 0
         self.invulnerable = 0.0
         self.speed_boost = 0.0
+        self.controller = controller or controls.KeyboardController()
+        self.actions = 0
         self._weapon = WeaponComponent()
 
-    def triangle(self) -> list[pygame.Vector2]:
-        forward = pygame.Vector2(0, 1).rotate(self.rotation)
-        right = (
-            pygame.Vector2(0, 1).rotate(self.rotation + 90) * self.radius / 1.5
-        )
-        a = self.position + forward * self.radius
-        b = self.position - forward * self.radius - right
-        c = self.position - forward * self.radius + right
-        return [a, b, c]
-
-    def draw(self, screen: pygame.Surface):
+    def triangle(
+        self, position: pygame.Vector2 | None = None
+    ) -> list[pygame.Vector2]:
+        if position is None:
+            position = self.position
+        rotation = self.rotation
+        radius = self.radius
+        return [
+            position + pygame.Vector2(x, y).rotate(rotation) * radius
+            for x, y in SHIP_OUTLINE
+        ]
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
         pygame.draw.polygon(
             screen,
             'white',
-            self.triangle(),
+            self.triangle(self.render_position(alpha)),
             const.LINE_WIDTH,
         )
 
+    def read_controls(self) -> int:
+        """Poll the controller once per tick; ``update`` uses the result."""
+        self.actions = self.controller.poll()
+        return self.actions
+
     def rotate(self, dt: float) -> None:
         self.rotation += const.PLAYER_TURN_SPEED * dt
 
     def update(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
+        self.save_previous()
+        actions = self.actions
 
-        if keys[pygame.K_w]:
+        if actions & controls.THRUST:
             self.accelerate(dt)
-        if keys[pygame.K_a]:
+        if actions & controls.ROTATE_LEFT:
             self.rotate(-dt)
-        if keys[pygame.K_s]:
+        if actions & controls.REVERSE:
             self.accelerate(-dt)
-        if keys[pygame.K_d]:
+        if actions & controls.ROTATE_RIGHT:
             self.rotate(dt)
-        if keys[pygame.K_SPACE]:
+        if actions & controls.SHOOT:
             self.shoot()
 
         self.velocity *= const.PLAYER_FRICTION
@@ -67,7 +97,9 @@ class Player(CircleShape):
 
     def collides_with(self, other: CircleShape) -> bool:
         ship_triangle = self.triangle()
-        return point_in_triangle(other.position, ship_triangle)
+        # Imagem mais próxima do outro objeto no campo toroidal
+        point = self.position + wrapped_delta(self.position, other.position)
+        return point_in_triangle(point, ship_triangle)
 
     def shoot(self):
         self._weapon.shoot(self)
@@ -15,19 +15,20 @@ class PowerUp(CircleShape):
         self.power_type = power_type
         self.lifetime = 10.0
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
         color = (
             (100, 255, 100) if self.power_type == 'shield' else (100, 100, 255)
         )
         pygame.draw.circle(
             screen,
             color,
-            self.position,
+            self.render_position(alpha),
             self.radius,
             const.LINE_WIDTH,
         )
 
     def update(self, dt: float):
+        self.save_previous()
         self.position += self.velocity * dt
         self.wrap_position()
         self.lifetime -= dt
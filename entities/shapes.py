@@ -0,0 +1,244 @@
+"""
+Library of asteroid outlines, generated once and shared by all asteroids.
+
+The library holds ``SHAPE_TEMPLATES`` irregular polygons of unit radius,
+packed as (x, y) pairs in one flat array of doubles. It is drawn from its
+own generator seeded with ``SHAPE_SEED``, so the outlines are the same in
+every session. An asteroid keeps only a template index (picked from the
+``shapes`` RNG stream) and is drawn at its own radius.
+
+``OutlineCache`` keeps each (template, radius) outline rasterized once to
+a surface, so drawing an asteroid is a single blit.
+"""
+
+import math
+import random
+from array import array
+from collections import OrderedDict
+
+import pygame
+
+from core import constants as const
+
+OUTLINE_CACHE_SIZE = 1024  # Contornos escalados guardados por (índice, raio)
+
+
+def generate_outline(
+    stream: random.Random,
+    num_sides: int = 8,
+    irregularity: float = 0.3,
+    spikiness: float = 0.4,
+) -> list[float]:
+    """Random polygon of unit average radius, as flat (x, y) pairs."""
+    angle_step = 2 * math.pi / num_sides
+    angles = []
+
+    for i in range(num_sides):
+        base_angle = i * angle_step
+        noise = stream.uniform(-irregularity, irregularity) * angle_step * 0.5
+        angles.append(base_angle + noise)
+
+    angles.sort()
+
+    points = []
+    for angle in angles:
+        radius = max(1 + stream.uniform(-spikiness, spikiness), 0.3)
+        points.append(math.cos(angle) * radius)
+        points.append(math.sin(angle) * radius)
+    return points
+
+
+class ShapeLibrary:
+    """``count`` unit-radius outlines, reproducible from ``seed``."""
+
+    def __init__(
+        self, count: int = const.SHAPE_TEMPLATES, seed: int = const.SHAPE_SEED
+    ):
+        if not 0 < count <= 0xFFFF:
+            raise ValueError(f'Shape count must be 1-65535, got {count}')
+        self.count = count
+        self.seed = seed
+        self.points = array('d')
+        self.starts = array('I')  # Primeiro ponto de cada template
+        self.sizes = array('B')
+        stream = random.Random(seed)
+        for _ in range(count):
+            num_sides = stream.randint(8, 12)
+            self.starts.append(len(self.points) // 2)
+            self.sizes.append(num_sides)
+            self.points.extend(generate_outline(stream, num_sides))
+        self._outlines: dict[tuple[int, float], tuple] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def template(self, index: int) -> array:
+        """Unit-radius outline ``index`` as flat (x, y) pairs."""
+        start = 2 * self.starts[index]
+        return self.points[start : start + 2 * self.sizes[index]]
+
+    def outline(
+        self, index: int, radius: float
+    ) -> tuple[tuple[float, float], ...]:
+        """Outline ``index`` scaled to ``radius``, as offsets from the center.
+
+        Asteroids come in a few radii, so the scaled outlines are cached.
+        """
+        key = (index, radius)
+        outline = self._outlines.get(key)
+        if outline is None:
+            points = self.template(index)
+            outline = tuple(
+                (points[i] * radius, points[i + 1] * radius)
+                for i in range(0, len(points), 2)
+            )
+            if len(self._outlines) >= OUTLINE_CACHE_SIZE:
+                self._outlines.clear()
+            self._outlines[key] = outline
+        return outline
+
+
+# Biblioteca global
+_library: ShapeLibrary | None = None
+
+
+def get_shape_library() -> ShapeLibrary:
+    """Retorna a biblioteca global, criando-a na primeira chamada."""
+    global _library
+    if _library is None:
+        _library = ShapeLibrary()
+    return _library
+
+
+def seed_shape_library(
+    seed: int, count: int = const.SHAPE_TEMPLATES
+) -> ShapeLibrary:
+    """Replace the global library with one generated from ``seed``.
+
+    Cached outlines are dropped, since their indices refer to the old one.
+    """
+    global _library
+    _library = ShapeLibrary(count, seed)
+    if _outline_cache is not None:
+        _outline_cache.clear()
+    return _library
+
+
+class OutlineCache:
+    """LRU cache of pre-rendered outlines, keyed by (template, radius).
+
+    Holds at most ``capacity`` surfaces and rasterizes at most
+    ``builds_per_frame`` between two ``begin_frame`` calls; past that
+    budget ``get`` returns None and the caller draws the polygon itself, so
+    a burst of new shapes does not stall a frame. ``capacity=0`` disables
+    the cache.
+    """
+
+    # Chaves de stats() que só crescem (contadores, não níveis)
+    counters = ('hits', 'misses', 'builds', 'evictions')
+
+    def __init__(
+        self,
+        capacity: int = const.ASTEROID_SURFACE_CACHE,
+        builds_per_frame: int = const.ASTEROID_SURFACE_BUILDS_PER_FRAME,
+    ):
+        self.capacity = capacity
+        self.builds_per_frame = builds_per_frame
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.evictions = 0
+        self._budget = builds_per_frame
+        self._surfaces: OrderedDict[
+            tuple[int, float], tuple[pygame.Surface, int]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def begin_frame(self) -> None:
+        self._budget = self.builds_per_frame
+
+    def get(
+        self, index: int, radius: float
+    ) -> tuple[pygame.Surface, int] | None:
+        """Surface of an outline and the offset of its center, or None.
+
+        None means the outline is not cached and the build budget of this
+        frame is spent (or the cache is disabled).
+        """
+        key = (index, radius)
+        surfaces = self._surfaces
+        cached = surfaces.get(key)
+        if cached is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        if self._budget <= 0 or not self.capacity:
+            return None
+        self._budget -= 1
+        cached = surfaces[key] = self._rasterize(
+            get_shape_library().outline(index, radius)
+        )
+        self.builds += 1
+        if len(surfaces) > self.capacity:
+            surfaces.popitem(last=False)
+            self.evictions += 1
+        return cached
+
+    @staticmethod
+    def _rasterize(
+        outline: tuple[tuple[float, float], ...],
+    ) -> tuple[pygame.Surface, int]:
+        extent = max(max(abs(x), abs(y)) for x, y in outline)
+        half = math.ceil(extent) + const.LINE_WIDTH + 1
+        surface = pygame.Surface((2 * half + 1, 2 * half + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(
+            surface,
+            'white',
+            [(half + x, half + y) for x, y in outline],
+            const.LINE_WIDTH,
+        )
+        # Formato da tela para blits rápidos (só com um modo de vídeo ativo)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        # Quase tudo é transparente: com RLE o blit pula esses pixels em vez
+        # de misturá-los um a um
+        surface.set_alpha(255, pygame.RLEACCEL)
+        return surface, half
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'size': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'builds': self.builds,
+            'evictions': self.evictions,
+        }
+
+
+# Cache global de contornos
+_outline_cache: OutlineCache | None = None
+
+
+def get_outline_cache() -> OutlineCache:
+    """Retorna o cache global de contornos, criando-o na primeira chamada."""
+    global _outline_cache
+    if _outline_cache is None:
+        _outline_cache = OutlineCache()
+    return _outline_cache
+
+
+def reset_outline_cache(
+    capacity: int = const.ASTEROID_SURFACE_CACHE,
+    builds_per_frame: int = const.ASTEROID_SURFACE_BUILDS_PER_FRAME,
+) -> OutlineCache:
+    """Replace the global outline cache with an empty one."""
+    global _outline_cache
+    _outline_cache = OutlineCache(capacity, builds_per_frame)
+    return _outline_cache
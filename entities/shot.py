@@ -1,22 +1,25 @@
 import pygame
 
 from core import constants as const
-from entities.circleshape import CircleShape
+from entities.circleshape import StoredShape
 
 
-class Shot(CircleShape):
+class Shot(StoredShape):
+    ring_slot = -1  # Slot no ShotRing, -1 fora dele
+
     def __init__(self, x: float, y: float, radius: float):
         super().__init__(x, y, radius)
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
         pygame.draw.circle(
             screen,
             'white',
-            self.position,
+            self.render_position(alpha),
             const.SHOT_RADIUS,
             const.LINE_WIDTH,
         )
 
     def update(self, dt: float):
+        self.save_previous()
         self.position += self.velocity * dt
         self.wrap_position()
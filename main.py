@@ -1,20 +1,31 @@
-import sys
+import argparse
 import os
+import time
 
 import pygame
 
 from core import constants as const
 from core.game_state import GameState
 from core.events import events
-from entities.asteroid import Asteroid
+from core.snapshot import restore_world
+from core.world import World, create_world, world_stats
 from entities.player import Player
+from entities.shapes import get_outline_cache
 from entities.powerups import PowerUp
-from entities.shot import Shot
-from systems.asteroidfield import AsteroidField
-from systems.factory import EntityFactory
-from systems.spatial_grid import SpatialGrid
+from systems.collision import first_hits, gather_circles
+from systems.destruction import DestructionQueue
+from systems.entity_store import HAS_NUMPY, EntityStore
+from systems.broadphase import Broadphase
+from systems.shot_ring import ShotRing
 from utils.logger import log_event, log_state, setup_logging, log_info
+from utils.metrics import MetricsExporter
 from utils.particles import spawn_explosion
+from utils.profiler import NULL_PROFILER, FrameProfiler, NullProfiler
+from utils.replay import Replay, ReplayRecorder
+
+PLAYER_RESPAWN = events.intern('player_respawn')
+PLAYER_DIED = events.intern('player_died')
+POWERUP_COLLECTED = events.intern('powerup_collected')
 
 
 def handle_events() -> bool:
@@ -38,7 +49,7 @@ def handle_respawn(
         player.position.y = const.SCREEN_HEIGHT / 2
         player.velocity = pygame.Vector2(0, 0)
         player.invulnerable = const.PLAYER_RESPAWN_INVULNERABILITY
-        events.emit('player_respawn', player)
+        events.emit(PLAYER_RESPAWN, player)
 
 
 def handle_player_death(
@@ -55,50 +66,18 @@ def handle_player_death(
         [particles],
     )
 
-    events.emit('player_died', player)
+    events.emit(PLAYER_DIED, player)
 
     is_game_over = game_state.lose_life()
     if is_game_over:
         log_info(f'Game over! Final Score: {game_state.score}')
-        print('Game over!')
-        print(f'Final Score: {game_state.score}')
-        sys.exit()
+        return
 
     player.position.x = -1000
     player.position.y = -1000
     game_state.set_respawn_timer(2.0)
 
 
-def handle_asteroid_destroyed(
-    asteroid: Asteroid,
-    shot: Shot,
-    particles: pygame.sprite.Group,
-    game_state: GameState,
-    powerups: pygame.sprite.Group,
-) -> None:
-    log_event('asteroid_shot', score=asteroid.get_score())
-    game_state.add_score(asteroid.get_score())
-    spawn_explosion(
-        asteroid.position.x,
-        asteroid.position.y,
-        (255, 200, 50),
-        20,
-        [particles],
-    )
-
-    powerup = EntityFactory.spawn_explosion_powerup(asteroid.position)
-    if powerup:
-        powerups.add(powerup)
-
-    asteroid.split()
-    shot.kill()
-
-    events.emit(
-        'asteroid_destroyed',
-        {'asteroid': asteroid, 'score': asteroid.get_score()},
-    )
-
-
 def handle_powerup_collision(
     player: Player,
     powerup: PowerUp,
@@ -106,8 +85,35 @@ def handle_powerup_collision(
     log_event('powerup_collected', type=powerup.power_type)
     powerup.apply(player)
     events.emit(
-        'powerup_collected', {'player': player, 'type': powerup.power_type}
+        POWERUP_COLLECTED, {'player': player, 'type': powerup.power_type}
+    )
+
+
+def handle_shot_collisions_batched(
+    asteroids: pygame.sprite.Group,
+    shots: pygame.sprite.Group,
+    broadphase: Broadphase,
+    destruction: DestructionQueue,
+) -> None:
+    """Mesmos acertos do loop por tiro, calculados em uma passada."""
+    shot_list = shots.sprites()
+    asteroid_list = asteroids.sprites()
+    shot_positions, shot_radii = gather_circles(shot_list)
+    asteroid_positions, asteroid_radii = gather_circles(asteroid_list)
+
+    shot_indices, asteroid_indices = first_hits(
+        shot_positions,
+        shot_radii,
+        asteroid_positions,
+        asteroid_radii,
+        broadphase=broadphase,
     )
+    for shot_index, asteroid_index in zip(
+        shot_indices.tolist(), asteroid_indices.tolist()
+    ):
+        destruction.record(
+            asteroid_list[asteroid_index], shot_list[shot_index]
+        )
 
 
 def handle_collisions_optimized(
@@ -117,18 +123,24 @@ def handle_collisions_optimized(
     particles: pygame.sprite.Group,
     powerups: pygame.sprite.Group,
     game_state: GameState,
-    spatial_grid: SpatialGrid,
+    broadphase: Broadphase,
+    destruction: DestructionQueue | None = None,
 ) -> None:
-    """Otimizado usando spatial grid - O(n) em vez de O(n²)."""
-    spatial_grid.clear()
+    """Otimizado usando um broadphase - O(n) em vez de O(n²).
+
+    Shot hits are only recorded in ``destruction`` and resolved by the
+    caller; without a queue they are resolved before returning.
+    """
+    resolve = destruction is None
+    if resolve:
+        destruction = DestructionQueue()
 
-    # Inserir todos os asteróides no grid
-    for asteroid in asteroids:
-        spatial_grid.insert(asteroid)
+    # Inserir (ou mover, no modo persistente) os asteróides no broadphase
+    broadphase.rebuild(asteroids)
 
     # Verificar colisões player-asteroid
     if game_state.respawn_timer <= 0:
-        nearby_asteroids = spatial_grid.get_nearby(
+        nearby_asteroids = broadphase.get_nearby(
             player.position, player.radius
         )
         for asteroid in nearby_asteroids:
@@ -137,19 +149,33 @@ def handle_collisions_optimized(
                 break
 
     # Verificar colisões shot-asteroid (otimizado)
-    for shot in shots:
-        nearby_asteroids = spatial_grid.get_nearby(shot.position, shot.radius)
-        for asteroid in nearby_asteroids:
-            if shot.collides_with(asteroid):
-                handle_asteroid_destroyed(
-                    asteroid, shot, particles, game_state, powerups
-                )
-                break
+    if (
+        HAS_NUMPY
+        and const.BATCH_COLLISIONS_ENABLED
+        and len(asteroids) <= const.BATCH_COLLISIONS_MAX_ASTEROIDS
+    ):
+        handle_shot_collisions_batched(
+            asteroids, shots, broadphase, destruction
+        )
+    else:
+        for shot in shots:
+            nearby_asteroids = broadphase.get_nearby(
+                shot.position, shot.radius
+            )
+            for asteroid in nearby_asteroids:
+                if shot.collides_with(asteroid):
+                    destruction.record(asteroid, shot)
+                    break
 
-    # Verificar colisões player-powerup
-    for powerup in powerups:
-        if powerup.collides_with(player):
-            handle_powerup_collision(player, powerup)
+    # Verificar colisões player-powerup (a posição fora da tela usada no
+    # respawn daria a volta no campo toroidal)
+    if game_state.respawn_timer <= 0:
+        for powerup in powerups:
+            if powerup.collides_with(player):
+                handle_powerup_collision(player, powerup)
+
+    if resolve:
+        destruction.resolve(particles, game_state, powerups)
 
 
 def update_game_state(
@@ -158,21 +184,33 @@ def update_game_state(
     player: Player,
     game_state: GameState,
     dt: float,
+    stores: tuple[EntityStore, ...] = (),
+    profiler: FrameProfiler | NullProfiler = NULL_PROFILER,
+    shot_ring: ShotRing | None = None,
 ) -> None:
     handle_respawn(player, game_state, dt)
 
     if game_state.respawn_timer <= 0:
+        # Tiros vencidos saem antes de serem integrados
+        if shot_ring is not None:
+            shot_ring.tick(dt)
+        # Antes do updatable, para não integrar os tiros recém-criados
+        for store in stores:
+            store.update(dt)
         updatable.update(dt)
 
-    particles.update(dt)
+    with profiler.phase('particles'):
+        particles.update(dt)
 
 
-def draw_player(screen: pygame.Surface, player: Player) -> None:
+def draw_player(
+    screen: pygame.Surface, player: Player, alpha: float = 1.0
+) -> None:
     if player.invulnerable > 0:
         if int(player.invulnerable * 10) % 2 == 0:
-            player.draw(screen)
+            player.draw(screen, alpha)
     else:
-        player.draw(screen)
+        player.draw(screen, alpha)
 
 
 def draw_ui(
@@ -195,83 +233,178 @@ def render(
     player: Player,
     font: pygame.font.Font,
     game_state: GameState,
+    alpha: float = 1.0,
 ) -> None:
+    """Draw the world, interpolated ``alpha`` of the way into the tick.
+
+    Every sprite is drawn once through its own ``draw(screen, alpha)``:
+    asteroids and shots from ``drawable``, then the particles, power-ups
+    and player on top.
+    """
+    get_outline_cache().begin_frame()
     if background:
         screen.blit(background, (0, 0))
     else:
         screen.fill('black')
 
     for obj in drawable:
-        obj.draw(screen)
+        obj.draw(screen, alpha)
 
     for particle in particles:
         screen.blit(particle.image, particle.rect)
 
     for powerup in powerups:
-        powerup.draw(screen)
+        powerup.draw(screen, alpha)
 
-    draw_player(screen, player)
+    # Fora da tela enquanto aguarda o respawn
+    if game_state.respawn_timer <= 0:
+        draw_player(screen, player, alpha)
     draw_ui(screen, font, game_state)
 
-    pygame.display.flip()
 
+def log_world_state(world: World) -> None:
+    log_state(**world_stats(world))
 
-def game_loop(
-    player: Player,
-    updatable: pygame.sprite.Group,
-    drawable: pygame.sprite.Group,
-    asteroids: pygame.sprite.Group,
-    shots: pygame.sprite.Group,
-    particles: pygame.sprite.Group,
-    powerups: pygame.sprite.Group,
-    background: pygame.Surface | None,
-    game_state: GameState,
-) -> None:
-    screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
-    clock = pygame.time.Clock()
-    font = pygame.font.Font(None, 36)
-    spatial_grid = SpatialGrid(cell_size=100.0)
 
-    dt = 0
-    frame_count = 0
+def publish_metrics(world: World, frame_seconds: float, dt: float) -> None:
+    """Hand the metrics server this frame's time and a state snapshot."""
+    world.metrics.observe_frame(frame_seconds)
+    world.metrics.publish(world_stats(world), world.frame * dt)
 
-    while True:
-        frame_count += 1
-        if frame_count % 60 == 0:  # Log a cada segundo
-            log_state(
-                score=game_state.score,
-                lives=game_state.lives,
-                asteroids=len(asteroids),
-                shots=len(shots),
-            )
 
-        if not handle_events():
-            return
+def step_world(world: World, dt: float) -> None:
+    """Advance the simulation by one frame, without rendering."""
+    # Entrada lida uma vez por tick, antes de tudo: é o que o replay grava
+    # (com um keyframe do estado antes do tick, quando for a vez)
+    actions = world.player.read_controls()
+    if world.recorder is not None:
+        world.recorder.record(actions, world)
+
+    world.frame += 1
+    if world.frame % const.TICK_RATE == 0:  # Log a cada segundo
+        log_world_state(world)
+        world.broadphase.retune(
+            asteroid.radius for asteroid in world.asteroids
+        )
 
-        update_game_state(updatable, particles, player, game_state, dt)
+    profiler = world.profiler
+    with profiler.phase('update'):
+        update_game_state(
+            world.updatable,
+            world.particles,
+            world.player,
+            world.game_state,
+            dt,
+            world.stores,
+            profiler,
+            world.shot_ring,
+        )
 
+    with profiler.phase('collisions'):
         handle_collisions_optimized(
-            player,
-            asteroids,
-            shots,
-            particles,
-            powerups,
-            game_state,
-            spatial_grid,
+            world.player,
+            world.asteroids,
+            world.shots,
+            world.particles,
+            world.powerups,
+            world.game_state,
+            world.broadphase,
+            world.destruction,
         )
 
-        render(
-            screen,
-            background,
-            drawable,
-            particles,
-            powerups,
-            player,
-            font,
-            game_state,
+    with profiler.phase('destruction'):
+        world.destruction.resolve(
+            world.particles, world.game_state, world.powerups
         )
 
-        dt = clock.tick(60) / 1000
+    # Modo 'queued': os handlers rodam aqui, fora do laço de colisões
+    events.drain()
+    # Só agora ninguém mais segura os asteroides mortos neste tick
+    if world.asteroid_pool is not None:
+        world.asteroid_pool.collect()
+
+    if world.rewind is not None:
+        world.rewind.push(world)
+
+
+def game_loop(world: World, background: pygame.Surface | None) -> None:
+    screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+    clock = pygame.time.Clock()
+    font = pygame.font.Font(None, 36)
+
+    # Passo fixo: a simulação avança em ticks de tick_dt, independente do
+    # FPS; a renderização interpola entre os dois últimos ticks
+    tick_dt = 1 / const.TICK_RATE
+    accumulator = 0.0
+    profiler = world.profiler
+
+    while True:
+        with profiler.phase('events'):
+            running = handle_events()
+        if not running:
+            return
+
+        raw_frame_time = clock.tick(const.FPS) / 1000
+        frame_time = min(raw_frame_time, const.MAX_FRAME_TIME)
+        accumulator += frame_time
+        while accumulator >= tick_dt:
+            step_world(world, tick_dt)
+            accumulator -= tick_dt
+
+            if world.game_state.game_over:
+                print('Game over!')
+                print(f'Final Score: {world.game_state.score}')
+                return
+
+        with profiler.phase('render'):
+            render(
+                screen,
+                background,
+                world.drawable,
+                world.particles,
+                world.powerups,
+                world.player,
+                font,
+                world.game_state,
+                accumulator / tick_dt,
+            )
+            profiler.draw(screen)
+
+        with profiler.phase('flip'):
+            pygame.display.flip()
+        profiler.end_frame()
+        if world.metrics is not None:
+            publish_metrics(world, raw_frame_time, tick_dt)
+
+
+def run_headless(world: World, frames: int, dt: float) -> dict[str, float]:
+    """Step the simulation with a fixed dt, no display and no frame cap.
+
+    Stops at frame ``frames`` or at game over and returns timing stats
+    for the steps taken.
+    """
+    first_frame = world.frame
+    start = time.perf_counter()
+    profiler = world.profiler
+    previous = start
+    while world.frame < frames and not world.game_state.game_over:
+        step_world(world, dt)
+        profiler.end_frame()
+        if world.metrics is not None:
+            now = time.perf_counter()
+            publish_metrics(world, now - previous, dt)
+            previous = now
+    elapsed = time.perf_counter() - start
+    steps = world.frame - first_frame
+
+    return {
+        'frames': steps,
+        'simulated_seconds': steps * dt,
+        'wall_seconds': elapsed,
+        'steps_per_second': steps / elapsed if elapsed > 0 else 0.0,
+        'score': world.game_state.score,
+        'game_over': world.game_state.game_over,
+    }
 
 
 def load_background() -> pygame.Surface | None:
@@ -289,8 +422,183 @@ def load_background() -> pygame.Surface | None:
         return None
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Asteroids')
+    parser.add_argument(
+        '--headless',
+        action='store_true',
+        help='simulate without a window or frame cap',
+    )
+    parser.add_argument(
+        '--frames',
+        type=int,
+        default=const.TICK_RATE * 60,
+        help='frames to simulate in headless mode',
+    )
+    parser.add_argument(
+        '--dt',
+        type=float,
+        default=1 / const.TICK_RATE,
+        help='fixed time step in headless mode (seconds)',
+    )
+    parser.add_argument('--seed', type=int, help='seed the RNG streams')
+    parser.add_argument('--record', help='write an input replay here')
+    parser.add_argument(
+        '--replay',
+        help='play a replay back headless and verify the final score',
+    )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        help='serve Prometheus metrics on this local port',
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='time each frame phase (overlay, or a summary when headless)',
+    )
+    parser.add_argument(
+        '--trace',
+        help='write per-frame phase timings to a .csv or .jsonl file',
+    )
+    parser.add_argument(
+        '--start',
+        type=int,
+        default=0,
+        help='frame to seek to before playing the replay',
+    )
+    return parser.parse_args()
+
+
+def print_headless_stats(stats: dict[str, float]) -> None:
+    print(
+        f'{stats["frames"]} frames ({stats["simulated_seconds"]:.1f}s '
+        f'simulated) in {stats["wall_seconds"]:.2f}s: '
+        f'{stats["steps_per_second"]:.0f} steps/s, '
+        f'score {stats["score"]}'
+    )
+
+
+def seek_replay(replay: Replay, frame: int) -> World:
+    """World at ``frame`` of a replay.
+
+    Restores the latest keyframe before it and simulates the remaining
+    ticks, so the cost is bounded by the keyframe interval.
+    """
+    controller = replay.controller()
+    world = create_world(controller, replay.seed)
+    keyframe = replay.keyframe_before(frame)
+    if keyframe is not None:
+        restore_world(world, keyframe)
+        controller.frame = world.frame
+    while world.frame < frame:
+        step_world(world, replay.dt)
+    return world
+
+
+def play_replay(path: str, start: int = 0) -> bool:
+    """Re-simulate a replay headless; True if it matches the recording."""
+    with Replay(path) as replay:
+        seek_started = time.perf_counter()
+        world = seek_replay(replay, min(start, replay.frames))
+        if start:
+            print(
+                f'Seeked to frame {world.frame} in '
+                f'{(time.perf_counter() - seek_started) * 1000:.1f} ms'
+            )
+        stats = run_headless(world, replay.frames, replay.dt)
+        log_info('Replay finished', replay=path, **stats)
+        print_headless_stats(stats)
+        return verify_replay(replay, world)
+
+
+def verify_replay(replay: Replay, world: World) -> bool:
+    """Compare a finished playback with the recording's trailer."""
+    if replay.final_score is None:
+        print('Replay has no trailer (interrupted recording), not verified')
+        return True
+    matches = (
+        world.frame == replay.frames
+        and world.game_state.score == replay.final_score
+    )
+    if matches:
+        print('Replay verified')
+    else:
+        print(
+            f'Replay diverged: expected score {replay.final_score}, '
+            f'got {world.game_state.score}'
+        )
+    return matches
+
+
+def default_replay_path() -> str:
+    return os.path.join(
+        const.REPLAY_DIRECTORY, time.strftime('%Y%m%d-%H%M%S.replay')
+    )
+
+
+def create_profiler(
+    args: argparse.Namespace,
+) -> FrameProfiler | NullProfiler:
+    if args.profile or args.trace:
+        return FrameProfiler(trace_path=args.trace)
+    return NULL_PROFILER
+
+
+def create_metrics(args: argparse.Namespace) -> MetricsExporter | None:
+    if args.metrics_port is None:
+        return None
+    metrics = MetricsExporter(args.metrics_port)
+    log_info(
+        f'Serving metrics on http://{metrics.host}:{metrics.port}/metrics'
+    )
+    return metrics
+
+
+def print_profile(profiler: FrameProfiler) -> None:
+    print(f'{"phase (ms)":<12}{"p50":>8}{"p95":>8}{"p99":>8}')
+    for name, row in profiler.summary().items():
+        print(f'{name:<12}{row[50]:>8.3f}{row[95]:>8.3f}{row[99]:>8.3f}')
+
+
+def close_world(world: World) -> None:
+    """Finish the replay, the profiler trace and the metrics server."""
+    if world.recorder is not None:
+        world.recorder.close(world.game_state.score)
+    world.profiler.close()
+    if world.metrics is not None:
+        world.metrics.close()
+
+
 def main() -> None:
-    setup_logging()
+    args = parse_args()
+    setup_logging(const.TELEMETRY_FORMAT)
+
+    if args.replay or args.headless:
+        # Driver de vídeo nulo: pygame.key funciona sem abrir janela
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+
+    if args.replay:
+        if not play_replay(args.replay, args.start):
+            raise SystemExit(1)
+        return
+
+    if args.headless:
+        world = create_world(seed=args.seed)
+        world.profiler = create_profiler(args)
+        world.metrics = create_metrics(args)
+        if args.record:
+            world.recorder = ReplayRecorder(args.record, world.seed, args.dt)
+        try:
+            stats = run_headless(world, args.frames, args.dt)
+        finally:
+            close_world(world)
+        log_info('Headless run finished', **stats)
+        print_headless_stats(stats)
+        if world.profiler.enabled:
+            print_profile(world.profiler)
+        return
 
     log_info(
         'Starting Asteroids',
@@ -306,40 +614,20 @@ def main() -> None:
     pygame.init()
 
     background = load_background()
-    game_state = GameState()
-
-    updatable = pygame.sprite.Group()
-    drawable = pygame.sprite.Group()
-    asteroids = pygame.sprite.Group()
-    shots = pygame.sprite.Group()
-    particles = pygame.sprite.Group()
-    powerups = pygame.sprite.Group()
-
-    Shot.containers = (shots, updatable, drawable)
-
-    Asteroid.containers = (asteroids, updatable, drawable)
-    AsteroidField.containers = updatable
-    AsteroidField()
-
-    PowerUp.containers = (powerups, updatable, drawable)
-
-    Player.containers = (updatable, drawable)
-    player = Player(
-        const.SCREEN_WIDTH / 2,
-        const.SCREEN_HEIGHT / 2,
-    )
-
-    game_loop(
-        player,
-        updatable,
-        drawable,
-        asteroids,
-        shots,
-        particles,
-        powerups,
-        background,
-        game_state,
-    )
+    world = create_world(seed=args.seed)
+    world.profiler = create_profiler(args)
+    world.metrics = create_metrics(args)
+    if args.record or const.RECORD_REPLAYS:
+        world.recorder = ReplayRecorder(
+            args.record or default_replay_path(),
+            world.seed,
+            1 / const.TICK_RATE,
+        )
+        log_info('Recording replay', path=str(world.recorder.path))
+    try:
+        game_loop(world, background)
+    finally:
+        close_world(world)
 
 
 if __name__ == '__main__':
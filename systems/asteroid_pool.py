@@ -0,0 +1,73 @@
+"""
+Free list of killed asteroids, reset instead of reallocated.
+
+``Asteroid.kill`` hands a pooled asteroid back automatically. Released
+asteroids only become reusable after ``collect``, which the game calls
+once at the end of every tick: until then the broadphase, the destruction
+queue and queued event handlers may still hold the killed asteroid, so it
+must not reappear under them as one of its own fragments.
+"""
+
+from core import constants as const
+from entities.asteroid import Asteroid
+
+
+class AsteroidPool:
+    """Asteroids of one world; keeps at most ``capacity`` free ones."""
+
+    # Chaves de stats() que só crescem (contadores, não níveis)
+    counters = ('allocated', 'reused', 'discarded')
+
+    def __init__(self, capacity: int = const.ASTEROID_POOL_CAPACITY):
+        self.capacity = capacity
+        self.allocated = 0
+        self.reused = 0
+        self.discarded = 0
+        self._free: list[Asteroid] = []
+        self._pending: list[Asteroid] = []
+
+    def acquire(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        shape: int | None = None,
+    ) -> Asteroid:
+        """Asteroid at rest at (x, y), with a new shape unless given one."""
+        if self._free:
+            asteroid = self._free.pop()
+            asteroid.reset(x, y, radius, shape)
+            self.reused += 1
+            return asteroid
+
+        asteroid = Asteroid(x, y, radius)
+        asteroid.pool = self
+        if shape is not None:
+            asteroid.shape = shape
+        self.allocated += 1
+        return asteroid
+
+    def release(self, asteroid: Asteroid) -> None:
+        """Take back a killed asteroid (``Asteroid.kill`` calls this)."""
+        self._pending.append(asteroid)
+
+    def collect(self) -> None:
+        """Make the asteroids released since the last call reusable."""
+        if not self._pending:
+            return
+        room = self.capacity - len(self._free)
+        if room < len(self._pending):
+            self.discarded += len(self._pending) - max(room, 0)
+            del self._pending[max(room, 0) :]
+        self._free.extend(self._pending)
+        self._pending.clear()
+
+    def stats(self) -> dict[str, float]:
+        acquired = self.allocated + self.reused
+        return {
+            'free': len(self._free),
+            'allocated': self.allocated,
+            'reused': self.reused,
+            'discarded': self.discarded,
+            'hit_rate': self.reused / acquired if acquired else 0.0,
+        }
@@ -1,9 +1,8 @@
-import random
-
 import pygame
 
 from core import constants as const
-from entities.asteroid import Asteroid
+from core import rng
+from systems.factory import EntityFactory
 
 
 class AsteroidField(pygame.sprite.Sprite):
@@ -41,8 +40,7 @@ class AsteroidField(pygame.sprite.Sprite):
         self.spawn_timer = 0.0
 
     def spawn(self, radius, position, velocity):
-        asteroid = Asteroid(position.x, position.y, radius)
-        asteroid.velocity = velocity
+        EntityFactory.create_asteroid(position, radius, velocity)
 
     def update(self, dt):
         self.spawn_timer += dt
@@ -50,10 +48,10 @@ class AsteroidField(pygame.sprite.Sprite):
             self.spawn_timer = 0
 
             # Spawn a new asteroid at a random edge
-            edge = random.choice(self.edges)
-            speed = random.randint(40, 100)
+            edge = rng.field.choice(self.edges)
+            speed = rng.field.randint(40, 100)
             velocity = edge[0] * speed
-            velocity = velocity.rotate(random.randint(-30, 30))
-            position = edge[1](random.uniform(0, 1))
-            kind = random.randint(1, const.ASTEROID_KINDS)
+            velocity = velocity.rotate(rng.field.randint(-30, 30))
+            position = edge[1](rng.field.uniform(0, 1))
+            kind = rng.field.randint(1, const.ASTEROID_KINDS)
             self.spawn(const.ASTEROID_MIN_RADIUS * kind, position, velocity)
@@ -0,0 +1,211 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
+import pygame
+
+from core import constants as const
+from entities.circleshape import CircleShape
+from systems.entity_store import np
+
+
+class Broadphase(ABC):
+    """Abstract base class for collision broadphase structures.
+
+    A broadphase is rebuilt from the asteroids once per frame and then
+    answers ``get_nearby`` queries with a superset of the objects that can
+    collide. ``candidate_order`` is the vectorized counterpart used by the
+    batched narrowphase and must agree with ``get_nearby`` on both the
+    candidate set and its order.
+    """
+
+    name = 'broadphase'
+
+    def __init__(self):
+        self.queries = 0
+        self.candidates = 0
+
+    @abstractmethod
+    def rebuild(self, objects: Iterable[CircleShape]) -> None:
+        """Bring the structure up to date with the current objects."""
+
+    @abstractmethod
+    def get_nearby(
+        self, position: pygame.Vector2, radius: float
+    ) -> list[CircleShape]:
+        """Return collision candidates for a circle, in a stable order."""
+
+    @abstractmethod
+    def candidate_order(
+        self, query_positions, query_radii, positions, radii, queries, objects
+    ):
+        """Rank (query, object) pairs as ``get_nearby`` would (needs numpy).
+
+        ``queries`` and ``objects`` index one pair per entry into the query
+        and object arrays, objects in the order given to ``rebuild``.
+        Returns one int64 rank per pair; among the pairs of one query the
+        lower rank comes first, and -1 marks pairs that are not candidates.
+        """
+
+    def clear(self) -> None:
+        """Drop every object."""
+
+    def retune(self, radii: Iterable[float], tolerance: float = 0.25) -> bool:
+        """Adapt to the live radius distribution. Returns True if changed."""
+        return False
+
+    def stats(self) -> dict[str, float]:
+        """Counters since the last rebuild."""
+        return {'queries': self.queries, 'candidates': self.candidates}
+
+
+class BruteForce(Broadphase):
+    """Reference broadphase: every object is a candidate."""
+
+    name = 'brute'
+
+    def __init__(self):
+        super().__init__()
+        self._objects: list[CircleShape] = []
+
+    def rebuild(self, objects: Iterable[CircleShape]) -> None:
+        self.queries = 0
+        self.candidates = 0
+        self._objects = list(objects)
+
+    def clear(self) -> None:
+        self._objects = []
+
+    def get_nearby(
+        self, position: pygame.Vector2, radius: float
+    ) -> list[CircleShape]:
+        self.queries += 1
+        self.candidates += len(self._objects)
+        return list(self._objects)
+
+    def candidate_order(
+        self, query_positions, query_radii, positions, radii, queries, objects
+    ):
+        self.queries += len(query_radii)
+        self.candidates += len(objects)
+        return objects.astype(np.int64)
+
+
+def _wrapped_gap(delta: float, size: float) -> float:
+    """Absolute shortest distance along one wrapping axis."""
+    half = size / 2
+    return abs((delta + half) % size - half)
+
+
+class SortAndSweep(Broadphase):
+    """Objects sorted by x; queries bisect the x window and test boxes.
+
+    Candidates are the objects whose wrapped bounding box overlaps the
+    query's, returned in ascending x order (measured on the screen).
+    Cheap for objects spread along x, poor for tall vertical clusters.
+    """
+
+    name = 'sweep'
+
+    def __init__(self):
+        super().__init__()
+        self._objects: list[CircleShape] = []
+        self._xs: list[float] = []
+        self._max_radius = 0.0
+
+    def rebuild(self, objects: Iterable[CircleShape]) -> None:
+        self.queries = 0
+        self.candidates = 0
+        width = const.SCREEN_WIDTH
+        keyed = sorted(
+            ((obj.position.x % width, obj) for obj in objects),
+            key=lambda item: item[0],
+        )
+        self._xs = [x for x, _ in keyed]
+        self._objects = [obj for _, obj in keyed]
+        self._max_radius = max(
+            (obj.radius for obj in self._objects), default=0.0
+        )
+
+    def clear(self) -> None:
+        self._objects = []
+        self._xs = []
+        self._max_radius = 0.0
+
+    def _window(self, x: float, radius: float) -> list[int]:
+        """Sorted indices whose center may lie within reach of x."""
+        width = const.SCREEN_WIDTH
+        # Margem de 1px: o teste exato vem depois
+        reach = radius + self._max_radius + 1.0
+        if 2 * reach >= width:
+            return list(range(len(self._xs)))
+
+        x %= width
+        lo, hi = x - reach, x + reach
+        indices = list(
+            range(bisect_left(self._xs, lo), bisect_right(self._xs, hi))
+        )
+        if lo < 0:
+            start = bisect_left(self._xs, lo + width)
+            indices.extend(range(start, len(self._xs)))
+        elif hi >= width:
+            indices[:0] = range(bisect_right(self._xs, hi - width))
+        return indices
+
+    def get_nearby(
+        self, position: pygame.Vector2, radius: float
+    ) -> list[CircleShape]:
+        width, height = const.SCREEN_WIDTH, const.SCREEN_HEIGHT
+        nearby = []
+        for index in self._window(position.x, radius):
+            obj = self._objects[index]
+            reach = radius + obj.radius
+            if (
+                _wrapped_gap(obj.position.x - position.x, width) <= reach
+                and _wrapped_gap(obj.position.y - position.y, height) <= reach
+            ):
+                nearby.append(obj)
+
+        self.queries += 1
+        self.candidates += len(nearby)
+        return nearby
+
+    def candidate_order(
+        self, query_positions, query_radii, positions, radii, queries, objects
+    ):
+        width, height = const.SCREEN_WIDTH, const.SCREEN_HEIGHT
+        reach = query_radii[queries] + radii[objects]
+        inside = np.ones(len(objects), dtype=bool)
+        for axis, size in ((0, width), (1, height)):
+            delta = positions[objects, axis] - query_positions[queries, axis]
+            gap = np.abs(np.mod(delta + size / 2, size) - size / 2)
+            inside &= gap <= reach
+
+        # Posição de cada objeto na ordenação estável por x; só os objetos
+        # dos pares, em ordem de índice, o que preserva a ordem relativa
+        members, inverse = np.unique(objects, return_inverse=True)
+        sort_order = np.argsort(
+            np.mod(positions[members, 0], width), kind='stable'
+        )
+        rank = np.empty(len(members), dtype=np.int64)
+        rank[sort_order] = np.arange(len(members))
+        order = rank[inverse]
+        order[~inside] = -1
+
+        self.queries += len(query_radii)
+        self.candidates += int(inside.sum())
+        return order
+
+
+def create_broadphase(name: str, **kwargs) -> Broadphase:
+    """Build a broadphase backend by name: 'grid', 'sweep' or 'brute'."""
+    from systems.spatial_grid import SpatialGrid
+
+    backends = {
+        SpatialGrid.name: SpatialGrid,
+        SortAndSweep.name: SortAndSweep,
+        BruteForce.name: BruteForce,
+    }
+    if name not in backends:
+        raise ValueError(f'Unknown broadphase: {name}')
+    return backends[name](**kwargs)
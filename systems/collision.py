@@ -0,0 +1,181 @@
+"""
+Vectorized narrowphase for shot versus asteroid collisions.
+
+Requires numpy; callers check ``HAS_NUMPY`` from ``systems.entity_store``
+and keep the per-shot loop otherwise.
+"""
+
+from collections.abc import Sequence
+
+from core import constants as const
+from entities.circleshape import CircleShape
+from systems.entity_store import np
+
+
+def gather_circles(entities: Sequence[CircleShape]):
+    """Return (positions, radii) arrays in the order of ``entities``."""
+    count = len(entities)
+    if count == 0:
+        return np.empty((0, 2)), np.empty(0)
+
+    store = getattr(entities[0], 'store', None)
+    if store is not None and all(e._slot >= 0 for e in entities):
+        slots = np.fromiter((e._slot for e in entities), np.intp, count)
+        return store.positions[slots], store.radii[slots]
+
+    data = np.array(
+        [(e.position.x, e.position.y, e.radius) for e in entities],
+        dtype=np.float64,
+    )
+    return data[:, :2], data[:, 2]
+
+
+def _wrapped(delta, size: float):
+    """``(delta + size / 2) % size - size / 2`` with Python float semantics.
+
+    Deltas between on-screen positions stay within one lap, where the
+    modulo reduces to a single add or subtract; np.mod is only needed for
+    entities parked far outside the playfield.
+    """
+    half = size / 2
+    shifted = delta + half
+    if shifted.size and (shifted.min() < -size or shifted.max() >= 2 * size):
+        return np.mod(shifted, size) - half
+    wrapped = np.where(
+        shifted < 0,
+        shifted + size,
+        np.where(shifted >= size, shifted - size, shifted),
+    )
+    return wrapped - half
+
+
+def _candidate_pairs(shot_positions, reach, asteroid_positions):
+    """Shot-asteroid pairs whose wrapped distance may be within reach.
+
+    Asteroids are bucketed by center into wrapping cells at least
+    ``reach`` wide; each shot takes the 3 x 3 cells around its own, each
+    one a contiguous run of the cell-sorted asteroids, expanded into flat
+    index arrays without a Python loop. Pairs come grouped by shot, in
+    ascending shot order.
+    """
+    width, height = const.SCREEN_WIDTH, const.SCREEN_HEIGHT
+    num_shots = len(shot_positions)
+    num_asteroids = len(asteroid_positions)
+    columns = int(width // reach)
+    rows = int(height // reach)
+    if columns < 3 or rows < 3:
+        # Vizinhanças 3 x 3 se repetiriam: todos os pares
+        shots = np.repeat(np.arange(num_shots), num_asteroids)
+        asteroids = np.tile(np.arange(num_asteroids), num_shots)
+        return shots, asteroids
+
+    def cells(positions):
+        x = np.mod(positions[:, 0], width) * (columns / width)
+        y = np.mod(positions[:, 1], height) * (rows / height)
+        return x.astype(np.intp) % columns, y.astype(np.intp) % rows
+
+    column, row = cells(asteroid_positions)
+    keys = column * rows + row
+    order = np.argsort(keys, kind='stable')
+    counts = np.bincount(keys, minlength=columns * rows)
+    firsts = np.cumsum(counts) - counts
+
+    column, row = cells(shot_positions)
+    neighbours = np.stack(
+        [
+            ((column + dx) % columns) * rows + (row + dy) % rows
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+        ],
+        axis=1,
+    ).ravel()
+    starts = firsts[neighbours]
+    lengths = counts[neighbours]
+    owners = np.repeat(np.arange(num_shots), 9)
+
+    total = int(lengths.sum())
+    offsets = np.cumsum(lengths) - lengths
+    within = np.arange(total) - np.repeat(offsets, lengths)
+    shots = np.repeat(owners, lengths)
+    asteroids = order[np.repeat(starts, lengths) + within]
+    return shots, asteroids
+
+
+def first_hits(
+    shot_positions,
+    shot_radii,
+    asteroid_positions,
+    asteroid_radii,
+    broadphase=None,
+):
+    """Find the first asteroid hit by each shot.
+
+    A pair collides when the wrapped center distance is below the sum of
+    radii, exactly as ``CircleShape.collides_with``. When ``broadphase``
+    is given, the first hit follows its ``get_nearby`` order, so the
+    result matches the per-shot loop; otherwise the lowest asteroid index
+    wins. The broadphase is only consulted for shots that hit more than
+    one asteroid, and must return every colliding object as a candidate.
+
+    Returns two index arrays ``(shot_indices, asteroid_indices)`` sorted
+    by shot index, with at most one entry per shot.
+    """
+    empty = np.empty(0, dtype=np.intp)
+    if len(shot_radii) == 0 or len(asteroid_radii) == 0:
+        return empty, empty
+
+    # Margem de 1px nas células; o teste exato vem depois
+    reach = float(shot_radii.max() + asteroid_radii.max()) + 1.0
+    shots, asteroids = _candidate_pairs(
+        shot_positions, reach, asteroid_positions
+    )
+
+    # Colunas contíguas: gathers 1-D saem bem mais baratos que os de linhas
+    dx = _wrapped(
+        np.ascontiguousarray(asteroid_positions[:, 0])[asteroids]
+        - np.ascontiguousarray(shot_positions[:, 0])[shots],
+        const.SCREEN_WIDTH,
+    )
+    dy = _wrapped(
+        np.ascontiguousarray(asteroid_positions[:, 1])[asteroids]
+        - np.ascontiguousarray(shot_positions[:, 1])[shots],
+        const.SCREEN_HEIGHT,
+    )
+    hit = np.sqrt(dx * dx + dy * dy) < (
+        shot_radii[shots] + asteroid_radii[asteroids]
+    )
+    shots, asteroids = shots[hit], asteroids[hit]
+    if len(shots) == 0:
+        return empty, empty
+
+    # Pares já agrupados por tiro: o menor índice de cada grupo vence
+    first = np.flatnonzero(np.r_[True, shots[1:] != shots[:-1]])
+    hit_shots = shots[first]
+    best = np.minimum.reduceat(asteroids, first)
+
+    counts = np.diff(np.r_[first, len(shots)])
+    tied = np.flatnonzero(counts > 1)
+    if broadphase is not None and len(tied):
+        # Só os pares (tiro, asteroide) dos tiros empatados são ranqueados
+        row = np.full(len(hit_shots), -1)
+        row[tied] = np.arange(len(tied))
+        pair_rows = np.repeat(row, counts)
+        keep = pair_rows >= 0
+        queries = pair_rows[keep]
+        contenders = asteroids[keep]
+        rank = broadphase.candidate_order(
+            shot_positions[hit_shots[tied]],
+            shot_radii[hit_shots[tied]],
+            asteroid_positions,
+            asteroid_radii,
+            queries,
+            contenders,
+        )
+        rank[rank < 0] = np.iinfo(rank.dtype).max
+        # Menor rank de cada tiro: ordena por tiro e rank, pega o primeiro
+        order = np.lexsort((rank, queries))
+        queries = queries[order]
+        first = np.flatnonzero(np.r_[True, queries[1:] != queries[:-1]])
+        best[tied] = contenders[order[first]]
+
+    return hit_shots, best
@@ -8,6 +8,8 @@ from systems.factory import EntityFactory
 if TYPE_CHECKING:
     from entities.player import Player
 
+WEAPON_TYPES = ('normal', 'spread', 'rapid')
+
 
 class WeaponStrategy(ABC):
     """Abstract base class for weapon strategies."""
@@ -65,7 +67,10 @@ class RapidWeapon(WeaponStrategy):
             player.position,
             player.rotation,
         )
-        return const.PLAYER_SHOOT_COOLDOWN_SECONDS / 3
+        return (
+            const.PLAYER_SHOOT_COOLDOWN_SECONDS
+            / const.RAPID_SHOT_COOLDOWN_DIVISOR
+        )
 
     def get_name(self) -> str:
         return 'rapid'
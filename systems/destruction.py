@@ -0,0 +1,110 @@
+"""
+Destruction pipeline for shot-asteroid hits.
+
+Collision detection only records hits; ``DestructionQueue.resolve`` then
+applies them in one pass, after every query is done. Each asteroid is
+destroyed once: when several shots reach the same asteroid in a frame the
+first recorded shot wins and the others fly on. Resolution runs in
+stages, each over all hits in detection order, so every random stream is
+drawn in the same order as before: score and logs, explosions, power-up
+rolls, splits, spent shots, events.
+"""
+
+import pygame
+
+from core.events import events
+from core.game_state import GameState
+from entities.asteroid import Asteroid
+from entities.shot import Shot
+from systems.factory import EntityFactory
+from utils.logger import log_event
+from utils.particles import spawn_explosion
+
+ASTEROID_DESTROYED = events.intern('asteroid_destroyed')
+
+EXPLOSION_COLOR = (255, 200, 50)
+EXPLOSION_PARTICLES = 20
+
+
+class DestructionQueue:
+    """Hits recorded during a frame, resolved together."""
+
+    # Chaves de stats() que só crescem (contadores, não níveis)
+    counters = ('recorded', 'duplicates', 'destroyed')
+
+    def __init__(self):
+        self._asteroids: list[Asteroid] = []
+        self._shots: list[Shot] = []
+        self.recorded = 0
+        self.duplicates = 0
+        self.destroyed = 0
+
+    def __len__(self) -> int:
+        return len(self._asteroids)
+
+    def record(self, asteroid: Asteroid, shot: Shot) -> None:
+        self._asteroids.append(asteroid)
+        self._shots.append(shot)
+
+    def resolve(
+        self,
+        particles: pygame.sprite.Group,
+        game_state: GameState,
+        powerups: pygame.sprite.Group,
+    ) -> int:
+        """Destroy the recorded asteroids; returns how many."""
+        if not self._asteroids:
+            return 0
+
+        # Um asteroide por destruição: o primeiro tiro registrado vence
+        claimed = set()
+        hits = []
+        for asteroid, shot in zip(self._asteroids, self._shots):
+            if id(asteroid) in claimed or id(shot) in claimed:
+                self.duplicates += 1
+                continue
+            claimed.add(id(asteroid))
+            claimed.add(id(shot))
+            hits.append((asteroid, asteroid.get_score(), shot))
+        self.recorded += len(self._asteroids)
+        self._asteroids.clear()
+        self._shots.clear()
+
+        total = 0
+        for asteroid, score, _ in hits:
+            log_event('asteroid_shot', score=score)
+            total += score
+        game_state.add_score(total)
+
+        for asteroid, _, _ in hits:
+            spawn_explosion(
+                asteroid.position.x,
+                asteroid.position.y,
+                EXPLOSION_COLOR,
+                EXPLOSION_PARTICLES,
+                [particles],
+            )
+
+        for asteroid, _, _ in hits:
+            powerup = EntityFactory.spawn_explosion_powerup(asteroid.position)
+            if powerup:
+                powerups.add(powerup)
+
+        for asteroid, _, shot in hits:
+            asteroid.split()
+            shot.kill()
+
+        for asteroid, score, _ in hits:
+            events.emit(
+                ASTEROID_DESTROYED, {'asteroid': asteroid, 'score': score}
+            )
+
+        self.destroyed += len(hits)
+        return len(hits)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'recorded': self.recorded,
+            'duplicates': self.duplicates,
+            'destroyed': self.destroyed,
+        }
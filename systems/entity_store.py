@@ -0,0 +1,87 @@
+"""
+Structure-of-arrays storage for bulk entity kinematics.
+
+NumPy is an optional dependency: when it is missing ``HAS_NUMPY`` is False
+and the game keeps the per-sprite update path.
+"""
+
+from typing import TYPE_CHECKING
+
+from core import constants as const
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+if TYPE_CHECKING:
+    from entities.circleshape import StoredShape
+
+HAS_NUMPY = np is not None
+
+
+class EntityStore:
+    """Contiguous position, velocity and radius arrays for many entities.
+
+    Live rows are always packed in ``[0, count)``: releasing a slot moves the
+    last row into the hole, so bulk operations never need a mask.
+    """
+
+    def __init__(self, capacity: int = 256):
+        if np is None:
+            raise ImportError('EntityStore requires numpy')
+
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.previous_positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.radii = np.zeros(capacity, dtype=np.float64)
+        self.entities: list[StoredShape] = []
+        self._bounds = np.array(
+            [const.SCREEN_WIDTH, const.SCREEN_HEIGHT], dtype=np.float64
+        )
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.radii)
+
+    def _grow(self) -> None:
+        new_capacity = self.capacity * 2
+        for name in ('positions', 'previous_positions', 'velocities', 'radii'):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity, *old.shape[1:]), dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def allocate(self, entity: 'StoredShape') -> int:
+        """Reserve a row for the entity and return its slot."""
+        slot = len(self.entities)
+        if slot == self.capacity:
+            self._grow()
+        self.entities.append(entity)
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Free a row, moving the last live row into it."""
+        last = len(self.entities) - 1
+        if slot != last:
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            self.positions[slot] = self.positions[last]
+            self.previous_positions[slot] = self.previous_positions[last]
+            self.velocities[slot] = self.velocities[last]
+            self.radii[slot] = self.radii[last]
+            moved._slot = slot
+        self.entities.pop()
+
+    def update(self, dt: float) -> None:
+        """Integrate and wrap every live entity in one vectorized step."""
+        count = len(self.entities)
+        if count == 0:
+            return
+        positions = self.positions[:count]
+        self.previous_positions[:count] = positions
+        positions += self.velocities[:count] * dt
+        np.mod(positions, self._bounds, out=positions)
@@ -1,19 +1,28 @@
-import random
 from typing import TYPE_CHECKING
 
 import pygame
 
 from core import constants as const
+from core import rng
 from entities.asteroid import Asteroid
 from entities.shot import Shot
 from entities.powerups import PowerUp
+from systems.asteroid_pool import AsteroidPool
+from systems.shot_ring import ShotRing, shot_lifetime
 
 if TYPE_CHECKING:
     from entities.player import Player
 
 
 class EntityFactory:
-    """Factory for creating game entities."""
+    """Factory for creating game entities.
+
+    Shots come from ``shot_ring`` and asteroids from ``asteroid_pool``
+    when they are wired (``create_world``).
+    """
+
+    shot_ring: ShotRing | None = None
+    asteroid_pool: AsteroidPool | None = None
 
     @staticmethod
     def create_shot(
@@ -23,9 +32,15 @@ class EntityFactory:
         radius: float = const.SHOT_RADIUS,
     ) -> Shot:
         """Create a shot with the given position, rotation and speed."""
-        shot = Shot(position.x, position.y, radius)
-        shot_velocity = pygame.Vector2(0, 1).rotate(rotation) * speed
-        shot.velocity = shot_velocity
+        ring = EntityFactory.shot_ring
+        if ring is None:
+            shot = Shot(position.x, position.y, radius)
+        else:
+            shot = ring.acquire(
+                position.x, position.y, radius, shot_lifetime(speed)
+            )
+        # Sem Vector2 novo: a velocidade é reescrita no lugar
+        shot.set_polar_velocity(speed, rotation + 90)
         return shot
 
     @staticmethod
@@ -36,7 +51,7 @@ class EntityFactory:
     ) -> list[Shot]:
         """Create multiple shots in a spread pattern."""
         if angle_offsets is None:
-            angle_offsets = [-15, 0, 15]
+            angle_offsets = list(const.SPREAD_SHOT_ANGLES)
 
         shots = []
         for offset in angle_offsets:
@@ -51,7 +66,9 @@ class EntityFactory:
     ) -> Shot:
         """Create a rapid fire shot (slightly faster)."""
         return EntityFactory.create_shot(
-            position, rotation, speed=const.PLAYER_SHOOT_SPEED * 1.2
+            position,
+            rotation,
+            speed=const.PLAYER_SHOOT_SPEED * const.RAPID_SHOT_SPEED_FACTOR,
         )
 
     @staticmethod
@@ -61,7 +78,11 @@ class EntityFactory:
         velocity: pygame.Vector2 = None,
     ) -> Asteroid:
         """Create an asteroid with the given position and radius."""
-        asteroid = Asteroid(position.x, position.y, radius)
+        pool = EntityFactory.asteroid_pool
+        if pool is None:
+            asteroid = Asteroid(position.x, position.y, radius)
+        else:
+            asteroid = pool.acquire(position.x, position.y, radius)
         if velocity is not None:
             asteroid.velocity = velocity
         return asteroid
@@ -73,7 +94,7 @@ class EntityFactory:
     ) -> PowerUp:
         """Create a power-up at the given position."""
         if power_type is None:
-            power_type = random.choice(['shield', 'speed'])
+            power_type = rng.powerups.choice(['shield', 'speed'])
 
         powerup = PowerUp(position.x, position.y, power_type)
         return powerup
@@ -84,6 +105,6 @@ class EntityFactory:
         chance: float = 0.15,
     ) -> PowerUp | None:
         """Chance to spawn a power-up when an asteroid explodes."""
-        if random.random() < chance:
+        if rng.powerups.random() < chance:
             return EntityFactory.create_powerup(position)
         return None
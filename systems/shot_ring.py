@@ -0,0 +1,124 @@
+"""
+Fixed-capacity ring of shots with a time-to-live.
+
+A new shot takes the first free slot from the cursor on and revives the
+dead sprite there. Only when all ``capacity`` shots are flying is one
+recycled: the one with the least lifetime left, which is the oldest when
+lifetimes are equal. Once every slot has been used, firing allocates no
+new sprites. ``tick`` visits only the slots placed since it last ran and
+kills the shots whose lifetime (``SHOT_LIFETIME_SECONDS``, shortened to
+cover at most ``SHOT_RANGE`` pixels) has run out.
+"""
+
+import math
+from array import array
+
+from core import constants as const
+from entities.shot import Shot
+
+
+def shot_lifetime(speed: float) -> float:
+    """Seconds a shot at ``speed`` lives under the lifetime and range."""
+    lifetime = const.SHOT_LIFETIME_SECONDS or math.inf
+    if const.SHOT_RANGE and speed > 0:
+        lifetime = min(lifetime, const.SHOT_RANGE / speed)
+    return lifetime
+
+
+class ShotRing:
+    """Live shots of one world, at most ``capacity`` at a time."""
+
+    # Chaves de stats() que só crescem (contadores, não níveis)
+    counters = ('allocated', 'expired', 'recycled', 'reused')
+
+    def __init__(self, capacity: int = const.SHOT_CAPACITY):
+        self.capacity = capacity
+        self.cursor = 0
+        self.allocated = 0
+        self.expired = 0
+        self.recycled = 0
+        self.reused = 0
+        self._shots: list[Shot | None] = [None] * capacity
+        # Tempo de vida restante por slot, descontado a cada tick (e não
+        # um relógio absoluto, para o snapshot restaurar o valor exato)
+        self._remaining = array('d', bytes(8 * capacity))
+        # Slots ocupados desde o último tick; tiros mortos por colisão
+        # saem no tick seguinte
+        self._live: set[int] = set()
+
+    def acquire(self, x: float, y: float, radius: float, lifetime: float):
+        """Shot at rest at (x, y), in a free slot if there is one."""
+        shots = self._shots
+        remaining = self._remaining
+        capacity = self.capacity
+        cursor = self.cursor
+        oldest = cursor
+        for step in range(capacity):
+            slot = (cursor + step) % capacity
+            shot = shots[slot]
+            if shot is None or not shot.alive():
+                break
+            if remaining[slot] < remaining[oldest]:
+                oldest = slot
+        else:
+            # Todos voando: recicla o que tem menos vida pela frente
+            slot = oldest
+        self.cursor = (slot + 1) % capacity
+        return self.place(slot, x, y, radius, lifetime)
+
+    def place(
+        self, slot: int, x: float, y: float, radius: float, lifetime: float
+    ) -> Shot:
+        """Put a shot in a given slot (``acquire``, or a snapshot restore)."""
+        shot = self._shots[slot]
+        if shot is None:
+            shot = self._shots[slot] = Shot(x, y, radius)
+            shot.ring_slot = slot
+            self.allocated += 1
+        else:
+            if shot.alive():
+                shot.kill()
+                self.recycled += 1
+            self.reused += 1
+            shot.radius = radius
+            shot.revive(x, y)
+        self._remaining[slot] = lifetime
+        self._live.add(slot)
+        return shot
+
+    def remaining(self, slot: int) -> float:
+        """Lifetime left to the shot in ``slot``."""
+        return self._remaining[slot]
+
+    def tick(self, dt: float) -> None:
+        """Age the live shots and kill the expired ones."""
+        remaining = self._remaining
+        shots = self._shots
+        live = self._live
+        for slot in sorted(live):
+            shot = shots[slot]
+            if not shot.alive():
+                live.discard(slot)
+                continue
+            remaining[slot] -= dt
+            if remaining[slot] <= 0:
+                shot.kill()
+                live.discard(slot)
+                self.expired += 1
+
+    def reset(self, cursor: int = 0) -> None:
+        """Move the cursor (snapshot restore); sprites are kept for reuse."""
+        self.cursor = cursor
+
+    def stats(self) -> dict[str, float]:
+        placed = self.allocated + self.reused
+        return {
+            'live': sum(
+                1 for shot in self._shots if shot is not None and shot.alive()
+            ),
+            'allocated': self.allocated,
+            'expired': self.expired,
+            'recycled': self.recycled,
+            'reused': self.reused,
+            'hit_rate': self.reused / placed if placed else 0.0,
+        }
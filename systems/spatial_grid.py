@@ -1,69 +1,304 @@
+import statistics
+from collections.abc import Iterable
+
 import pygame
-from typing import List, Set, Dict, Tuple
+
+from core import constants as const
 from entities.circleshape import CircleShape
+from systems.broadphase import Broadphase
+from systems.entity_store import np
+
+
+def suggest_cell_size(
+    radii: Iterable[float], query_radius: float = 0.0
+) -> float | None:
+    """Cell size for a radius distribution: about one typical diameter.
+
+    Queries are widened by the largest object radius, so cells around the
+    median diameter keep both the cells visited per query and the
+    candidates per cell low. Queries are never smaller than
+    ``query_radius``. Returns None when there are no radii to tune from.
+    """
+    radii = list(radii)
+    if not radii:
+        return None
+    return 2 * max(statistics.median(radii), query_radius)
 
 
-class SpatialGrid:
-    """Otimização de colisão usando grid espacial."""
+class SpatialGrid(Broadphase):
+    """Otimização de colisão usando grid espacial.
 
-    def __init__(self, cell_size: float = 100.0):
+    The grid tiles the wrapping playfield: there are ``columns`` x ``rows``
+    cells of at least ``cell_size`` and cell coordinates wrap around, so
+    objects near opposite edges share cells. Each object is inserted into
+    the one cell holding its center, and ``get_nearby`` visits the cells
+    under the query's box widened by the largest object radius.
+
+    By default the grid is cleared and refilled every frame. With
+    ``persistent=True`` objects stay registered across frames and
+    ``rebuild`` only moves those whose cell changed; buckets left empty are
+    dropped.
+    """
+
+    name = 'grid'
+
+    def __init__(self, cell_size: float = 100.0, persistent: bool = False):
+        super().__init__()
         self.cell_size = cell_size
-        self.grid: Dict[Tuple[int, int], List[CircleShape]] = {}
-        self.object_cells: Dict[int, Set[Tuple[int, int]]] = {}
+        self.persistent = persistent
+        self.grid: dict[tuple[int, int], dict[int, CircleShape]] = {}
+        self.object_cells: dict[int, tuple[int, int]] = {}
+        self._objects: dict[int, CircleShape] = {}
+        self._count = 0
+        self._max_radius = 0.0
+        self.moves = 0
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
 
-    def _get_cell(self, position: pygame.Vector2) -> Tuple[int, int]:
+    @cell_size.setter
+    def cell_size(self, value: float) -> None:
+        # Células esticadas para dividir a tela exatamente
+        self._cell_size = value
+        self.columns = max(1, int(const.SCREEN_WIDTH // value))
+        self.rows = max(1, int(const.SCREEN_HEIGHT // value))
+        self.cell_width = const.SCREEN_WIDTH / self.columns
+        self.cell_height = const.SCREEN_HEIGHT / self.rows
+
+    def _get_cell(self, position: pygame.Vector2) -> tuple[int, int]:
         return (
-            int(position.x // self.cell_size),
-            int(position.y // self.cell_size),
+            int(position.x // self.cell_width) % self.columns,
+            int(position.y // self.cell_height) % self.rows,
         )
 
+    def _get_range(
+        self, position: pygame.Vector2, radius: float
+    ) -> tuple[int, int, int, int]:
+        """Unwrapped cell bounds (x0, y0, x1, y1) of a circle's box.
+
+        Bounds are inclusive and span at most one lap of the grid; take
+        them modulo ``columns`` and ``rows`` to get cell keys.
+        """
+        x0 = int((position.x - radius) // self.cell_width)
+        x1 = int((position.x + radius) // self.cell_width)
+        y0 = int((position.y - radius) // self.cell_height)
+        y1 = int((position.y + radius) // self.cell_height)
+        if x1 - x0 >= self.columns:
+            x0, x1 = 0, self.columns - 1
+        if y1 - y0 >= self.rows:
+            y0, y1 = 0, self.rows - 1
+        return x0, y0, x1, y1
+
+    def _add_to_cell(self, cell: tuple[int, int], obj: CircleShape) -> None:
+        bucket = self.grid.get(cell)
+        if bucket is None:
+            bucket = self.grid[cell] = {}
+        bucket[id(obj)] = obj
+
+    def _remove_from_cell(self, cell: tuple[int, int], obj_id: int) -> None:
+        bucket = self.grid[cell]
+        del bucket[obj_id]
+        if not bucket:
+            del self.grid[cell]
+
     def insert(self, obj: CircleShape) -> None:
         cell = self._get_cell(obj.position)
         obj_id = id(obj)
+        if obj_id in self.object_cells:
+            self._remove_from_cell(self.object_cells[obj_id], obj_id)
+        else:
+            self._count += 1
+        self._objects[obj_id] = obj
+        self.object_cells[obj_id] = cell
+        self._add_to_cell(cell, obj)
+        self._max_radius = max(self._max_radius, obj.radius)
+
+    def insert_all(self, objects: Iterable[CircleShape]) -> None:
+        for obj in objects:
+            self.insert(obj)
+
+    def remove(self, obj: CircleShape) -> None:
+        """Unregister an object from its cell."""
+        obj_id = id(obj)
+        cell = self.object_cells.pop(obj_id, None)
+        if cell is not None:
+            self._remove_from_cell(cell, obj_id)
+            self._count -= 1
+        self._objects.pop(obj_id, None)
+
+    def move(self, obj: CircleShape) -> bool:
+        """Re-bucket a registered object. Returns True if its cell changed."""
+        obj_id = id(obj)
+        cell = self._get_cell(obj.position)
+        old_cell = self.object_cells[obj_id]
+        if cell == old_cell:
+            return False
 
-        if cell not in self.grid:
-            self.grid[cell] = []
-        self.grid[cell].append(obj)
+        self._remove_from_cell(old_cell, obj_id)
+        self.object_cells[obj_id] = cell
+        self._add_to_cell(cell, obj)
+        return True
 
-        if obj_id not in self.object_cells:
-            self.object_cells[obj_id] = set()
-        self.object_cells[obj_id].add(cell)
+    def rebuild(self, objects: Iterable[CircleShape]) -> None:
+        """Bring the grid up to date with the current set of objects."""
+        self.queries = 0
+        self.candidates = 0
+        if not self.persistent:
+            self.clear()
+            # Inserção inline: este laço roda a cada frame
+            grid = self.grid
+            cell_width, cell_height = self.cell_width, self.cell_height
+            columns, rows = self.columns, self.rows
+            count = 0
+            max_radius = 0.0
+            for obj in objects:
+                position = obj.position
+                cell = (
+                    int(position.x // cell_width) % columns,
+                    int(position.y // cell_height) % rows,
+                )
+                bucket = grid.get(cell)
+                if bucket is None:
+                    bucket = grid[cell] = {}
+                bucket[id(obj)] = obj
+                radius = obj.radius
+                if radius > max_radius:
+                    max_radius = radius
+                count += 1
+            self._count = count
+            self._max_radius = max_radius
+            return
 
-    def insert_all(self, objects: List[CircleShape]) -> None:
+        moves = 0
+        seen = 0
+        max_radius = 0.0
         for obj in objects:
-            self.insert(obj)
+            seen += 1
+            max_radius = max(max_radius, obj.radius)
+            if id(obj) in self._objects:
+                if self.move(obj):
+                    moves += 1
+            else:
+                self.insert(obj)
+
+        # Objetos mortos (ex.: Asteroid.split) saem do grid
+        if seen != len(self._objects):
+            for obj in list(self._objects.values()):
+                if not obj.alive():
+                    self.remove(obj)
+
+        self._max_radius = max_radius
+        self.moves = moves
 
     def clear(self) -> None:
         self.grid.clear()
         self.object_cells.clear()
+        self._objects.clear()
+        self._count = 0
+        self._max_radius = 0.0
+        self.moves = 0
+
+    def retune(self, radii: Iterable[float], tolerance: float = 0.25) -> bool:
+        """Adopt the suggested cell size if it drifted past ``tolerance``.
+
+        The grid is emptied on a change, so the next ``rebuild`` refills it.
+        Returns True if the cell size changed.
+        """
+        cell_size = suggest_cell_size(radii, self.query_radius)
+        if cell_size is None:
+            return False
+        if abs(cell_size - self.cell_size) <= tolerance * self.cell_size:
+            return False
+
+        self.cell_size = cell_size
+        self.clear()
+        return True
+
+    @property
+    def query_radius(self) -> float:
+        """Largest radius the game queries with (player or shot)."""
+        return max(const.PLAYER_RADIUS, const.SHOT_RADIUS)
+
+    def stats(self) -> dict[str, float]:
+        """Counters since the last rebuild."""
+        return {
+            'objects': self._count,
+            'cells': len(self.grid),
+            'cell_size': self.cell_size,
+            'moves': self.moves,
+            'queries': self.queries,
+            'candidates': self.candidates,
+        }
 
     def get_nearby(
         self, position: pygame.Vector2, radius: float
-    ) -> List[CircleShape]:
-        center_cell = self._get_cell(position)
-        radius_in_cells = int(radius // self.cell_size) + 1
-
+    ) -> list[CircleShape]:
+        # Objetos estão só na célula do centro: a caixa da consulta cresce
+        # pelo maior raio registrado
+        grid = self.grid
+        x0, y0, x1, y1 = self._get_range(position, radius + self._max_radius)
+        columns, rows = self.columns, self.rows
+        ys = [y % rows for y in range(y0, y1 + 1)]
         nearby = []
-        for dx in range(-radius_in_cells, radius_in_cells + 1):
-            for dy in range(-radius_in_cells, radius_in_cells + 1):
-                cell = (center_cell[0] + dx, center_cell[1] + dy)
-                if cell in self.grid:
-                    nearby.extend(self.grid[cell])
+        for x in range(x0, x1 + 1):
+            x %= columns
+            for y in ys:
+                bucket = grid.get((x, y))
+                if bucket:
+                    nearby.extend(bucket.values())
 
+        self.queries += 1
+        self.candidates += len(nearby)
         return nearby
 
-    def get_potential_collisions(self, obj: CircleShape) -> List[CircleShape]:
-        obj_id = id(obj)
-        if obj_id not in self.object_cells:
+    def get_potential_collisions(self, obj: CircleShape) -> list[CircleShape]:
+        if id(obj) not in self.object_cells:
             return []
+        return [
+            other
+            for other in self.get_nearby(obj.position, obj.radius)
+            if other is not obj
+        ]
+
+    def _axis_range(self, positions, radii, size: float, cells: int):
+        """Vectorized ``_get_range`` along one axis: (start, length)."""
+        lo = np.floor_divide(positions - radii, size).astype(np.int64)
+        hi = np.floor_divide(positions + radii, size).astype(np.int64)
+        length = np.minimum(hi - lo + 1, cells)
+        lo = np.where(hi - lo >= cells, 0, lo)
+        return lo, length
+
+    def candidate_order(
+        self, query_positions, query_radii, positions, radii, queries, objects
+    ):
+        """Rank (query, object) pairs as ``get_nearby`` would (needs numpy).
 
-        potential = []
-        cells = self.object_cells[obj_id]
+        In persistent mode the candidate set is exact but objects sharing a
+        cell are ranked by index rather than by the order they entered it.
+        """
+        margin = float(radii.max()) if len(radii) else 0.0
+        offsets = []
+        lengths = []
+        for axis, size, cells in (
+            (0, self.cell_width, self.columns),
+            (1, self.cell_height, self.rows),
+        ):
+            cell = np.floor_divide(positions[objects, axis], size)
+            query_start, query_length = self._axis_range(
+                query_positions[:, axis], query_radii + margin, size, cells
+            )
+            # Passo da consulta que visita a célula do centro do objeto
+            offsets.append(
+                np.mod(cell.astype(np.int64) - query_start[queries], cells)
+            )
+            lengths.append(query_length[queries])
 
-        for cell in cells:
-            if cell in self.grid:
-                for other in self.grid[cell]:
-                    if other is not obj:
-                        potential.append(other)
+        inside = (offsets[0] < lengths[0]) & (offsets[1] < lengths[1])
+        cell_rank = offsets[0] * lengths[1] + offsets[1]
+        order = cell_rank * len(radii) + objects
+        order[~inside] = -1
 
-        return list(set(potential))
+        self.queries += len(query_radii)
+        self.candidates += int(inside.sum())
+        return order
@@ -0,0 +1,480 @@
+"""
+Batched simulator that steps many independent games over shared arrays.
+
+Every world lives in one row of a set of NumPy arrays, so a single
+``step`` advances all of them without sprites, groups or the global event
+bus. The rules mirror the sprite game: ``AsteroidField.update`` spawns,
+``Asteroid.split`` children, ``WeaponComponent`` cooldowns, ``ShotRing``
+lifetimes and slot reuse, and ``GameState`` lives and respawn. Power-ups,
+particles and logging are left out, and two shots hitting the same
+asteroid in one step split it once.
+
+Requires numpy (see ``HAS_NUMPY`` in ``systems.entity_store``).
+"""
+
+from core import constants as const
+from core import controls
+from systems.components import WEAPON_TYPES
+from systems.entity_store import np
+from systems.shot_ring import shot_lifetime
+
+# Ângulos e velocidades dos tiros de cada arma, como no EntityFactory
+_WEAPON_OFFSETS = ((0.0,), const.SPREAD_SHOT_ANGLES, (0.0,))
+_WEAPON_SPEEDS = (
+    const.PLAYER_SHOOT_SPEED,
+    const.PLAYER_SHOOT_SPEED,
+    const.PLAYER_SHOOT_SPEED * const.RAPID_SHOT_SPEED_FACTOR,
+)
+_WEAPON_COOLDOWNS = (
+    const.PLAYER_SHOOT_COOLDOWN_SECONDS,
+    const.PLAYER_SHOOT_COOLDOWN_SECONDS,
+    const.PLAYER_SHOOT_COOLDOWN_SECONDS / const.RAPID_SHOT_COOLDOWN_DIVISOR,
+)
+_WEAPON_LIFETIMES = tuple(shot_lifetime(speed) for speed in _WEAPON_SPEEDS)
+
+# Direção e posição de entrada de cada borda do AsteroidField
+_EDGE_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _forward(rotation):
+    """``Vector2(0, 1).rotate(rotation)`` for an array of degrees."""
+    radians = np.radians(rotation)
+    return np.stack((-np.sin(radians), np.cos(radians)), axis=-1)
+
+
+def _rotate(vectors, degrees):
+    """``Vector2.rotate`` for arrays of vectors and angles."""
+    radians = np.radians(degrees)
+    cos, sin = np.cos(radians), np.sin(radians)
+    x, y = vectors[..., 0], vectors[..., 1]
+    return np.stack((x * cos - y * sin, x * sin + y * cos), axis=-1)
+
+
+def _wrapped_distance_squared(delta, bounds):
+    """Squared shortest distance on the torus for (..., 2) deltas.
+
+    Deltas stay within about one lap (spawns sit just off screen), where
+    the wrap is a single subtraction; np.mod would dominate the step.
+    """
+    gap = np.abs(delta)
+    gap = np.minimum(gap, bounds - gap)
+    gap *= gap
+    return gap[..., 0] + gap[..., 1]
+
+
+def _wrap_once(positions, bounds) -> None:
+    """Wrap positions at most one lap outside the screen, in place."""
+    positions += bounds * (positions < 0)
+    positions -= bounds * (positions >= bounds)
+
+
+class VectorAsteroids:
+    """N asteroid games advanced together with ``reset`` and ``step``.
+
+    Actions are ``core.controls`` bitmasks, one per world. Observations are
+    float32 rows holding the player state followed by the ``nearest``
+    closest asteroids (wrapped offset, velocity and radius); rewards are
+    the score gained during the step. Finished worlds stay frozen until
+    they are reset.
+    """
+
+    def __init__(
+        self,
+        num_worlds: int,
+        seed: int | None = None,
+        max_asteroids: int = 128,
+        max_shots: int = 64,
+        dt: float = 1 / const.TICK_RATE,
+        nearest: int = 8,
+    ):
+        if np is None:
+            raise ImportError('VectorAsteroids requires numpy')
+
+        self.num_worlds = num_worlds
+        self.max_asteroids = max_asteroids
+        self.max_shots = max_shots
+        self.dt = dt
+        self.nearest = nearest
+        self.rng = np.random.default_rng(seed)
+        self.bounds = np.array(
+            [const.SCREEN_WIDTH, const.SCREEN_HEIGHT], dtype=np.float64
+        )
+
+        n = num_worlds
+        self.asteroid_positions = np.zeros((n, max_asteroids, 2))
+        self.asteroid_velocities = np.zeros((n, max_asteroids, 2))
+        self.asteroid_radii = np.zeros((n, max_asteroids))
+        self.asteroid_alive = np.zeros((n, max_asteroids), dtype=bool)
+
+        self.shot_positions = np.zeros((n, max_shots, 2))
+        self.shot_velocities = np.zeros((n, max_shots, 2))
+        self.shot_alive = np.zeros((n, max_shots), dtype=bool)
+        self.shot_remaining = np.zeros((n, max_shots))
+        # Cursor do anel de tiros de cada mundo, como no ShotRing
+        self.shot_head = np.zeros(n, dtype=np.int64)
+
+        self.player_positions = np.zeros((n, 2))
+        self.player_velocities = np.zeros((n, 2))
+        self.rotations = np.zeros(n)
+        self.invulnerable = np.zeros(n)
+        self.shot_cooldowns = np.zeros(n)
+        self.weapons = np.zeros(n, dtype=np.int64)
+        self.spawn_timers = np.zeros(n)
+
+        self.scores = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.respawn_timers = np.zeros(n)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.frames = np.zeros(n, dtype=np.int64)
+        self.steps = 0
+
+    @property
+    def observation_size(self) -> int:
+        return 9 + 5 * self.nearest
+
+    def reset(self, worlds=None):
+        """Restart the given worlds (all by default); returns observations."""
+        if worlds is None:
+            worlds = np.arange(self.num_worlds)
+        worlds = np.asarray(worlds)
+        if worlds.dtype == bool:
+            worlds = np.flatnonzero(worlds)
+
+        self.asteroid_alive[worlds] = False
+        self.shot_alive[worlds] = False
+        self.shot_head[worlds] = 0
+        self.player_positions[worlds] = self.bounds / 2
+        self.player_velocities[worlds] = 0
+        self.rotations[worlds] = 0
+        self.invulnerable[worlds] = 0
+        self.shot_cooldowns[worlds] = 0
+        self.weapons[worlds] = 0
+        self.spawn_timers[worlds] = 0
+        self.scores[worlds] = 0
+        self.lives[worlds] = const.PLAYER_STARTING_LIVES
+        self.respawn_timers[worlds] = 0
+        self.game_over[worlds] = False
+        self.frames[worlds] = 0
+        return self.observe()
+
+    def set_weapon(self, worlds, weapon_type: str) -> None:
+        """Switch the weapon of the given worlds, as ``Player.weapon_type``."""
+        self.weapons[worlds] = WEAPON_TYPES.index(weapon_type)
+
+    def step(self, actions):
+        """Advance every world by ``dt``.
+
+        Returns ``(observations, rewards, dones)``.
+        """
+        dt = self.dt
+        actions = np.broadcast_to(
+            np.asarray(actions, dtype=np.int64), (self.num_worlds,)
+        )
+        previous_scores = self.scores.copy()
+
+        self._respawn(dt)
+        # Mundos em respawn ficam congelados, como no update_game_state
+        active = (self.respawn_timers <= 0) & ~self.game_over
+
+        self._integrate(active, dt)
+        self._spawn_asteroids(active, dt)
+        self._update_players(active, actions, dt)
+        self._collide(active)
+
+        self.frames[active] += 1
+        self.steps += 1
+        rewards = (self.scores - previous_scores).astype(np.float32)
+        return self.observe(), rewards, self.game_over.copy()
+
+    def _respawn(self, dt: float) -> None:
+        waiting = self.respawn_timers > 0
+        self.respawn_timers[waiting] -= dt
+        ready = waiting & (self.respawn_timers <= 0)
+        self.player_positions[ready] = self.bounds / 2
+        self.player_velocities[ready] = 0
+        self.invulnerable[ready] = const.PLAYER_RESPAWN_INVULNERABILITY
+
+    def _integrate(self, active, dt: float) -> None:
+        # Tiros vencidos saem antes de serem integrados, como no ShotRing
+        aging = self.shot_alive & active[:, None]
+        self.shot_remaining[aging] -= dt
+        self.shot_alive[aging & (self.shot_remaining <= 0)] = False
+
+        # Só entidades que já existiam no início do passo se movem; slots
+        # livres também andam, mas são ignorados até serem reutilizados
+        step = (dt * active)[:, None, None]
+        for positions, velocities in (
+            (self.asteroid_positions, self.asteroid_velocities),
+            (self.shot_positions, self.shot_velocities),
+        ):
+            positions += velocities * step
+            _wrap_once(positions, self.bounds)
+
+    def _allocate_asteroids(self, worlds, positions, velocities, radii):
+        """Write new asteroids into free slots; drops them when full."""
+        if len(worlds) == 0:
+            return
+        order = np.argsort(worlds, kind='stable')
+        worlds = worlds[order]
+        # Posição de cada pedido dentro do seu mundo
+        starts = np.searchsorted(worlds, worlds, 'left')
+        within = np.arange(len(worlds)) - starts
+
+        free_slots = np.argsort(
+            self.asteroid_alive[worlds], axis=1, kind='stable'
+        )
+        free_count = (~self.asteroid_alive[worlds]).sum(axis=1)
+        fits = within < free_count
+        worlds, within = worlds[fits], within[fits]
+        order = order[fits]
+        slots = free_slots[fits, within]
+
+        self.asteroid_positions[worlds, slots] = positions[order]
+        self.asteroid_velocities[worlds, slots] = velocities[order]
+        self.asteroid_radii[worlds, slots] = radii[order]
+        self.asteroid_alive[worlds, slots] = True
+
+    def _spawn_asteroids(self, active, dt: float) -> None:
+        self.spawn_timers[active] += dt
+        spawning = active & (
+            self.spawn_timers > const.ASTEROID_SPAWN_RATE_SECONDS
+        )
+        worlds = np.flatnonzero(spawning)
+        if len(worlds) == 0:
+            return
+        self.spawn_timers[worlds] = 0
+
+        count = len(worlds)
+        rng = self.rng
+        edges = rng.integers(0, 4, count)
+        speeds = rng.integers(40, 101, count)
+        angles = rng.integers(-30, 31, count)
+        along = rng.uniform(0, 1, count)
+        kinds = rng.integers(1, const.ASTEROID_KINDS + 1, count)
+
+        directions = np.array(_EDGE_DIRECTIONS, dtype=np.float64)[edges]
+        velocities = _rotate(directions * speeds[:, None], angles)
+
+        margin = const.ASTEROID_MAX_RADIUS
+        width, height = self.bounds
+        positions = np.empty((count, 2))
+        positions[:, 0] = np.select(
+            [edges == 0, edges == 1],
+            [-margin, width + margin],
+            along * width,
+        )
+        positions[:, 1] = np.select(
+            [edges == 2, edges == 3],
+            [-margin, height + margin],
+            along * height,
+        )
+        self._allocate_asteroids(
+            worlds, positions, velocities, const.ASTEROID_MIN_RADIUS * kinds
+        )
+
+    def _update_players(self, active, actions, dt: float) -> None:
+        thrust = (actions & controls.THRUST) != 0
+        reverse = (actions & controls.REVERSE) != 0
+        left = (actions & controls.ROTATE_LEFT) != 0
+        right = (actions & controls.ROTATE_RIGHT) != 0
+        shoot = active & ((actions & controls.SHOOT) != 0)
+
+        # Mesma ordem do Player.update: acelera com a rotação atual
+        forward = _forward(self.rotations)
+        throttle = (thrust.astype(np.float64) - reverse) * active
+        self.player_velocities += (
+            forward * (const.PLAYER_ACCELERATION * dt * throttle)[:, None]
+        )
+        turn = right.astype(np.float64) - left
+        self.rotations += const.PLAYER_TURN_SPEED * dt * turn * active
+
+        firing = shoot & (self.shot_cooldowns <= 0)
+        if firing.any():
+            self._fire(np.flatnonzero(firing))
+
+        velocities = self.player_velocities
+        velocities[active] *= const.PLAYER_FRICTION
+        positions = self.player_positions
+        moved = positions[active] + velocities[active] * dt
+        _wrap_once(moved, self.bounds)
+        positions[active] = moved
+
+        cooling = active & (self.shot_cooldowns > 0)
+        self.shot_cooldowns[cooling] -= dt
+        shielded = active & (self.invulnerable > 0)
+        self.invulnerable[shielded] -= dt
+
+    def _fire(self, worlds) -> None:
+        for weapon, offsets in enumerate(_WEAPON_OFFSETS):
+            shooters = worlds[self.weapons[worlds] == weapon]
+            if len(shooters) == 0:
+                continue
+            self.shot_cooldowns[shooters] = _WEAPON_COOLDOWNS[weapon]
+            lifetime = _WEAPON_LIFETIMES[weapon]
+            for offset in offsets:
+                slots = self._free_shot_slots(shooters)
+                self.shot_head[shooters] = (slots + 1) % self.max_shots
+                self.shot_positions[shooters, slots] = self.player_positions[
+                    shooters
+                ]
+                self.shot_velocities[shooters, slots] = (
+                    _forward(self.rotations[shooters] + offset)
+                    * _WEAPON_SPEEDS[weapon]
+                )
+                self.shot_alive[shooters, slots] = True
+                self.shot_remaining[shooters, slots] = lifetime
+
+    def _free_shot_slots(self, worlds):
+        """Slot of the next shot per world, picked as ``ShotRing.acquire``."""
+        rows = worlds[:, None]
+        order = (
+            self.shot_head[rows] + np.arange(self.max_shots)
+        ) % self.max_shots
+        free = ~self.shot_alive[rows, order]
+        # Sem slot livre, o tiro com menos vida pela frente
+        picks = np.where(
+            free.any(axis=1),
+            free.argmax(axis=1),
+            self.shot_remaining[rows, order].argmin(axis=1),
+        )
+        return order[np.arange(len(worlds)), picks]
+
+    def _collide(self, active) -> None:
+        alive = self.asteroid_alive & active[:, None]
+
+        # Player-asteroide, como CircleShape.collides_with
+        delta = self.asteroid_positions - self.player_positions[:, None]
+        reach = self.asteroid_radii + const.PLAYER_RADIUS
+        touching = _wrapped_distance_squared(delta, self.bounds) < reach**2
+        vulnerable = active & (self.invulnerable <= 0)
+        hit_players = vulnerable & (touching & alive).any(axis=1)
+        if hit_players.any():
+            self._kill_players(np.flatnonzero(hit_players))
+
+        # Tiro-asteroide: cada tiro destrói o primeiro asteroide que atinge.
+        # Só os tiros vivos entram, contra os asteroides do próprio mundo
+        worlds, shot_slots = np.nonzero(self.shot_alive & active[:, None])
+        if len(worlds) == 0:
+            return
+        delta = (
+            self.asteroid_positions[worlds]
+            - self.shot_positions[worlds, shot_slots][:, None, :]
+        )
+        reach = self.asteroid_radii[worlds] + const.SHOT_RADIUS
+        hits = _wrapped_distance_squared(delta, self.bounds) < reach**2
+        hits &= alive[worlds]
+        shot_hit = hits.any(axis=1)
+        worlds, shot_slots = worlds[shot_hit], shot_slots[shot_hit]
+        if len(worlds) == 0:
+            return
+        first = hits[shot_hit].argmax(axis=1)
+
+        # Um tiro por asteroide, como DestructionQueue: vence o primeiro
+        # (menor slot) e os outros seguem voando
+        _, winners = np.unique(
+            worlds * self.max_asteroids + first, return_index=True
+        )
+        self.shot_alive[worlds[winners], shot_slots[winners]] = False
+        self._destroy_asteroids(worlds[winners], first[winners])
+
+    def _kill_players(self, worlds) -> None:
+        self.lives[worlds] -= 1
+        over = self.lives[worlds] <= 0
+        self.game_over[worlds[over]] = True
+        dead = worlds[~over]
+        self.player_positions[dead] = -1000
+        self.respawn_timers[dead] = 2.0
+
+    def _destroy_asteroids(self, worlds, slots) -> None:
+        radii = self.asteroid_radii[worlds, slots]
+        points = np.where(
+            radii >= const.ASTEROID_MAX_RADIUS,
+            const.ASTEROID_LARGE_SCORE,
+            np.where(
+                radii >= const.ASTEROID_MIN_RADIUS * 2,
+                const.ASTEROID_MEDIUM_SCORE,
+                const.ASTEROID_SMALL_SCORE,
+            ),
+        )
+        np.add.at(self.scores, worlds, points)
+        self.asteroid_alive[worlds, slots] = False
+
+        splitting = radii > const.ASTEROID_MIN_RADIUS
+        worlds, slots = worlds[splitting], slots[splitting]
+        if len(worlds) == 0:
+            return
+        angles = self.rng.uniform(
+            const.ASTEROID_SPLIT_MIN_ANGLE,
+            const.ASTEROID_SPLIT_MAX_ANGLE,
+            len(worlds),
+        )
+        velocities = self.asteroid_velocities[worlds, slots]
+        positions = self.asteroid_positions[worlds, slots]
+        children = radii[splitting] - const.ASTEROID_MIN_RADIUS
+        self._allocate_asteroids(
+            np.concatenate((worlds, worlds)),
+            np.concatenate((positions, positions)),
+            np.concatenate(
+                (
+                    _rotate(velocities, angles)
+                    * const.ASTEROID_SPLIT_SPEED_FACTOR,
+                    _rotate(velocities, -angles)
+                    * const.ASTEROID_SPLIT_SPEED_FACTOR,
+                )
+            ),
+            np.concatenate((children, children)),
+        )
+
+    def observe(self):
+        """Per-world float32 observation rows."""
+        n = self.num_worlds
+        obs = np.zeros((n, self.observation_size), dtype=np.float32)
+        obs[:, 0:2] = self.player_positions / self.bounds
+        obs[:, 2:4] = self.player_velocities / const.PLAYER_SPEED
+        radians = np.radians(self.rotations)
+        obs[:, 4] = np.sin(radians)
+        obs[:, 5] = np.cos(radians)
+        obs[:, 6] = self.shot_cooldowns
+        obs[:, 7] = self.invulnerable
+        obs[:, 8] = self.lives
+
+        if self.nearest == 0:
+            return obs
+        delta = self.asteroid_positions - self.player_positions[:, None]
+        distance = np.where(
+            self.asteroid_alive,
+            _wrapped_distance_squared(delta, self.bounds),
+            np.inf,
+        )
+        k = min(self.nearest, self.max_asteroids)
+        rows = np.arange(n)[:, None]
+        closest = np.argpartition(distance, k - 1, axis=1)[:, :k]
+        closest = np.take_along_axis(
+            closest, np.argsort(distance[rows, closest], axis=1), axis=1
+        )
+        present = np.isfinite(distance[rows, closest])[..., None]
+
+        half = self.bounds / 2
+        offsets = np.mod(delta[rows, closest] + half, self.bounds) - half
+        features = np.concatenate(
+            (
+                offsets / self.bounds,
+                self.asteroid_velocities[rows, closest] / const.PLAYER_SPEED,
+                self.asteroid_radii[rows, closest, None]
+                / const.ASTEROID_MAX_RADIUS,
+            ),
+            axis=-1,
+        )
+        obs[:, 9 : 9 + 5 * k] = np.where(present, features, 0).reshape(n, -1)
+        return obs
+
+    def stats(self) -> dict:
+        """Aggregate counters over the batch."""
+        return {
+            'worlds': self.num_worlds,
+            'steps': self.steps,
+            'asteroids': int(self.asteroid_alive.sum()),
+            'shots': int(self.shot_alive.sum()),
+            'mean_score': float(self.scores.mean()),
+            'game_over': int(self.game_over.sum()),
+        }
@@ -0,0 +1,265 @@
+"""
+Stream aggregates out of state and event telemetry files.
+
+    uv run python -m tools.analyze_telemetry logs/
+    uv run python -m tools.analyze_telemetry logs/game_events.tlm --bucket 5
+
+Reads columnar ``.tlm`` files, JSONL files (both the buffered sinks'
+``{time, message, extra}`` lines and loguru's serialized records) and
+rotated ``.zip`` archives of either. Files are consumed one chunk at a
+time and only the aggregates are kept, so memory does not grow with the
+size of the logs. A directory expands to its columnar files, or to its
+JSONL files when it has none, so a 'both' setup is not counted twice.
+"""
+
+import argparse
+import io
+import json
+import math
+import zipfile
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO
+
+from utils.telemetry import Columns, read_chunks
+
+CHUNK_ROWS = 4096
+COLUMNS = ('time', 'message', 'score', 'asteroids')
+DESTROYED_EVENT = 'asteroid_shot'
+
+
+def jsonl_chunks(
+    lines: Iterable[str], columns: Iterable[str] = COLUMNS
+) -> Iterator[tuple[int, Columns]]:
+    """Group JSON log lines into column chunks of ``CHUNK_ROWS``."""
+    fields = [name for name in columns if name not in ('time', 'message')]
+    chunk: Columns = {name: [] for name in columns}
+    rows = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # Última linha cortada
+        record = item.get('record')
+        if record is not None:
+            # Formato serializado do loguru
+            timestamp = record['time']['timestamp']
+            message = record['message']
+            extra = record['extra']
+        else:
+            timestamp = item['time']
+            message = item['message']
+            extra = item.get('extra', {})
+
+        if 'time' in chunk:
+            chunk['time'].append(timestamp)
+        if 'message' in chunk:
+            chunk['message'].append(message)
+        for name in fields:
+            chunk[name].append(extra.get(name))
+        rows += 1
+        if rows == CHUNK_ROWS:
+            yield rows, chunk
+            chunk = {name: [] for name in columns}
+            rows = 0
+    if rows:
+        yield rows, chunk
+
+
+def _stream_chunks(
+    name: str, stream: IO[bytes], columns: Iterable[str]
+) -> Iterator[tuple[int, Columns]]:
+    if name.endswith('.tlm'):
+        yield from read_chunks(stream, columns)
+    else:
+        yield from jsonl_chunks(
+            io.TextIOWrapper(stream, encoding='utf-8'), columns
+        )
+
+
+def file_chunks(
+    path: Path, columns: Iterable[str] = COLUMNS
+) -> Iterator[tuple[int, Columns]]:
+    """Chunks of one telemetry file or rotated archive."""
+    if path.suffix == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.namelist():
+                with archive.open(member) as stream:
+                    yield from _stream_chunks(member, stream, columns)
+    else:
+        with open(path, 'rb') as stream:
+            yield from _stream_chunks(path.name, stream, columns)
+
+
+def expand_paths(paths: Iterable[str]) -> list[Path]:
+    files = []
+    for name in paths:
+        path = Path(name)
+        if not path.is_dir():
+            files.append(path)
+            continue
+        columnar = sorted(path.glob('*.tlm')) + sorted(path.glob('*.tlm.zip'))
+        files += columnar or (
+            sorted(path.glob('*.jsonl')) + sorted(path.glob('*.jsonl.zip'))
+        )
+    return files
+
+
+class _Bucket:
+    __slots__ = ('asteroids', 'events', 'samples', 'score', 'score_time')
+
+    def __init__(self):
+        self.events: Counter[str] = Counter()
+        self.score: float | None = None
+        self.score_time = float('-inf')
+        self.asteroids = 0.0
+        self.samples = 0
+
+
+class TelemetryStats:
+    """Event rates and a per-``bucket`` timeline, fed chunk by chunk.
+
+    Buckets are keyed by absolute time, so files can be added in any
+    order (rotated archives before or after the live file).
+    """
+
+    def __init__(self, bucket: float = 10.0):
+        self.bucket = bucket
+        self.records = 0
+        self.first = float('inf')
+        self.last = float('-inf')
+        self.events: Counter[str] = Counter()
+        self._buckets: dict[int, _Bucket] = {}
+
+    def add(self, rows: int, columns: Columns) -> None:
+        times = columns['time']
+        messages = columns['message']
+        scores = columns.get('score')
+        asteroids = columns.get('asteroids')
+        buckets = self._buckets
+        self.records += rows
+
+        for i in range(rows):
+            timestamp = times[i]
+            message = messages[i]
+            self.first = min(self.first, timestamp)
+            self.last = max(self.last, timestamp)
+            key = int(timestamp // self.bucket)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _Bucket()
+
+            if message != 'game_state':
+                self.events[message] += 1
+                bucket.events[message] += 1
+                continue
+            # NaN (ou None) quando o registro não tem o campo
+            score = scores[i] if scores is not None else None
+            if (
+                score is not None
+                and not math.isnan(score)
+                and timestamp >= bucket.score_time
+            ):
+                bucket.score = score
+                bucket.score_time = timestamp
+            count = asteroids[i] if asteroids is not None else None
+            if count is not None and not math.isnan(count):
+                bucket.asteroids += count
+                bucket.samples += 1
+
+    def report(self) -> dict:
+        duration = max(self.last - self.first, 0.0) if self.records else 0.0
+        timeline = []
+        if self._buckets:
+            start = min(self._buckets)
+            for key in sorted(self._buckets):
+                bucket = self._buckets[key]
+                timeline.append(
+                    {
+                        'second': (key - start) * self.bucket,
+                        'score': bucket.score,
+                        'asteroids': (
+                            bucket.asteroids / bucket.samples
+                            if bucket.samples
+                            else None
+                        ),
+                        'destroyed_per_second': (
+                            bucket.events[DESTROYED_EVENT] / self.bucket
+                        ),
+                        'events_per_second': (
+                            sum(bucket.events.values()) / self.bucket
+                        ),
+                    }
+                )
+        return {
+            'records': self.records,
+            'duration': duration,
+            'events': {
+                name: {
+                    'count': count,
+                    'per_second': count / duration if duration else 0.0,
+                }
+                for name, count in self.events.most_common()
+            },
+            'timeline': timeline,
+        }
+
+
+def print_report(report: dict) -> None:
+    print(f'{report["records"]} records over {report["duration"]:.1f}s')
+    print()
+    print(f'{"event":<22}{"count":>10}{"per s":>10}')
+    for name, row in report['events'].items():
+        print(f'{name:<22}{row["count"]:>10}{row["per_second"]:>10.2f}')
+    print()
+    print(
+        f'{"second":>8}{"score":>10}{"asteroids":>11}'
+        f'{"destroyed/s":>13}{"events/s":>10}'
+    )
+
+    def cell(value, width: int, digits: int) -> str:
+        if value is None:
+            return ' ' * (width - 1) + '-'
+        return f'{value:>{width}.{digits}f}'
+
+    for row in report['timeline']:
+        print(
+            f'{row["second"]:>8g}{cell(row["score"], 10, 0)}'
+            f'{cell(row["asteroids"], 11, 1)}'
+            f'{row["destroyed_per_second"]:>13.2f}'
+            f'{row["events_per_second"]:>10.2f}'
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        'paths',
+        nargs='+',
+        help='telemetry files, .zip archives or log directories',
+    )
+    parser.add_argument(
+        '--bucket', type=float, default=10.0, help='timeline step (s)'
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='print the report as JSON'
+    )
+    args = parser.parse_args()
+
+    stats = TelemetryStats(args.bucket)
+    for path in expand_paths(args.paths):
+        for rows, columns in file_chunks(path):
+            stats.add(rows, columns)
+
+    report = stats.report()
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
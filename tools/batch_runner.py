@@ -0,0 +1,149 @@
+"""
+Run seeded headless sessions in a process pool and aggregate the results.
+
+    uv run python -m tools.batch_runner --sessions 64 --frames 7200
+
+Each session plays one game with a ``ScriptedController`` until the frame
+or score limit, or game over. A session depends only on its seed, so the
+same command always prints the same statistics.
+"""
+
+import argparse
+import json
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from core import constants as const
+from core.controls import ScriptedController
+from core.events import events
+from core.world import create_world
+from main import step_world
+from utils.logger import disable_logging
+from utils.particles import reset_particle_pool
+
+METRICS = (
+    'score',
+    'frames',
+    'lifetime_seconds',
+    'peak_asteroids',
+    'mean_asteroids',
+    'peak_shots',
+)
+
+
+def _init_worker() -> None:
+    # Sessões em lote não abrem janela nem escrevem logs
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    disable_logging()
+
+
+def run_session(
+    seed: int,
+    max_frames: int,
+    score_limit: int | None = None,
+    dt: float = 1 / const.TICK_RATE,
+) -> dict[str, float]:
+    """Play one seeded game headless and return its statistics."""
+    # Estado global do processo, reiniciado a cada sessão
+    events.clear()
+    reset_particle_pool()
+
+    world = create_world(ScriptedController(seed), seed)
+    game_state = world.game_state
+    peak_asteroids = peak_shots = total_asteroids = 0
+
+    while world.frame < max_frames and not game_state.game_over:
+        if score_limit is not None and game_state.score >= score_limit:
+            break
+        step_world(world, dt)
+        asteroids = len(world.asteroids)
+        total_asteroids += asteroids
+        peak_asteroids = max(peak_asteroids, asteroids)
+        peak_shots = max(peak_shots, len(world.shots))
+
+    return {
+        'seed': seed,
+        'score': game_state.score,
+        'frames': world.frame,
+        'lifetime_seconds': world.frame * dt,
+        'lives': game_state.lives,
+        'game_over': game_state.game_over,
+        'peak_asteroids': peak_asteroids,
+        'mean_asteroids': total_asteroids / max(world.frame, 1),
+        'peak_shots': peak_shots,
+    }
+
+
+def aggregate(results: list[dict[str, float]]) -> dict[str, dict]:
+    """Mean, standard deviation, min and max of each metric."""
+    summary = {}
+    for metric in METRICS:
+        values = [result[metric] for result in results]
+        summary[metric] = {
+            'mean': statistics.fmean(values),
+            'stdev': statistics.pstdev(values),
+            'min': min(values),
+            'max': max(values),
+        }
+    summary['game_over_rate'] = sum(r['game_over'] for r in results) / len(
+        results
+    )
+    return summary
+
+
+def run_batch(
+    seeds: list[int],
+    max_frames: int,
+    score_limit: int | None = None,
+    dt: float = 1 / const.TICK_RATE,
+    workers: int | None = None,
+) -> list[dict[str, float]]:
+    """Run one session per seed; ``workers=0`` runs them in-process."""
+    count = len(seeds)
+    arguments = ([max_frames] * count, [score_limit] * count, [dt] * count)
+    if workers == 0:
+        _init_worker()
+        return list(map(run_session, seeds, *arguments))
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker
+    ) as executor:
+        return list(executor.map(run_session, seeds, *arguments))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sessions', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=0, help='first seed')
+    parser.add_argument('--frames', type=int, default=const.TICK_RATE * 120)
+    parser.add_argument('--score-limit', type=int)
+    parser.add_argument('--dt', type=float, default=1 / const.TICK_RATE)
+    parser.add_argument(
+        '--workers', type=int, help='pool size; 0 runs in-process'
+    )
+    parser.add_argument('--json', help='write per-session results here')
+    args = parser.parse_args()
+
+    seeds = list(range(args.seed, args.seed + args.sessions))
+    results = run_batch(
+        seeds, args.frames, args.score_limit, args.dt, args.workers
+    )
+    summary = aggregate(results)
+
+    print(f'{"metric":<18} {"mean":>10} {"stdev":>10} {"min":>10} {"max":>10}')
+    for metric in METRICS:
+        row = summary[metric]
+        print(
+            f'{metric:<18} {row["mean"]:>10.1f} {row["stdev"]:>10.1f} '
+            f'{row["min"]:>10.1f} {row["max"]:>10.1f}'
+        )
+    print(f'game over rate: {summary["game_over_rate"]:.0%}')
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'sessions': results, 'summary': summary}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
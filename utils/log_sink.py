@@ -0,0 +1,159 @@
+"""
+Buffered log sink: the game thread only appends to a preallocated ring.
+
+``push`` stores a reference in the next free slot and returns; a writer
+thread wakes every ``flush_interval`` seconds (or as soon as the ring is
+half full), serializes everything pending in one batch and writes it.
+When the ring is full the record is dropped and counted instead of
+blocking the frame. Rotation and zip compression also happen on the
+writer thread.
+
+The ring has a single producer (the game thread) and a single consumer
+(the writer): each side only advances its own index, so no lock is taken.
+"""
+
+import json
+import threading
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+Record = tuple[float, str, dict[str, Any]]
+
+
+class RingBufferSink:
+    """Write ``(time, message, extra)`` records as JSON lines off-thread.
+
+    Each line is ``{"time": <unix seconds>, "message": ..., "extra": {...}}``.
+    Files past ``rotation`` bytes are renamed with a timestamp, zipped and
+    pruned to the newest ``retention`` archives.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        capacity: int = 8192,
+        flush_interval: float = 0.25,
+        rotation: int = 30 * 1024 * 1024,
+        retention: int = 3,
+    ):
+        self.path = Path(path)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.rotation = rotation
+        self.retention = retention
+        self.written = 0
+        self.dropped = 0
+
+        self._slots: list[Record | None] = [None] * capacity
+        self._head = 0  # Avançado só pelo jogo
+        self._tail = 0  # Avançado só pela thread de escrita
+        self._file = None
+        self._closing = False
+        self._wake = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f'log-{self.path.stem}', daemon=True
+        )
+        self._thread.start()
+
+    def push(self, message: str, extra: dict[str, Any]) -> None:
+        """Queue a record; never blocks."""
+        head = self._head
+        pending = head - self._tail
+        if pending >= self.capacity:
+            self.dropped += 1
+            return
+        self._slots[head % self.capacity] = (time.time(), message, extra)
+        self._head = head + 1
+        if pending == self.capacity // 2:
+            self._wake.set()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'written': self.written,
+            'dropped': self.dropped,
+            'pending': self._head - self._tail,
+        }
+
+    def close(self) -> None:
+        """Write what is pending and stop the writer. Safe to call twice."""
+        if self._closing:
+            return
+        self._closing = True
+        self._wake.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._closing:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+        self._drain()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _drain(self) -> None:
+        tail, head = self._tail, self._head
+        if tail == head:
+            return
+        slots = self._slots
+        records = []
+        for index in range(tail, head):
+            slot = index % self.capacity
+            records.append(slots[slot])
+            slots[slot] = None
+        # Libera os slots antes de serializar
+        self._tail = head
+
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._open()
+        self._write_batch(records)
+        self._file.flush()
+        self.written += len(records)
+        if self._file.tell() >= self.rotation:
+            self._rotate()
+
+    def _open(self) -> None:
+        self._file = self.path.open('a', encoding='utf-8')
+
+    def _write_batch(self, records: list[Record]) -> None:
+        dumps = json.dumps
+        self._file.write(
+            ''.join(
+                [
+                    dumps(
+                        {
+                            'time': timestamp,
+                            'message': message,
+                            'extra': extra,
+                        },
+                        default=str,
+                    )
+                    + '\n'
+                    for timestamp, message, extra in records
+                ]
+            )
+        )
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        stamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S_%f')
+        rotated = self.path.with_name(
+            f'{self.path.stem}.{stamp}{self.path.suffix}'
+        )
+        self.path.rename(rotated)
+        archive = rotated.with_name(rotated.name + '.zip')
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zipped:
+            zipped.write(rotated, rotated.name)
+        rotated.unlink()
+
+        archives = sorted(
+            self.path.parent.glob(f'{self.path.stem}.*{self.path.suffix}.zip')
+        )
+        for old in archives[: -self.retention]:
+            old.unlink()
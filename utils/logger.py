@@ -1,15 +1,42 @@
 """
 Logging utilities using loguru with rotation.
+
+Game state and events bypass loguru: they go to ``RingBufferSink``s whose
+writer threads serialize and rotate the telemetry files (JSONL, columnar
+``.tlm`` or both), so the game thread never waits on disk.
 """
 
+import atexit
+
 from loguru import logger
-import json
-from datetime import datetime
 from typing import Any
 
+from utils.log_sink import RingBufferSink
+from utils.telemetry import ColumnarSink
+
+TELEMETRY_FORMATS = ('jsonl', 'columnar', 'both')
+
+_state_sinks: tuple[RingBufferSink, ...] = ()
+_event_sinks: tuple[RingBufferSink, ...] = ()
+
+
+def _telemetry_sinks(name: str, telemetry: str) -> tuple[RingBufferSink, ...]:
+    sinks = ()
+    if telemetry in ('jsonl', 'both'):
+        sinks += (RingBufferSink(f'logs/{name}.jsonl'),)
+    if telemetry in ('columnar', 'both'):
+        sinks += (ColumnarSink(f'logs/{name}.tlm'),)
+    return sinks
 
-def setup_logging() -> None:
-    """Configure loguru with file rotation and retention."""
+
+def setup_logging(telemetry: str = 'jsonl') -> None:
+    """Configure loguru with file rotation and retention.
+
+    ``telemetry`` picks the state and event file format: 'jsonl',
+    'columnar' or 'both'.
+    """
+    if telemetry not in TELEMETRY_FORMATS:
+        raise ValueError(f'Unknown telemetry format: {telemetry}')
     logger.remove()
 
     logger.add(
@@ -22,37 +49,51 @@ def setup_logging() -> None:
         enqueue=True,
     )
 
-    logger.add(
-        'logs/game_state.jsonl',
-        rotation='30 MB',
-        retention=3,
-        compression='zip',
-        level='DEBUG',
-        serialize=True,
-        filter=lambda record: record['extra'].get('name') == 'state',
-    )
+    global _state_sinks, _event_sinks
+    close_sinks()
+    _state_sinks = _telemetry_sinks('game_state', telemetry)
+    _event_sinks = _telemetry_sinks('game_events', telemetry)
 
-    logger.add(
-        'logs/game_events.jsonl',
-        rotation='30 MB',
-        retention=3,
-        compression='zip',
-        level='DEBUG',
-        serialize=True,
-        filter=lambda record: record['extra'].get('name') == 'event',
-    )
+
+def close_sinks() -> None:
+    """Flush and stop the state and event writers."""
+    global _state_sinks, _event_sinks
+    for sink in _state_sinks + _event_sinks:
+        sink.close()
+        if sink.dropped:
+            logger.warning(
+                f'{sink.dropped} records dropped from {sink.path} '
+                '(buffer full)'
+            )
+    _state_sinks = _event_sinks = ()
+
+
+atexit.register(close_sinks)
+
+
+def disable_logging() -> None:
+    """Drop every sink, e.g. in batch workers."""
+    close_sinks()
+    logger.remove()
+
+
+def logging_stats() -> dict[str, dict[str, int]]:
+    """Written, dropped and pending records per buffered sink file."""
+    return {
+        str(sink.path): sink.stats() for sink in _state_sinks + _event_sinks
+    }
 
 
 def log_state(**kwargs: Any) -> None:
     """Log game state information."""
-    state_logger = logger.bind(name='state')
-    state_logger.debug('game_state', **kwargs)
+    for sink in _state_sinks:
+        sink.push('game_state', kwargs)
 
 
 def log_event(event_type: str, **details: Any) -> None:
     """Log game events."""
-    event_logger = logger.bind(name='event')
-    event_logger.info(event_type, **details)
+    for sink in _event_sinks:
+        sink.push(event_type, details)
 
 
 def log_info(message: str, **kwargs: Any) -> None:
@@ -0,0 +1,190 @@
+"""
+Live game metrics over HTTP, in the Prometheus text format.
+
+    curl http://127.0.0.1:9464/metrics
+
+The game thread calls ``observe_frame`` and ``publish`` once per frame;
+``publish`` builds an immutable snapshot and swaps it in by reference.
+Scrapes are answered by a server thread that only reads the latest
+snapshot, so they never take a lock the game loop waits on.
+"""
+
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.events import events
+from entities.shapes import OutlineCache, get_outline_cache
+from systems.asteroid_pool import AsteroidPool
+from systems.destruction import DestructionQueue
+from systems.shot_ring import ShotRing
+from utils.particles import particle_pool_stats
+
+PREFIX = 'asteroids'
+FRAME_BUCKETS = (0.001, 0.002, 0.004, 0.008, 0.016, 0.033, 0.05, 0.1, 0.25)
+ENTITY_KINDS = ('asteroids', 'shots', 'particles', 'powerups')
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Estatísticas cumulativas, exportadas como counter com sufixo _total
+COUNTER_STATS = frozenset(
+    f'{prefix}_{key}'
+    for prefix, source in (
+        ('shot_ring', ShotRing),
+        ('asteroid_pool', AsteroidPool),
+        ('destruction', DestructionQueue),
+        ('outline_cache', OutlineCache),
+    )
+    for key in source.counters
+)
+
+
+class _Snapshot:
+    __slots__ = (
+        'buckets',
+        'counters',
+        'frame_sum',
+        'frames',
+        'gauges',
+        'handler_seconds',
+    )
+
+    def __init__(
+        self, gauges, counters, handler_seconds, buckets, frame_sum, frames
+    ):
+        self.gauges = gauges
+        self.counters = counters
+        self.handler_seconds = handler_seconds
+        self.buckets = buckets
+        self.frame_sum = frame_sum
+        self.frames = frames
+
+
+class MetricsExporter:
+    """Serve the latest published snapshot on ``/metrics``.
+
+    ``port=0`` lets the OS pick one; the bound port is in ``port``. The
+    score rate is measured over the last ``rate_window`` simulated seconds.
+    """
+
+    def __init__(
+        self,
+        port: int = 9464,
+        host: str = '127.0.0.1',
+        rate_window: float = 10.0,
+    ):
+        self.rate_window = rate_window
+        self._buckets = [0] * len(FRAME_BUCKETS)
+        self._frame_sum = 0.0
+        self._frames = 0
+        self._scores: deque[tuple[float, float]] = deque()
+        self._snapshot = _Snapshot({}, {}, {}, tuple(self._buckets), 0.0, 0)
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass  # Sem log por scrape
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='metrics', daemon=True
+        )
+        self._thread.start()
+
+    def observe_frame(self, seconds: float) -> None:
+        """Add one frame time to the histogram."""
+        self._frame_sum += seconds
+        self._frames += 1
+        buckets = self._buckets
+        for index, bound in enumerate(FRAME_BUCKETS):
+            if seconds <= bound:
+                buckets[index] += 1
+                break
+
+    def publish(self, stats: dict[str, float], simulated: float) -> None:
+        """Swap in a snapshot of ``stats`` (see ``world_stats``).
+
+        ``simulated`` is the simulation clock in seconds, used for the
+        score rate.
+        """
+        scores = self._scores
+        scores.append((simulated, stats.get('score', 0)))
+        while scores[0][0] < simulated - self.rate_window:
+            scores.popleft()
+        elapsed = simulated - scores[0][0]
+        rate = (scores[-1][1] - scores[0][1]) / elapsed if elapsed else 0.0
+
+        gauges = dict(stats)
+        gauges['score_rate'] = rate
+        for key, value in particle_pool_stats().items():
+            gauges[f'particle_pool_{key}'] = value
+        for key, value in get_outline_cache().stats().items():
+            gauges[f'outline_cache_{key}'] = value
+        self._snapshot = _Snapshot(
+            gauges,
+            events.emitted,
+            events.handler_seconds,
+            tuple(self._buckets),
+            self._frame_sum,
+            self._frames,
+        )
+
+    def render(self) -> str:
+        """The latest snapshot in the Prometheus text format."""
+        snapshot = self._snapshot
+        lines = [f'# TYPE {PREFIX}_frame_seconds histogram']
+        cumulative = 0
+        for bound, count in zip(FRAME_BUCKETS, snapshot.buckets):
+            cumulative += count
+            lines.append(
+                f'{PREFIX}_frame_seconds_bucket{{le="{bound}"}} {cumulative}'
+            )
+        lines.append(
+            f'{PREFIX}_frame_seconds_bucket{{le="+Inf"}} {snapshot.frames}'
+        )
+        lines.append(f'{PREFIX}_frame_seconds_sum {snapshot.frame_sum}')
+        lines.append(f'{PREFIX}_frame_seconds_count {snapshot.frames}')
+
+        gauges = dict(snapshot.gauges)
+        lines.append(f'# TYPE {PREFIX}_entities gauge')
+        for kind in ENTITY_KINDS:
+            if kind in gauges:
+                value = gauges.pop(kind)
+                lines.append(f'{PREFIX}_entities{{kind="{kind}"}} {value}')
+        for name, value in gauges.items():
+            if name in COUNTER_STATS:
+                lines.append(f'# TYPE {PREFIX}_{name}_total counter')
+                lines.append(f'{PREFIX}_{name}_total {value}')
+            else:
+                lines.append(f'# TYPE {PREFIX}_{name} gauge')
+                lines.append(f'{PREFIX}_{name} {float(value)}')
+
+        lines.append(f'# TYPE {PREFIX}_events_emitted_total counter')
+        for event_type, count in snapshot.counters.items():
+            lines.append(
+                f'{PREFIX}_events_emitted_total{{type="{event_type}"}} {count}'
+            )
+        lines.append(f'# TYPE {PREFIX}_event_handler_seconds_total counter')
+        for event_type, seconds in snapshot.handler_seconds.items():
+            lines.append(
+                f'{PREFIX}_event_handler_seconds_total{{type="{event_type}"}} '
+                f'{seconds}'
+            )
+        return '\n'.join(lines) + '\n'
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,8 +1,9 @@
 import pygame
-import random
 import math
 from typing import List, Optional
 
+from core import rng
+
 
 class ExplosionParticle(pygame.sprite.Sprite):
     __slots__ = [
@@ -33,7 +34,7 @@ class ExplosionParticle(pygame.sprite.Sprite):
         if color is not None:
             self._base_color = color
 
-        self.size = random.randint(2, 6)
+        self.size = rng.particles.randint(2, 6)
         self.image = pygame.Surface(
             (self.size * 2, self.size * 2), pygame.SRCALPHA
         )
@@ -42,14 +43,14 @@ class ExplosionParticle(pygame.sprite.Sprite):
         )
         self.rect = self.image.get_rect(center=(int(x), int(y)))
 
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(50, 150)
+        angle = rng.particles.uniform(0, 2 * math.pi)
+        speed = rng.particles.uniform(50, 150)
         self.velocity = pygame.Vector2(
             math.cos(angle) * speed, math.sin(angle) * speed
         )
         self.position = pygame.Vector2(x, y)
 
-        self.lifetime = random.uniform(0.5, 1.0)
+        self.lifetime = rng.particles.uniform(0.5, 1.0)
         self.age = 0
 
     def update(self, dt: float):
@@ -93,6 +94,11 @@ class ParticlePool:
         particle.reset(x, y, color)
         return particle
 
+    @property
+    def available(self) -> int:
+        """Partículas livres no pool."""
+        return len(self._available)
+
     def release(self, particle: ExplosionParticle) -> None:
         """Retorna uma partícula ao pool."""
         if particle in self._pool and particle not in self._available:
@@ -116,6 +122,24 @@ def get_particle_pool() -> ParticlePool:
     return _particle_pool
 
 
+def reset_particle_pool() -> None:
+    """Descarta o pool global; o próximo uso cria um novo."""
+    global _particle_pool
+    _particle_pool = None
+
+
+def particle_pool_stats() -> dict[str, int]:
+    """Tamanho, livres e vivas do pool global (zeros se não existe)."""
+    if _particle_pool is None:
+        return {'size': 0, 'available': 0, 'alive': 0}
+    pooled = _particle_pool._pool
+    return {
+        'size': len(pooled),
+        'available': _particle_pool.available,
+        'alive': sum(1 for particle in pooled if particle.alive()),
+    }
+
+
 def spawn_explosion(
     x: float,
     y: float,
@@ -0,0 +1,186 @@
+"""
+Per-phase frame profiler with rolling percentiles, overlay and trace export.
+
+Phases are timed with ``with profiler.phase(name):`` and accumulate over a
+frame (several simulation ticks may run in one frame); ``end_frame`` closes
+the frame. The frame time is the sum of the top-level phases, so waiting for
+the frame cap is not counted; ``particles`` is nested inside ``update``.
+When profiling is off the game uses ``NULL_PROFILER``, whose methods do
+nothing.
+"""
+
+import csv
+import json
+import time
+from array import array
+from contextlib import nullcontext
+from pathlib import Path
+
+import pygame
+
+PHASES = (
+    'events',
+    'update',
+    'particles',
+    'collisions',
+    'destruction',
+    'render',
+    'flip',
+)
+NESTED_PHASES = ('particles',)
+PERCENTILES = (50, 95, 99)
+
+
+class _Phase:
+    """Reusable context manager that adds its elapsed time to a phase."""
+
+    __slots__ = ('_name', '_profiler', '_start')
+
+    def __init__(self, profiler: 'FrameProfiler', name: str):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self._profiler.current[self._name] += time.perf_counter() - self._start
+
+
+class FrameProfiler:
+    """Time each phase of every frame and keep the last ``window`` frames.
+
+    With ``trace_path`` every frame is also written to a ``.csv`` or
+    ``.jsonl`` trace (chosen by the suffix), flushed every
+    ``flush_every`` frames.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        window: int = 600,
+        trace_path: str | Path | None = None,
+        flush_every: int = 60,
+    ):
+        self.window = window
+        self.frames = 0
+        self.current = dict.fromkeys(PHASES, 0.0)
+        # Amostras em anel por fase (ms), mais o tempo total do frame
+        self._samples = {
+            name: array('d', bytes(8 * window)) for name in (*PHASES, 'frame')
+        }
+        self._phases = {name: _Phase(self, name) for name in PHASES}
+
+        self._trace = None
+        self._writer = None
+        self._pending: list[list[float]] = []
+        self.flush_every = flush_every
+        if trace_path is not None:
+            self._open_trace(Path(trace_path))
+
+        self._overlay: list[pygame.Surface] = []
+        self._font: pygame.font.Font | None = None
+
+    def _open_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._trace = path.open('w', newline='')
+        if path.suffix == '.csv':
+            self._writer = csv.writer(self._trace)
+            self._writer.writerow(('frame', 'frame_ms', *PHASES))
+
+    def phase(self, name: str) -> _Phase:
+        return self._phases[name]
+
+    def end_frame(self) -> None:
+        """Store the finished frame's timings and reset the phases."""
+        slot = self.frames % self.window
+        row = [self.frames, 0.0]
+        total = 0.0
+        for name, seconds in self.current.items():
+            milliseconds = seconds * 1000
+            self._samples[name][slot] = milliseconds
+            row.append(milliseconds)
+            if name not in NESTED_PHASES:
+                total += milliseconds
+            self.current[name] = 0.0
+        self._samples['frame'][slot] = row[1] = total
+        self.frames += 1
+
+        if self._trace is not None:
+            self._pending.append(row)
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+
+    def percentiles(self, name: str) -> dict[int, float]:
+        """p50/p95/p99 of a phase (or 'frame') over the window, in ms."""
+        count = min(self.frames, self.window)
+        if count == 0:
+            return dict.fromkeys(PERCENTILES, 0.0)
+        values = sorted(self._samples[name][:count])
+        return {
+            p: values[min(count - 1, count * p // 100)] for p in PERCENTILES
+        }
+
+    def summary(self) -> dict[str, dict[int, float]]:
+        return {name: self.percentiles(name) for name in ('frame', *PHASES)}
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Overlay the percentiles; the text is refreshed twice a second."""
+        if self._font is None:
+            self._font = pygame.font.SysFont('monospace', 14)
+        if not self._overlay or self.frames % 30 == 0:
+            lines = [f'{"ms":<10} {"p50":>6} {"p95":>6} {"p99":>6}']
+            lines += [
+                f'{name:<10} {row[50]:6.2f} {row[95]:6.2f} {row[99]:6.2f}'
+                for name, row in self.summary().items()
+            ]
+            self._overlay = [
+                self._font.render(line, True, 'yellow') for line in lines
+            ]
+        x = screen.get_width() - 300
+        for index, text in enumerate(self._overlay):
+            screen.blit(text, (x, 10 + index * 16))
+
+    def flush(self) -> None:
+        if self._trace is None:
+            return
+        if self._writer is not None:
+            self._writer.writerows(self._pending)
+        else:
+            keys = ('frame', 'frame_ms', *PHASES)
+            self._trace.writelines(
+                json.dumps(dict(zip(keys, row))) + '\n'
+                for row in self._pending
+            )
+        self._pending.clear()
+        self._trace.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+
+class NullProfiler:
+    """Profiler stand-in used when profiling is off."""
+
+    enabled = False
+    _context = nullcontext()
+
+    def phase(self, name: str) -> nullcontext:
+        return self._context
+
+    def end_frame(self) -> None:
+        pass
+
+    def draw(self, screen: pygame.Surface) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,217 @@
+"""
+Seekable input replays.
+
+A replay is everything needed to re-simulate a session: the RNG seed, the
+fixed time step and the player's input bitmask for every tick, split in
+chunks that start with a full world snapshot (a keyframe). Layout:
+
+    header   'ASRP', version (u16), reserved (u16), seed (i64), dt (f64),
+             keyframe interval (u32)
+    chunk    'KEYF', frame (u64), snapshot size (u32), snapshot,
+             one input byte per tick (``core.controls`` bitmask) for up to
+             ``interval`` ticks
+    ...
+    index    one chunk offset (u64) per chunk
+    trailer  'REND', frames (u64), final score (i64), index offset (u64),
+             chunk count (u32)
+
+All integers are little-endian. Files are read through ``mmap``: seeking
+reads the index from the trailer and then only the pages of the chunk it
+lands in. Index and trailer are written on close; a file cut short by a
+crash is recovered by walking the chunk headers.
+"""
+
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+from core import constants as const
+from core.controls import ALL_CONTROLS, Controller
+from core.snapshot import snapshot_world
+
+if TYPE_CHECKING:
+    from core.world import World
+
+MAGIC = b'ASRP'
+CHUNK_MAGIC = b'KEYF'
+TRAILER_MAGIC = b'REND'
+VERSION = 9
+
+HEADER = struct.Struct('<4sHHqdI')
+CHUNK = struct.Struct('<4sQI')
+INDEX_ENTRY = struct.Struct('<Q')
+TRAILER = struct.Struct('<4sQqQI')
+
+# Bytes pré-alocados: gravar um tick não cria objetos
+_MASK_BYTES = [bytes([mask]) for mask in range(ALL_CONTROLS + 1)]
+
+
+class ReplayRecorder:
+    """Append one input byte per tick and a keyframe every interval."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        seed: int,
+        dt: float,
+        keyframe_interval: int = const.REPLAY_KEYFRAME_INTERVAL,
+    ):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.frames = 0
+        self._chunks: list[int] = []
+        self._file = path.open('wb')
+        self._file.write(
+            HEADER.pack(MAGIC, VERSION, 0, seed, dt, keyframe_interval)
+        )
+
+    def record(self, actions: int, world: 'World') -> None:
+        """Record the input of the next tick of ``world``."""
+        if self.frames % self.keyframe_interval == 0:
+            snapshot = snapshot_world(world)
+            self._chunks.append(self._file.tell())
+            self._file.write(
+                CHUNK.pack(CHUNK_MAGIC, self.frames, len(snapshot))
+            )
+            self._file.write(snapshot)
+        self._file.write(_MASK_BYTES[actions])
+        self.frames += 1
+
+    def close(self, score: int) -> None:
+        """Write the index and trailer and close. Safe to call twice."""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        for offset in self._chunks:
+            self._file.write(INDEX_ENTRY.pack(offset))
+        self._file.write(
+            TRAILER.pack(
+                TRAILER_MAGIC,
+                self.frames,
+                score,
+                index_offset,
+                len(self._chunks),
+            )
+        )
+        self._file.close()
+
+
+class Replay:
+    """A replay file mapped in memory; use as a context manager."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self._map
+
+        if len(data) < HEADER.size:
+            raise ValueError(f'Replay too short: {path}')
+        magic, version, _, seed, dt, interval = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f'Not a replay file: {path}')
+        if version != VERSION:
+            raise ValueError(f'Unsupported replay version {version}: {path}')
+        self.seed = seed
+        self.dt = dt
+        self.keyframe_interval = interval
+        self.final_score: int | None = None
+
+        trailer = self._read_trailer()
+        if trailer is not None:
+            self.frames, self.final_score, index_offset, count = trailer
+            self._chunks = [
+                INDEX_ENTRY.unpack_from(
+                    data, index_offset + i * INDEX_ENTRY.size
+                )[0]
+                for i in range(count)
+            ]
+        else:
+            self._chunks, self.frames = self._scan_chunks()
+        # Início das entradas de cada chunk, lido sob demanda
+        self._inputs: list[int | None] = [None] * len(self._chunks)
+
+    def _read_trailer(self):
+        data = self._map
+        start = len(data) - TRAILER.size
+        if start < HEADER.size:
+            return None
+        magic, frames, score, index_offset, count = TRAILER.unpack_from(
+            data, start
+        )
+        if (
+            magic != TRAILER_MAGIC
+            or index_offset + count * INDEX_ENTRY.size != start
+        ):
+            return None
+        return frames, score, index_offset, count
+
+    def _scan_chunks(self) -> tuple[list[int], int]:
+        """Recover the chunk offsets of an unterminated recording."""
+        data = self._map
+        chunks = []
+        frames = 0
+        offset = HEADER.size
+        while offset + CHUNK.size <= len(data):
+            magic, frame, size = CHUNK.unpack_from(data, offset)
+            inputs = offset + CHUNK.size + size
+            if magic != CHUNK_MAGIC or inputs > len(data):
+                break
+            chunks.append(offset)
+            ticks = min(self.keyframe_interval, len(data) - inputs)
+            frames = frame + ticks
+            offset = inputs + ticks
+        return chunks, frames
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _input_start(self, chunk: int) -> int:
+        start = self._inputs[chunk]
+        if start is None:
+            offset = self._chunks[chunk]
+            _, _, size = CHUNK.unpack_from(self._map, offset)
+            start = self._inputs[chunk] = offset + CHUNK.size + size
+        return start
+
+    def input_at(self, frame: int) -> int:
+        """Input bitmask of a tick, 0 past the end of the recording."""
+        if frame >= self.frames:
+            return 0
+        chunk, within = divmod(frame, self.keyframe_interval)
+        return self._map[self._input_start(chunk) + within]
+
+    def keyframe_before(self, frame: int) -> bytes | None:
+        """The latest snapshot at or before ``frame``."""
+        if not self._chunks:
+            return None
+        chunk = min(frame // self.keyframe_interval, len(self._chunks) - 1)
+        offset = self._chunks[chunk]
+        _, _, size = CHUNK.unpack_from(self._map, offset)
+        start = offset + CHUNK.size
+        return self._map[start : start + size]
+
+    def controller(self, frame: int = 0) -> 'ReplayController':
+        return ReplayController(self, frame)
+
+
+class ReplayController(Controller):
+    """Feed recorded inputs back to the player, one per tick."""
+
+    def __init__(self, replay: Replay, frame: int = 0):
+        self.replay = replay
+        self.frame = frame
+
+    def poll(self) -> int:
+        actions = self.replay.input_at(self.frame)
+        self.frame += 1
+        return actions
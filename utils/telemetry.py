@@ -0,0 +1,227 @@
+"""
+Columnar binary telemetry.
+
+The log writer buffers records until ``chunk_rows`` of them are pending
+(or the sink closes) and writes them as one chunk, so the schema is not
+repeated for every small batch; inside a chunk every field is stored as
+one typed array. Layout (little-endian):
+
+    header   'ASTM', version (u16)
+    chunk    'CHNK', payload size (u32), rows (u32), columns (u16)
+    schema   per column: name length (u8), name, type (u8), data size (u32)
+    data     per column, in schema order:
+               'q'  rows x i64
+               'd'  rows x f64 (NaN where a record lacks the field)
+               's'  rows x u32 indices into the chunk's string table
+                    (0xFFFFFFFF when missing), string count (u32), then
+                    per string: length (u16) and UTF-8 bytes
+
+Every chunk carries ``time`` (d) and ``message`` (s) followed by the
+record's extra fields, typed per chunk: integers when every row has an
+integer, floats when every present value is a number, strings otherwise.
+The data size in the schema lets readers skip columns they do not need.
+"""
+
+import math
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO
+
+from utils.log_sink import Record, RingBufferSink
+
+MAGIC = b'ASTM'
+CHUNK_MAGIC = b'CHNK'
+VERSION = 1
+
+HEADER = struct.Struct('<4sH')
+CHUNK = struct.Struct('<4sIIH')
+COLUMN = struct.Struct('<BI')
+STRING_LENGTH = struct.Struct('<H')
+COUNT = struct.Struct('<I')
+
+MISSING = 0xFFFFFFFF
+CHUNK_ROWS = 512  # Linhas acumuladas antes de gravar um chunk
+
+_SWAP = sys.byteorder == 'big'
+_U32 = 'I' if array('I').itemsize == 4 else 'L'
+
+Columns = dict[str, Any]
+
+
+def _pack(values: array) -> bytes:
+    if _SWAP:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if _SWAP:
+        values.byteswap()
+    return values
+
+
+def _encode_strings(values: list) -> bytes:
+    table: dict[str, int] = {}
+    indices = array(_U32)
+    for value in values:
+        if value is None:
+            indices.append(MISSING)
+        else:
+            indices.append(table.setdefault(str(value), len(table)))
+    parts = [_pack(indices), COUNT.pack(len(table))]
+    for text in table:
+        encoded = text.encode()
+        if len(encoded) > 0xFFFF:
+            # Corta sem deixar um caractere UTF-8 pela metade
+            encoded = encoded[:0xFFFF].decode('utf-8', 'ignore').encode()
+        parts.append(STRING_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    return b''.join(parts)
+
+
+def _encode_column(values: list) -> tuple[bytes, bytes]:
+    """Pick the narrowest type for a column and encode it."""
+    if all(type(v) in (int, bool) for v in values):
+        try:
+            return b'q', _pack(array('q', values))
+        except OverflowError:
+            pass
+    if all(v is None or type(v) in (int, float, bool) for v in values):
+        nan = math.nan
+        return b'd', _pack(
+            array('d', [nan if v is None else v for v in values])
+        )
+    return b's', _encode_strings(values)
+
+
+def encode_chunk(records: list[Record]) -> bytes:
+    """One chunk holding ``(time, message, extra)`` records."""
+    names: dict[str, None] = {}
+    for _, _, extra in records:
+        names.update(dict.fromkeys(extra))
+    names.pop('time', None)
+    names.pop('message', None)
+
+    columns = {
+        'time': [record[0] for record in records],
+        'message': [record[1] for record in records],
+    }
+    for name in names:
+        columns[name] = [extra.get(name) for _, _, extra in records]
+
+    schema = []
+    data = []
+    for name, values in columns.items():
+        kind, encoded = _encode_column(values)
+        label = name.encode()[:255]
+        schema.append(bytes([len(label)]) + label)
+        schema.append(kind + COUNT.pack(len(encoded)))
+        data.append(encoded)
+    payload = b''.join(schema + data)
+    return (
+        CHUNK.pack(CHUNK_MAGIC, len(payload), len(records), len(columns))
+        + payload
+    )
+
+
+def _decode_column(kind: str, data: bytes, rows: int):
+    if kind in 'qd':
+        return _unpack(kind, data)
+    indices = _unpack(_U32, data[: 4 * rows])
+    offset = 4 * rows
+    (count,) = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+    table = []
+    for _ in range(count):
+        (length,) = STRING_LENGTH.unpack_from(data, offset)
+        offset += STRING_LENGTH.size
+        table.append(bytes(data[offset : offset + length]).decode())
+        offset += length
+    return [None if i == MISSING else table[i] for i in indices]
+
+
+def read_chunks(
+    stream: BinaryIO, columns: Iterable[str] | None = None
+) -> Iterator[tuple[int, Columns]]:
+    """Yield ``(rows, {name: values})`` per chunk, one chunk in memory.
+
+    With ``columns`` only those fields are decoded. A chunk cut short by
+    a crash ends the stream.
+    """
+    wanted = None if columns is None else set(columns)
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return
+    magic, version = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError('Not a telemetry file')
+    if version != VERSION:
+        raise ValueError(f'Unsupported telemetry version {version}')
+
+    while True:
+        head = stream.read(CHUNK.size)
+        if len(head) < CHUNK.size:
+            return
+        magic, size, rows, count = CHUNK.unpack(head)
+        payload = memoryview(stream.read(size))
+        if magic != CHUNK_MAGIC or len(payload) < size:
+            return
+
+        offset = 0
+        schema = []
+        for _ in range(count):
+            length = payload[offset]
+            name = bytes(payload[offset + 1 : offset + 1 + length]).decode()
+            offset += 1 + length
+            kind, data_size = COLUMN.unpack_from(payload, offset)
+            offset += COLUMN.size
+            schema.append((name, chr(kind), data_size))
+
+        decoded = {}
+        for name, kind, data_size in schema:
+            if wanted is None or name in wanted:
+                decoded[name] = _decode_column(
+                    kind, payload[offset : offset + data_size], rows
+                )
+            offset += data_size
+        yield rows, decoded
+
+
+class ColumnarSink(RingBufferSink):
+    """``RingBufferSink`` writing columnar chunks instead of JSON lines.
+
+    Drained records wait in memory until there are ``chunk_rows`` of them;
+    up to that many rows are lost if the game dies without closing.
+    """
+
+    def __init__(self, path, chunk_rows: int = CHUNK_ROWS, **kwargs):
+        self.chunk_rows = chunk_rows
+        self._rows: list[Record] = []
+        super().__init__(path, **kwargs)
+
+    def _open(self) -> None:
+        self._file = self.path.open('ab')
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION))
+
+    def _drain(self) -> None:
+        super()._drain()
+        if self._closing and self._rows:
+            self._write_chunk()
+
+    def _write_batch(self, records: list[Record]) -> None:
+        self._rows.extend(records)
+        if len(self._rows) >= self.chunk_rows:
+            self._write_chunk()
+
+    def _write_chunk(self) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._open()
+        self._file.write(encode_chunk(self._rows))
+        self._file.flush()
+        self._rows = []